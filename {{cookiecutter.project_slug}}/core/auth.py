@@ -1,8 +1,13 @@
 import asyncio
+import hashlib
+import json
+import random
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
@@ -16,6 +21,10 @@ if auth_type == "Basic Auth":
 # Fix import path for direct execution
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.config import config
+from core.credentials import create_credential_pool
+
+if auth_type == "OAuth2":
+    from core.token_store import create_token_store
 
 
 class McpServerAuth:
@@ -31,28 +40,120 @@ class McpServerAuth:
         if auth_type == "Bearer Token" or auth_type == "OAuth2":
             self.access_token: Optional[str] = None
             self.token_expires_at: Optional[datetime] = None
+            self.token_refresh_at: Optional[datetime] = None
+            self.token_lifetime = timedelta(hours=1)
+            self.refresh_failures = 0
 
         # OAuth2-specific variables
         if auth_type == "OAuth2":
             self.refresh_token: Optional[str] = None
-
+            self.token_store = create_token_store()
+            # Identifies tokens issued to this client and scope in the store
+            self._token_owner = hashlib.sha256(
+                f"{config.api.client_id}:{config.api.oauth_scope}".encode()
+            ).hexdigest()[:16]
+
+        # Immutable headers built once and shared by every request, plus a
+        # fingerprint of the credentials they carry
+        self._headers: Optional[Mapping[str, str]] = None
+        self._identity: Optional[str] = None
+
+        # Only taken when headers have to be (re)built
         self._lock = asyncio.Lock()
 
-    async def get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers for API requests"""
+        # Background token refresher (Bearer Token and OAuth2)
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Several API keys or bearer tokens used in rotation
+        secrets = []
+        if auth_type == "API Key":
+            secrets = config.api.api_keys.split(",")
+        elif auth_type == "Bearer Token":
+            secrets = config.api.bearer_tokens.split(",")
+        self.pool = create_credential_pool(
+            [secret.strip() for secret in secrets if secret.strip()],
+            self._credential_headers,
+        )
+
+    def _headers_valid(self) -> bool:
+        """Check if the cached headers can still be used"""
+        if self._headers is None:
+            return False
+
+        auth_type = "{{cookiecutter.auth_type}}"
+        if auth_type == "Bearer Token" or auth_type == "OAuth2":
+            return self._is_token_valid()
+        return True
+
+    async def get_auth_headers(self) -> Mapping[str, str]:
+        """
+        Get authentication headers for API requests
+
+        Served without locking while valid. The lock is only taken when
+        headers must be built or a token refreshed, and validity is checked
+        again once it is held so only one caller does the work.
+        """
+        if self.pool is not None:
+            return self.pool.peek().headers
+
+        headers = self._headers
+        if headers is not None and self._headers_valid():
+            # Restart the refresher if the loop it ran on has gone away
+            if self._refresh_task is not None and self._refresh_task.done():
+                self._schedule_refresh()
+            return headers
+
         async with self._lock:
-            auth_type = "{{cookiecutter.auth_type}}"
-
-            if auth_type == "API Key":
-                return await self._get_api_key_headers()
-            elif auth_type == "Bearer Token":
-                return await self._get_bearer_token_headers()
-            elif auth_type == "OAuth2":
-                return await self._get_oauth2_headers()
-            elif auth_type == "Basic Auth":
-                return await self._get_basic_auth_headers()
-            else:
-                return {"Authorization": "Custom Auth"}
+            if not self._headers_valid():
+                self._store_headers(await self._build_auth_headers())
+            return self._headers
+
+    def _store_headers(self, headers: Dict[str, str]) -> None:
+        """Publish new headers and the fingerprint of their credentials"""
+        self._identity = hashlib.sha256(
+            json.dumps(sorted(headers.items())).encode()
+        ).hexdigest()[:16]
+        self._headers = MappingProxyType(dict(headers))
+
+        auth_type = "{{cookiecutter.auth_type}}"
+        if auth_type == "Bearer Token" or auth_type == "OAuth2":
+            self._schedule_refresh()
+
+    async def _build_auth_headers(self) -> Dict[str, str]:
+        """Build authentication headers for the configured auth type"""
+        auth_type = "{{cookiecutter.auth_type}}"
+
+        if auth_type == "API Key":
+            return await self._get_api_key_headers()
+        elif auth_type == "Bearer Token":
+            return await self._get_bearer_token_headers()
+        elif auth_type == "OAuth2":
+            return await self._get_oauth2_headers()
+        elif auth_type == "Basic Auth":
+            return await self._get_basic_auth_headers()
+        else:
+            return {"Authorization": "Custom Auth"}
+
+    async def get_identity(self) -> str:
+        """Get a fingerprint of the credentials in use, safe to use in keys"""
+        if self.pool is not None:
+            return self.pool.identity
+        await self.get_auth_headers()
+        return self._identity
+
+    def _credential_headers(self, secret: str) -> Dict[str, str]:
+        """Build headers for one pooled API key or bearer token"""
+        auth_type = "{{cookiecutter.auth_type}}"
+        if auth_type == "API Key":
+            credential = {config.api.api_key_header: secret}
+        else:
+            credential = {"Authorization": f"Bearer {secret}"}
+
+        return {
+            **credential,
+            "Content-Type": "application/json",
+            "User-Agent": f"{{cookiecutter.project_name}}/{{cookiecutter.project_version}}",
+        }
 
     # Implementation of authentication methods
     # Each method is conditionally defined based on auth type
@@ -96,14 +197,96 @@ class McpServerAuth:
         if not self.access_token or not self.token_expires_at:
             return False
 
-        buffer_time = timedelta(minutes=5)
+        buffer_time = min(timedelta(minutes=5), self.token_lifetime / 10)
         return datetime.now() < (self.token_expires_at - buffer_time)
 
+    def _set_token(self, access_token: str, expires_in: float) -> None:
+        """Store a new token and pick when to refresh it in background"""
+        now = datetime.now()
+        fraction = config.api.token_refresh_fraction - random.uniform(
+            0, config.api.token_refresh_jitter
+        )
+
+        self.access_token = access_token
+        self.token_lifetime = timedelta(seconds=expires_in)
+        self.token_expires_at = now + self.token_lifetime
+        self.token_refresh_at = now + timedelta(seconds=max(0.0, expires_in * fraction))
+
+    async def _refresh_token(self) -> None:
+        """Get a new token for the configured auth type"""
+        auth_type = "{{cookiecutter.auth_type}}"
+        if auth_type == "OAuth2":
+            await self._refresh_oauth2_token()
+        else:
+            await self._refresh_bearer_token()
+
+    def _schedule_refresh(self) -> None:
+        """Start the background token refresher on the running loop"""
+        task = self._refresh_task
+        if task is not None and not task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._background_refresh()
+        )
+
+    async def _background_refresh(self) -> None:
+        """
+        Refresh the token before it expires
+
+        Requests keep using the current token meanwhile. Failed refreshes
+        are retried with exponential backoff until the token expires, after
+        which the next request refreshes inline.
+        """
+        delay = config.api.token_refresh_retry_delay
+
+        while True:
+            wait = (self.token_refresh_at - datetime.now()).total_seconds()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                async with self._lock:
+                    # A request may have refreshed the token while we waited
+                    if datetime.now() >= self.token_refresh_at:
+                        await self._refresh_token()
+                        self._store_headers(await self._build_auth_headers())
+                delay = config.api.token_refresh_retry_delay
+
+            except Exception as e:
+                self.refresh_failures += 1
+                remaining = (self.token_expires_at - datetime.now()).total_seconds()
+                if remaining <= 0:
+                    print(f"❌ Token refresh failed and the token has expired: {e}")
+                    return
+
+                retry_in = max(1.0, min(delay, remaining / 2) * random.uniform(0.5, 1))
+                print(f"⚠️ Token refresh failed, retrying in {retry_in:.0f}s: {e}")
+                self.token_refresh_at = datetime.now() + timedelta(seconds=retry_in)
+                delay = min(delay * 2, config.api.token_refresh_max_delay)
+
+    async def close(self) -> None:
+        """Stop the background token refresher if it runs on this loop"""
+        task = self._refresh_task
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        if hasattr(self, "token_store"):
+            await self.token_store.close()
+
+        if self.pool is not None:
+            await self.pool.close()
+
     async def _refresh_bearer_token(self) -> None:
         """Refresh the bearer token"""
         if config.api.bearer_token:
-            self.access_token = config.api.bearer_token
-            self.token_expires_at = datetime.now() + timedelta(days=365)
+            self._set_token(
+                config.api.bearer_token, timedelta(days=365).total_seconds()
+            )
         else:
             raise ValueError(
                 "Bearer token not configured. Please set BEARER_TOKEN environment variable."
@@ -134,7 +317,7 @@ class McpServerAuth:
 
         if not hasattr(self, "access_token") or not self.access_token:
             raise ValueError(
-                "OAuth2 access token not available. Please complete OAuth2 flow."
+                "OAuth2 access token not available. Please check CLIENT_ID and CLIENT_SECRET."
             )
 
         return {
@@ -144,15 +327,92 @@ class McpServerAuth:
         }
 
     async def _refresh_oauth2_token(self) -> None:
-        """Refresh OAuth2 access token using refresh token"""
-        if not hasattr(self, "refresh_token") or not self.refresh_token:
-            raise ValueError("No refresh token available. Please re-authenticate.")
+        """
+        Get a new OAuth2 access token
+
+        Reuses a newer token saved by another replica or an earlier run if
+        there is one. Otherwise uses the refresh token when available and
+        falls back to the client credentials grant.
+        """
+        if await self._load_stored_token():
+            return
+
+        locked = await self.token_store.acquire_lock(30)
+        if not locked:
+            # Another replica is fetching a token; wait for it to be stored
+            for _ in range(20):
+                await asyncio.sleep(0.5)
+                if await self._load_stored_token():
+                    return
+
+        try:
+            token_data = None
+            if hasattr(self, "refresh_token") and self.refresh_token:
+                try:
+                    token_data = await self._request_token(
+                        {
+                            "grant_type": "refresh_token",
+                            "refresh_token": self.refresh_token,
+                        }
+                    )
+                except Exception as e:
+                    print(f"⚠️ Refresh token rejected, using client credentials: {e}")
+                    self.refresh_token = None
+
+            if token_data is None:
+                data = {"grant_type": "client_credentials"}
+                scopes = config.api.oauth_scope.replace(",", " ").split()
+                if scopes:
+                    data["scope"] = " ".join(scopes)
+                token_data = await self._request_token(data)
+
+            expires_in = token_data.get("expires_in", 3600)
+            self._set_token(token_data["access_token"], expires_in)
+            if "refresh_token" in token_data:
+                self.refresh_token = token_data["refresh_token"]
+
+            await self.token_store.save(
+                {
+                    "owner": self._token_owner,
+                    "access_token": self.access_token,
+                    "refresh_token": self.refresh_token,
+                    "expires_in": expires_in,
+                    "expires_at": self.token_expires_at.timestamp(),
+                }
+            )
+
+            print(f"✅ OAuth2 token refreshed successfully")
+
+        finally:
+            if locked:
+                await self.token_store.release_lock()
+
+    async def _load_stored_token(self) -> bool:
+        """Adopt the stored token if it is newer and not yet due for refresh"""
+        stored = await self.token_store.load()
+        if not stored or stored.get("owner") != self._token_owner:
+            return False
+
+        remaining = stored["expires_at"] - time.time()
+        current = self.token_expires_at.timestamp() if self.token_expires_at else 0
+        # Allow for clock rounding so we never re-adopt our own token
+        if stored["expires_at"] <= current + 1:
+            return False
+        if remaining <= stored["expires_in"] * (1 - config.api.token_refresh_fraction):
+            return False
 
-        token_url = f"{config.api.base_url}/oauth/token"
+        self._set_token(stored["access_token"], remaining)
+        if stored.get("refresh_token"):
+            self.refresh_token = stored["refresh_token"]
+        if config.mcp.debug:
+            print("🔑 Reusing stored OAuth2 token")
+        return True
 
+    async def _request_token(self, data: Dict[str, str]) -> Dict[str, Any]:
+        """Call the OAuth2 token endpoint"""
+        token_url = config.api.oauth_token_url or f"{config.api.base_url}/oauth/token"
         data = {
-            "grant_type": "refresh_token",
-            "refresh_token": self.refresh_token,
+            **data,
             "client_id": config.api.client_id,
             "client_secret": config.api.client_secret,
         }
@@ -161,27 +421,15 @@ class McpServerAuth:
             try:
                 async with session.post(token_url, data=data) as response:
                     if response.status == 200:
-                        token_data = await response.json()
-
-                        self.access_token = token_data["access_token"]
-                        expires_in = token_data.get("expires_in", 3600)
-                        self.token_expires_at = datetime.now() + timedelta(
-                            seconds=expires_in
-                        )
-
-                        if "refresh_token" in token_data:
-                            self.refresh_token = token_data["refresh_token"]
-
-                        print(f"✅ OAuth2 token refreshed successfully")
+                        return await response.json()
 
-                    else:
-                        error_text = await response.text()
-                        raise Exception(
-                            f"OAuth2 token refresh failed: {response.status} - {error_text}"
-                        )
+                    error_text = await response.text()
+                    raise Exception(
+                        f"OAuth2 token request failed: {response.status} - {error_text}"
+                    )
 
             except aiohttp.ClientError as e:
-                raise Exception(f"Network error during OAuth2 token refresh: {str(e)}")
+                raise Exception(f"Network error during OAuth2 token request: {str(e)}")
 
     async def validate_auth(self) -> bool:
         """Validate current authentication status"""
@@ -193,7 +441,7 @@ class McpServerAuth:
 
             async with aiohttp.ClientSession() as session:
                 async with session.get(
-                    test_url, headers=headers, timeout=10
+                    test_url, headers=dict(headers), timeout=10
                 ) as response:
                     return response.status < 400
 
@@ -216,6 +464,7 @@ class McpServerAuth:
                 {
                     "api_key_configured": bool(config.api.api_key),
                     "api_key_header": config.api.api_key_header,
+                    "pooled_keys": len(self.pool.credentials) if self.pool else 0,
                 }
             )
         elif auth_type == "Bearer Token":
@@ -229,6 +478,13 @@ class McpServerAuth:
                         if hasattr(self, "token_expires_at") and self.token_expires_at
                         else None
                     ),
+                    "refresh_at": (
+                        self.token_refresh_at.isoformat()
+                        if self.token_refresh_at
+                        else None
+                    ),
+                    "refresh_failures": self.refresh_failures,
+                    "pooled_tokens": len(self.pool.credentials) if self.pool else 0,
                 }
             )
         elif auth_type == "OAuth2":
@@ -244,6 +500,13 @@ class McpServerAuth:
                         if hasattr(self, "token_expires_at") and self.token_expires_at
                         else None
                     ),
+                    "refresh_at": (
+                        self.token_refresh_at.isoformat()
+                        if self.token_refresh_at
+                        else None
+                    ),
+                    "refresh_failures": self.refresh_failures,
+                    "token_store": self.token_store.get_stats(),
                     "client_id": (
                         config.api.client_id[:8] + "..."
                         if config.api.client_id
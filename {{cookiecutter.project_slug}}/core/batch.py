@@ -0,0 +1,315 @@
+"""
+Batch requests for {{cookiecutter.project_name}}
+Runs many resource requests in one tool call with bounded concurrency
+Auto-generated from mcp-server-template
+"""
+
+import asyncio
+import json
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+from core.pagination import extract_items
+
+BULK_OPERATIONS = ("create", "update", "delete")
+
+
+def dedupe_ids(ids: Iterable[Any]) -> List[str]:
+    """Strip and dedupe IDs, keeping the order they were first given in"""
+    unique = dict.fromkeys(str(resource_id).strip() for resource_id in ids)
+    return [resource_id for resource_id in unique if resource_id]
+
+
+async def map_bounded(
+    worker: Callable[[Any], Awaitable[Any]], items: List[Any], concurrency: int
+) -> List[Any]:
+    """
+    Await worker(item) for every item, at most `concurrency` at a time
+
+    Returns:
+        Results in the order of `items`; a failed item's exception is
+        returned in its place
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item):
+        async with semaphore:
+            return await worker(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+def _outcome(result: Any) -> Dict[str, Any]:
+    if isinstance(result, BaseException):
+        return {"status": "error", "message": str(result) or type(result).__name__}
+    return {"status": "success", "item": result}
+
+
+def parse_records(data: str) -> List[Any]:
+    """
+    Parse a JSON array, a single JSON value or JSON Lines into a list
+
+    Raises:
+        ValueError: If the text is none of these
+    """
+    text = data.strip()
+    if not text:
+        return []
+    try:
+        value = json.loads(text)
+    except json.JSONDecodeError:
+        records = []
+        for number, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {number}: {e.msg}")
+        return records
+    return value if isinstance(value, list) else [value]
+
+
+def _extract(response: Any) -> Any:
+    # Extract data (adjust based on your API response structure)
+    if isinstance(response, dict):
+        return response.get("data", response.get("item", response))
+    return response
+
+
+async def _get_one(client, resource_type: str, resource_id: str) -> Any:
+    response = await client.get(f"/{resource_type}/{resource_id}", allow_stale=True)
+    return _extract(response)
+
+
+async def _get_each(
+    client, resource_type: str, ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """One GET per ID, BATCH_CONCURRENCY at a time"""
+    results = await map_bounded(
+        lambda resource_id: _get_one(client, resource_type, resource_id),
+        ids,
+        config.api.batch_concurrency,
+    )
+    return {
+        resource_id: _outcome(result) for resource_id, result in zip(ids, results)
+    }
+
+
+async def _get_chunk_in_bulk(
+    client, resource_type: str, chunk: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """One request to the bulk endpoint for a chunk of IDs"""
+    endpoint = config.api.bulk_get_endpoint.replace("{resource_type}", resource_type)
+    response = await client.get(
+        endpoint, params={config.api.bulk_get_param: ",".join(chunk)}
+    )
+
+    field = config.api.bulk_get_id_field
+    found = {
+        str(item[field]): item
+        for item in extract_items(response, resource_type)
+        if isinstance(item, dict) and item.get(field) is not None
+    }
+    return {
+        resource_id: (
+            {"status": "success", "item": found[resource_id]}
+            if resource_id in found
+            else {"status": "error", "message": "Not found"}
+        )
+        for resource_id in chunk
+    }
+
+
+async def get_many(
+    client, resource_type: str, ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get resources by ID
+
+    Uses BULK_GET_ENDPOINT in chunks of BULK_GET_MAX_IDS when it is set,
+    and falls back to one GET per ID (for every ID, or for the chunks the
+    bulk endpoint failed on). Requests run BATCH_CONCURRENCY at a time and
+    still go through the client's rate limiter, cache and retries.
+
+    Args:
+        client: API client
+        resource_type: Type of resource (e.g., 'users', 'orders')
+        ids: Unique IDs
+
+    Returns:
+        {id: {"status": "success", "item": ...}} or
+        {id: {"status": "error", "message": ...}} for every ID, in order
+    """
+    if not config.api.bulk_get_endpoint:
+        return await _get_each(client, resource_type, ids)
+
+    size = max(1, config.api.bulk_get_max_ids)
+    chunks = [ids[i : i + size] for i in range(0, len(ids), size)]
+    chunk_results = await map_bounded(
+        lambda chunk: _get_chunk_in_bulk(client, resource_type, chunk),
+        chunks,
+        config.api.batch_concurrency,
+    )
+
+    results: Dict[str, Dict[str, Any]] = {}
+    fallback: List[str] = []
+    for chunk, result in zip(chunks, chunk_results):
+        if isinstance(result, BaseException):
+            print(
+                f"⚠️ Bulk get of {len(chunk)} {resource_type} failed ({result}), "
+                "fetching them one by one"
+            )
+            fallback.extend(chunk)
+        else:
+            results.update(result)
+    if fallback:
+        results.update(await _get_each(client, resource_type, fallback))
+
+    return {resource_id: results[resource_id] for resource_id in ids}
+
+
+def _record_id(record: Any, id_field: str) -> Any:
+    if isinstance(record, dict):
+        return record.get(id_field)
+    if isinstance(record, (str, int)) and not isinstance(record, bool):
+        return record
+    return None
+
+
+async def _write_one(
+    client, operation: str, resource_type: str, record: Any, id_field: str
+) -> Any:
+    """Send one bulk item; return the ID of the written resource"""
+    if operation == "create":
+        if not isinstance(record, dict):
+            raise ValueError("Item must be a JSON object")
+        # Equal records are distinct creates, not replays of each other
+        headers = None
+        if config.api.idempotency_header:
+            headers = {config.api.idempotency_header: str(uuid.uuid4())}
+        response = await client.post(
+            f"/{resource_type}", json_data=record, headers=headers
+        )
+        item = _extract(response)
+        if isinstance(item, dict):
+            return item.get(id_field, item.get("_id"))
+        return None
+
+    resource_id = _record_id(record, id_field)
+    if resource_id in (None, ""):
+        raise ValueError(f"Item has no '{id_field}'")
+    endpoint = f"/{resource_type}/{resource_id}"
+    if operation == "update":
+        if not isinstance(record, dict):
+            raise ValueError("Item must be a JSON object")
+        await client.put(endpoint, json_data=record)
+    else:
+        await client.delete(endpoint)
+    return resource_id
+
+
+async def bulk_write(
+    client,
+    operation: str,
+    resource_type: str,
+    records: List[Any],
+    id_field: str = "id",
+    concurrency: int = 10,
+    stop_on_error: bool = True,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Create, update or delete many resources, yielding a result per item
+
+    Up to `concurrency` items are in flight at a time across the whole
+    input: the next item is sent as soon as any earlier one finished.
+    Every request goes through the client, so the rate limiter, retries
+    and idempotency keys apply. With `stop_on_error`, no further item is
+    sent once one failed; items in flight still finish and are yielded,
+    the items never sent are not.
+
+    Args:
+        client: API client
+        operation: "create", "update" or "delete"
+        resource_type: Type of resource (e.g., 'users', 'orders')
+        records: Objects to create or update (with `id_field`), or IDs /
+            objects with `id_field` to delete
+        id_field: Field holding the resource ID
+        concurrency: Items sent at the same time
+        stop_on_error: Stop sending items after the first failure
+
+    Yields:
+        {"index", "id", "status"} per item in input order, with "message"
+        for failed items
+    """
+    if operation not in BULK_OPERATIONS:
+        raise ValueError(
+            f"Unknown bulk operation '{operation}', use one of {BULK_OPERATIONS}"
+        )
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    sent: asyncio.Queue = asyncio.Queue()
+    failed = False
+
+    async def write(record: Any) -> Any:
+        nonlocal failed
+        try:
+            return await _write_one(client, operation, resource_type, record, id_field)
+        except Exception as e:
+            failed = True
+            return e
+        finally:
+            semaphore.release()
+
+    async def send_all() -> None:
+        try:
+            for record in records:
+                await semaphore.acquire()
+                if failed and stop_on_error:
+                    semaphore.release()
+                    break
+                sent.put_nowait(asyncio.create_task(write(record)))
+        finally:
+            # Marks the end of the items that were sent
+            sent.put_nowait(None)
+
+    sender = asyncio.create_task(send_all())
+    tasks: List[asyncio.Task] = []
+    try:
+        for index, record in enumerate(records):
+            task = await sent.get()
+            if task is None:
+                return
+            tasks.append(task)
+            result = await task
+
+            if isinstance(result, BaseException):
+                # A failed create has no ID yet
+                if operation == "create":
+                    record = None
+                yield {
+                    "index": index,
+                    "id": _record_id(record, id_field),
+                    "status": "error",
+                    "message": str(result) or type(result).__name__,
+                }
+            else:
+                yield {"index": index, "id": result, "status": "success"}
+
+            done = index + 1
+            if config.mcp.debug and (done % 100 == 0 or done == len(records)):
+                print(f"📦 Bulk {operation} {resource_type}: {done}/{len(records)}")
+    finally:
+        # Writes still running when the caller stopped early are cancelled
+        sender.cancel()
+        while not sent.empty():
+            task = sent.get_nowait()
+            if task is not None:
+                tasks.append(task)
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,472 @@
+"""
+Response cache for {{cookiecutter.project_name}}
+In-process TTL/LRU cache with an optional Redis tier for read requests,
+plus the validator store used for conditional GET requests
+Auto-generated from mcp-server-template
+"""
+
+import asyncio
+import hashlib
+import json
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+
+def resource_type_of(endpoint: str) -> str:
+    """Get the resource type (first path segment) of an endpoint"""
+    return endpoint.strip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+def make_cache_key(
+    endpoint: str,
+    params: Optional[Dict],
+    identity: str,
+    headers: Optional[Dict] = None,
+) -> str:
+    """Build a cache key from endpoint, query params, headers and auth identity"""
+    # Header names are case-insensitive
+    headers = {str(name).lower(): value for name, value in (headers or {}).items()}
+    raw = json.dumps(
+        [endpoint.strip("/"), params or {}, headers, identity],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Cache for GET responses
+
+    Features:
+    - In-process tier with TTL expiry and LRU eviction bounded by bytes
+    - Optional Redis tier shared by all replicas
+    - Stale-while-revalidate: expired entries stay readable for
+      `max_stale` seconds so callers that opt in can refresh in background
+    - Invalidation per resource type, across replicas with Redis
+    - Hit/miss/eviction counters per resource type
+
+    Every resource type has a generation that invalidation bumps. A fetch
+    reads it with generation() before going upstream and passes it to
+    set(), so a response fetched before a write is not cached after it.
+    With Redis, the generation is shared: in-process entries remember the
+    one they were stored under and are dropped on a hit once another
+    replica has moved it on.
+    """
+
+    def __init__(
+        self,
+        ttl: int,
+        max_bytes: int,
+        max_stale: int = 0,
+        redis_url: str = "",
+        redis_client: Any = None,
+        prefix: str = "cache",
+        retry_after: float = 30.0,
+    ):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_stale = max_stale
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self.retry_after = retry_after
+
+        # key -> (resource_type, payload, fresh_until, expires_at, redis_gen)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._by_type: Dict[str, set] = {}
+        self._generations: Dict[str, int] = {}
+        self.discarded_sets = 0
+        self.size_bytes = 0
+        self._lock = threading.Lock()
+
+        # Redis tier, one client per event loop unless one is injected
+        self.redis_enabled = bool(redis_url) or redis_client is not None
+        self._redis_client = redis_client
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._unavailable_until = 0.0
+        self.redis_errors = 0
+
+        # resource_type -> {"hits", "stale_hits", "misses", "evictions"}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # Statistics
+    def _count(self, resource_type: str, counter: str) -> None:
+        stats = self._stats.setdefault(
+            resource_type, {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0}
+        )
+        stats[counter] += 1
+
+    # In-process tier
+    def _local_get(
+        self, key: str, redis_gen: Optional[int] = None
+    ) -> Optional[Tuple[str, bool]]:
+        """Get (payload, is_fresh) from the in-process tier"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = time.monotonic()
+            # Expired, or invalidated by another replica since it was stored
+            if entry[3] <= now or (redis_gen is not None and entry[4] != redis_gen):
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1], entry[2] > now
+
+    def _local_set(
+        self,
+        key: str,
+        resource_type: str,
+        payload: str,
+        ttl: float,
+        stale: float,
+        local_gen: Optional[int] = None,
+        redis_gen: Optional[int] = None,
+    ) -> bool:
+        """Store an entry; False if `local_gen` is no longer current"""
+        size = len(payload)
+        with self._lock:
+            if (
+                local_gen is not None
+                and self._generations.get(resource_type, 0) != local_gen
+            ):
+                return False
+            if size > self.max_bytes:
+                return True
+            if key in self._entries:
+                self._drop(key)
+
+            now = time.monotonic()
+            self._entries[key] = (
+                resource_type,
+                payload,
+                now + ttl,
+                now + ttl + stale,
+                redis_gen,
+            )
+            self._by_type.setdefault(resource_type, set()).add(key)
+            self.size_bytes += size
+
+            # Evict least recently used entries until under the byte bound
+            while self.size_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._count(self._entries[oldest][0], "evictions")
+                self._drop(oldest)
+        return True
+
+    def _drop(self, key: str) -> None:
+        """Remove a local entry (lock must be held)"""
+        resource_type, payload = self._entries.pop(key)[:2]
+        self.size_bytes -= len(payload)
+        keys = self._by_type.get(resource_type)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_type[resource_type]
+
+    # Redis tier
+    def _get_redis(self):
+        if self._redis_client is not None:
+            return self._redis_client
+
+        loop = asyncio.get_running_loop()
+        redis_client = self._clients.get(loop)
+        if redis_client is None:
+            import redis.asyncio as redis_asyncio
+
+            redis_client = redis_asyncio.from_url(
+                self.redis_url, socket_timeout=2, socket_connect_timeout=2
+            )
+            self._clients[loop] = redis_client
+        return redis_client
+
+    def _redis_available(self) -> bool:
+        return self.redis_enabled and time.monotonic() >= self._unavailable_until
+
+    def _redis_failed(self, error: Exception) -> None:
+        self.redis_errors += 1
+        self._unavailable_until = time.monotonic() + self.retry_after
+        print(f"⚠️ Redis cache unavailable for {self.retry_after}s: {error}")
+
+    async def _redis_generation(self, redis_client, resource_type: str) -> int:
+        generation = await redis_client.get(f"{self.prefix}:gen:{resource_type}")
+        return int(generation) if generation else 0
+
+    def _redis_key(self, resource_type: str, generation: int, key: str) -> str:
+        """Namespace keys by the resource type generation used for invalidation"""
+        return f"{self.prefix}:{resource_type}:{generation}:{key}"
+
+    # Public API
+    async def get(
+        self, endpoint: str, key: str, allow_stale: bool = False
+    ) -> Optional[Tuple[Any, bool]]:
+        """
+        Get a cached response
+
+        Returns:
+            (value, is_stale), or None on a miss. Stale values are only
+            returned when `allow_stale` is set.
+        """
+        resource_type = resource_type_of(endpoint)
+
+        redis_gen = None
+        if self._redis_available():
+            try:
+                redis_gen = await self._redis_generation(
+                    self._get_redis(), resource_type
+                )
+            except Exception as e:
+                self._redis_failed(e)
+
+        found = self._local_get(key, redis_gen)
+        if found is None and redis_gen is not None:
+            try:
+                redis_client = self._get_redis()
+                redis_key = self._redis_key(resource_type, redis_gen, key)
+                raw = await redis_client.get(redis_key)
+                if raw is not None:
+                    raw = raw.decode() if isinstance(raw, bytes) else raw
+                    # Stored as "<fresh until (unix time)>\n<payload>"
+                    fresh_until, _, payload = raw.partition("\n")
+                    fresh_for = float(fresh_until) - time.time()
+                    expires_in = (await redis_client.pttl(redis_key)) / 1000
+                    if expires_in > 0:
+                        self._local_set(
+                            key,
+                            resource_type,
+                            payload,
+                            max(0.0, fresh_for),
+                            expires_in - max(0.0, fresh_for),
+                            redis_gen=redis_gen,
+                        )
+                        found = payload, fresh_for > 0
+            except Exception as e:
+                self._redis_failed(e)
+
+        if found is None or (not found[1] and not allow_stale):
+            self._count(resource_type, "misses")
+            return None
+
+        payload, fresh = found
+        self._count(resource_type, "hits" if fresh else "stale_hits")
+        # Decode a fresh copy so callers can never mutate the cached value
+        return json.loads(payload), not fresh
+
+    async def generation(self, endpoint: str) -> Tuple[int, Optional[int]]:
+        """Get the generation of an endpoint's resource type, before a fetch"""
+        resource_type = resource_type_of(endpoint)
+        with self._lock:
+            local_gen = self._generations.get(resource_type, 0)
+
+        redis_gen = None
+        if self._redis_available():
+            try:
+                redis_gen = await self._redis_generation(
+                    self._get_redis(), resource_type
+                )
+            except Exception as e:
+                self._redis_failed(e)
+        return local_gen, redis_gen
+
+    async def set(
+        self,
+        endpoint: str,
+        key: str,
+        value: Any,
+        generation: Optional[Tuple[int, Optional[int]]] = None,
+    ) -> None:
+        """
+        Store a response in every tier
+
+        Args:
+            generation: Result of generation() taken before the response
+                was fetched; if the resource type was invalidated since,
+                the response is not stored
+        """
+        resource_type = resource_type_of(endpoint)
+        try:
+            payload = json.dumps(value, separators=(",", ":"), default=str)
+        except (TypeError, ValueError):
+            return
+
+        local_gen, redis_gen = generation if generation is not None else (None, None)
+        if generation is None and self._redis_available():
+            try:
+                redis_gen = await self._redis_generation(
+                    self._get_redis(), resource_type
+                )
+            except Exception as e:
+                self._redis_failed(e)
+
+        stored = self._local_set(
+            key,
+            resource_type,
+            payload,
+            self.ttl,
+            self.max_stale,
+            local_gen=local_gen,
+            redis_gen=redis_gen,
+        )
+        if not stored:
+            self.discarded_sets += 1
+            if config.mcp.debug:
+                print(f"🗑️ Not caching GET {endpoint}: written while in flight")
+            return
+
+        # Under an old generation the Redis entry is orphaned right away
+        if redis_gen is not None and self._redis_available():
+            try:
+                redis_client = self._get_redis()
+                redis_key = self._redis_key(resource_type, redis_gen, key)
+                await redis_client.set(
+                    redis_key,
+                    f"{time.time() + self.ttl:.3f}\n{payload}",
+                    ex=self.ttl + self.max_stale,
+                )
+            except Exception as e:
+                self._redis_failed(e)
+
+    async def invalidate(self, resource_type: str) -> None:
+        """Drop every cached response for a resource type"""
+        with self._lock:
+            self._generations[resource_type] = (
+                self._generations.get(resource_type, 0) + 1
+            )
+            for key in list(self._by_type.get(resource_type, ())):
+                self._drop(key)
+
+        if self._redis_available():
+            try:
+                # Bumping the generation orphans old keys; they expire by TTL
+                await self._get_redis().incr(f"{self.prefix}:gen:{resource_type}")
+            except Exception as e:
+                self._redis_failed(e)
+
+    async def close(self) -> None:
+        """Close the Redis client owned by the running loop"""
+        redis_client = self._clients.pop(asyncio.get_running_loop(), None)
+        if redis_client is not None:
+            await redis_client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and per resource type counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "max_stale": self.max_stale,
+                "redis_enabled": self.redis_enabled,
+                "redis_available": self._redis_available(),
+                "redis_errors": self.redis_errors,
+                "discarded_sets": self.discarded_sets,
+                "resource_types": {
+                    resource_type: dict(stats)
+                    for resource_type, stats in self._stats.items()
+                },
+            }
+
+
+class ValidatorStore:
+    """
+    ETag / Last-Modified validators for conditional GET requests
+
+    Keeps the validators and the last body seen for each request, so a
+    304 Not Modified answer can be served from memory. Bounded by bytes
+    with least recently used eviction.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+
+        # key -> {"etag", "last_modified", "content_type", "body"}
+        self._entries: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self.size_bytes = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.revalidated = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Get the stored validators and body for a request"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_type: str,
+        body: str,
+    ) -> None:
+        """Remember validators and body from a 200 response"""
+        size = len(body)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size_bytes -= len(old["body"])
+
+            self._entries[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "content_type": content_type,
+                "body": body,
+            }
+            self.size_bytes += size
+
+            while self.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted["body"])
+                self.evictions += 1
+
+    def record_not_modified(self, entry: Dict[str, str]) -> None:
+        """Count a 304 answer served from the stored body"""
+        with self._lock:
+            self.revalidated += 1
+            self.bytes_saved += len(entry["body"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store size and revalidation counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "not_modified": self.revalidated,
+                "bytes_saved": self.bytes_saved,
+                "evictions": self.evictions,
+            }
+
+
+def create_response_cache() -> ResponseCache:
+    """Create the response cache selected by CACHE_BACKEND"""
+    backend = config.cache.cache_backend.lower()
+    if backend not in ("memory", "redis"):
+        print(f"⚠️ Unknown CACHE_BACKEND '{backend}', using memory cache")
+
+    return ResponseCache(
+        ttl=config.cache.cache_ttl,
+        max_bytes=config.cache.cache_max_bytes,
+        max_stale=config.cache.cache_max_stale,
+        redis_url=config.cache.redis_url if backend == "redis" else "",
+        prefix=f"{config.mcp.server_name}:cache",
+    )
@@ -0,0 +1,211 @@
+"""
+Capture policy for {{cookiecutter.project_name}}
+Decides which tool results are saved, and how much of them
+Auto-generated from mcp-server-template
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+# Top-level fields always kept when a record is truncated
+KEEP_FIELDS = {"data_type", "status", "message", "timestamp", "saved_at"}
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """Parse "tool=rate,tool=rate" into a dict"""
+    rates = {}
+    for entry in value.split(","):
+        if "=" not in entry:
+            continue
+        tool, rate = entry.split("=", 1)
+        try:
+            rates[tool.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            print(f"⚠️ Ignoring invalid CAPTURE_SAMPLE_RATES entry '{entry}'")
+    return rates
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _pair_size(key: str, value: Any) -> int:
+    """Bytes of `"key":value` in a serialized object"""
+    return _size(_dumps({key: value})) - 2
+
+
+class CapturePolicy:
+    """
+    Rules for saving tool results
+
+    - Sampling: each tool saves `sample_rates[tool]` (default
+      `sample_rate`) of its results, decided before anything is copied
+    - Errors: results with status "error" are always saved and do not
+      count against the budget, unless `capture_errors` is off
+    - Size cap: records larger than `max_bytes` have their largest fields
+      replaced by truncation markers
+    - Budget: at most `bytes_per_minute` bytes are saved per minute; the
+      rest is dropped
+    """
+
+    def __init__(
+        self,
+        sample_rate: float,
+        sample_rates: Dict[str, float],
+        capture_errors: bool,
+        max_bytes: int,
+        bytes_per_minute: int,
+    ):
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+        self.sample_rates = sample_rates
+        self.capture_errors = capture_errors
+        self.max_bytes = max_bytes
+        self.bytes_per_minute = bytes_per_minute
+
+        self._lock = threading.Lock()
+        self._minute = 0
+        self._minute_bytes = 0
+
+        # Metrics
+        self.sampled_out = 0
+        self.truncated = 0
+        self.over_budget = 0
+
+    @staticmethod
+    def is_error(data: Dict[str, Any]) -> bool:
+        return isinstance(data, dict) and data.get("status") == "error"
+
+    def should_capture(self, tool: str, data: Dict[str, Any]) -> bool:
+        """Sample a result; errors are always kept"""
+        if self.capture_errors and self.is_error(data):
+            return True
+        rate = self.sample_rates.get(tool, self.sample_rate)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        with self._lock:
+            self.sampled_out += 1
+        return False
+
+    def serialize(self, record: Dict[str, Any]) -> str:
+        """Serialize a record as one JSON line, truncated to max_bytes"""
+        line = _dumps(record)
+        original = _size(line)
+        if self.max_bytes <= 0 or original <= self.max_bytes:
+            return line
+
+        value_sizes = {
+            key: _size(_dumps(value))
+            for key, value in record.items()
+            if key not in KEEP_FIELDS
+        }
+        largest_first = sorted(value_sizes, key=value_sizes.get, reverse=True)
+        truncated = {
+            **record,
+            "_truncated_from_bytes": original,
+            "_dropped_fields": 0,
+        }
+        line = _dumps(truncated)
+
+        # Replace the largest fields by markers, then drop markers, until
+        # the whole line fits. Sizes are tracked per "key":value pair and
+        # the line is re-serialized to confirm before stopping.
+        size = _size(line)
+        for drop_markers in (False, True):
+            for key in largest_first:
+                if size <= self.max_bytes:
+                    line = _dumps(truncated)
+                    size = _size(line)
+                    if size <= self.max_bytes:
+                        break
+                if key not in truncated:
+                    continue
+                old_pair = _pair_size(key, truncated[key])
+                marker = {"_truncated": True, "bytes": value_sizes[key]}
+                if not drop_markers and _size(_dumps(marker)) < value_sizes[key]:
+                    truncated[key] = marker
+                    size += _pair_size(key, marker) - old_pair
+                elif drop_markers or truncated[key] != marker:
+                    dropped = truncated["_dropped_fields"]
+                    del truncated[key]
+                    truncated["_dropped_fields"] = dropped + 1
+                    # The pair and its comma go; the count may gain a digit
+                    size -= old_pair + 1
+                    size += len(str(dropped + 1)) - len(str(dropped))
+        line = _dumps(truncated)
+
+        if _size(line) > self.max_bytes:
+            # Even the kept fields are too large: keep only the metadata
+            truncated = {
+                key: truncated[key]
+                for key in ("data_type", "saved_at", "_truncated_from_bytes")
+                if key in truncated
+            }
+            truncated["_dropped_fields"] = sum(
+                1 for key in record if key not in truncated
+            )
+            line = _dumps(truncated)
+
+        with self._lock:
+            self.truncated += 1
+        return line
+
+    def admit(self, size: int, is_error: bool = False) -> bool:
+        """Spend `size` bytes of this minute's budget"""
+        with self._lock:
+            minute = int(time.time() // 60)
+            if minute != self._minute:
+                self._minute = minute
+                self._minute_bytes = 0
+
+            exempt = is_error and self.capture_errors
+            if (
+                not exempt
+                and self.bytes_per_minute > 0
+                and self._minute_bytes + size > self.bytes_per_minute
+            ):
+                self.over_budget += 1
+                return False
+            self._minute_bytes += size
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sample_rate": self.sample_rate,
+                "sample_rates": self.sample_rates,
+                "capture_errors": self.capture_errors,
+                "max_bytes": self.max_bytes,
+                "bytes_per_minute": self.bytes_per_minute,
+                "bytes_this_minute": (
+                    self._minute_bytes
+                    if self._minute == int(time.time() // 60)
+                    else 0
+                ),
+                "sampled_out": self.sampled_out,
+                "truncated": self.truncated,
+                "over_budget": self.over_budget,
+            }
+
+
+def create_capture_policy() -> CapturePolicy:
+    """Create the capture policy from the CAPTURE_* settings"""
+    return CapturePolicy(
+        sample_rate=config.mcp.capture_sample_rate,
+        sample_rates=parse_sample_rates(config.mcp.capture_sample_rates),
+        capture_errors=config.mcp.capture_errors,
+        max_bytes=config.mcp.capture_max_bytes,
+        bytes_per_minute=config.mcp.capture_bytes_per_minute,
+    )
@@ -0,0 +1,222 @@
+"""
+Circuit breakers for {{cookiecutter.project_name}}
+Fail fast while an upstream endpoint is down instead of waiting on it
+Auto-generated from mcp-server-template
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because its circuit is open"""
+
+    def __init__(self, prefix: str, retry_after: float):
+        super().__init__(
+            f"Circuit open for {prefix}: upstream failing, retry in {retry_after:.0f}s"
+        )
+        self.prefix = prefix
+        self.retry_after = retry_after
+
+
+def endpoint_prefix(endpoint: str) -> str:
+    """Get the endpoint prefix (first path segment) a breaker is keyed on"""
+    return "/" + endpoint.strip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one endpoint prefix
+
+    - closed: requests flow; `failure_threshold` consecutive failures open it
+    - open: requests fail fast with CircuitOpenError for `reset_timeout`
+    - half_open: up to `half_open_requests` probes are let through; that
+      many successes close the circuit, any failure opens it again
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        half_open_requests: int,
+    ):
+        self.prefix = prefix
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self.probe_successes = 0
+
+        # Metrics
+        self.times_opened = 0
+        self.rejected = 0
+
+        self._lock = threading.Lock()
+
+    def _open(self, now: float) -> None:
+        """Open the circuit (lock must be held)"""
+        self.state = OPEN
+        self.opened_at = now
+        self.probes_in_flight = 0
+        self.probe_successes = 0
+        self.times_opened += 1
+        print(f"🔌 Circuit opened for {self.prefix} ({self.failures} failures)")
+
+    def before_request(self) -> bool:
+        """
+        Let a request through or refuse it
+
+        Returns:
+            True if the request goes out as a half-open probe
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN:
+                retry_after = self.opened_at + self.reset_timeout - now
+                if retry_after > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.prefix, retry_after)
+                self.state = HALF_OPEN
+
+            if self.state == HALF_OPEN:
+                if self.probes_in_flight >= self.half_open_requests:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.prefix, self.reset_timeout)
+                self.probes_in_flight += 1
+                return True
+
+            return False
+
+    def record(self, success: Optional[bool], probe: bool) -> None:
+        """
+        Record the outcome of a request let through by before_request()
+
+        Args:
+            success: True if the upstream answered, False if it failed, None
+                if the request never reached it (e.g. it was cancelled)
+            probe: Whether the request was let through as a half-open probe
+        """
+        with self._lock:
+            if probe and self.state == HALF_OPEN:
+                self.probes_in_flight -= 1
+
+            if success is None:
+                return
+
+            if success:
+                self.failures = 0
+                if probe and self.state == HALF_OPEN:
+                    self.probe_successes += 1
+                    if self.probe_successes >= self.half_open_requests:
+                        self.state = CLOSED
+                        print(f"🔌 Circuit closed for {self.prefix}")
+                return
+
+            self.failures += 1
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self.failures >= self.failure_threshold
+            ):
+                self._open(time.monotonic())
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+            if self.state == OPEN:
+                stats["retry_in"] = round(
+                    max(0.0, self.opened_at + self.reset_timeout - time.monotonic()), 2
+                )
+            return stats
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers created on demand, one per endpoint prefix"""
+
+    def __init__(
+        self,
+        enabled: bool,
+        failure_threshold: int,
+        reset_timeout: float,
+        half_open_requests: int,
+    ):
+        self.enabled = enabled
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> Optional[CircuitBreaker]:
+        """Get the breaker guarding an endpoint, or None when disabled"""
+        if not self.enabled:
+            return None
+
+        prefix = endpoint_prefix(endpoint)
+        breaker = self._breakers.get(prefix)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    prefix,
+                    CircuitBreaker(
+                        prefix,
+                        self.failure_threshold,
+                        self.reset_timeout,
+                        self.half_open_requests,
+                    ),
+                )
+        return breaker
+
+    def open_circuits(self) -> Dict[str, Dict[str, Any]]:
+        """Get the breakers that are not closed"""
+        return {
+            prefix: stats
+            for prefix, stats in self.get_stats()["circuits"].items()
+            if stats["state"] != CLOSED
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the state of every breaker"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {
+            "enabled": self.enabled,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout": self.reset_timeout,
+            "half_open_requests": self.half_open_requests,
+            "circuits": {breaker.prefix: breaker.get_stats() for breaker in breakers},
+        }
+
+
+def create_circuit_breakers() -> CircuitBreakerRegistry:
+    """Create the circuit breaker registry from the CIRCUIT_* settings"""
+    return CircuitBreakerRegistry(
+        enabled=config.api.circuit_breaker,
+        failure_threshold=config.api.circuit_failure_threshold,
+        reset_timeout=config.api.circuit_reset_timeout,
+        half_open_requests=config.api.circuit_half_open_requests,
+    )
@@ -5,57 +5,45 @@ Auto-generated from mcp-server-template
 """
 
 import asyncio
+import copy
 import json
 import sys
 import time
+import weakref
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import aiohttp
+from multidict import CIMultiDict
 
 # Include rate limiting if enabled
 include_rate_limiting = {{cookiecutter.include_rate_limiting == "yes"}}
 if include_rate_limiting:
     from asyncio import Semaphore
 
+# Methods safe to share between identical concurrent requests
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
 # Fix import path for direct execution
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.auth import auth
+from core.cache import ValidatorStore, make_cache_key, resource_type_of
+from core.circuit_breaker import CircuitOpenError, create_circuit_breakers
+from core.hedging import create_hedge_policy
+from core.idempotency import create_idempotency_table
+from core.retry import create_retry_policy
 from core.config import config
 
-
-# Rate limiter implementation
-class RateLimiter:
-    """Rate limiter for API requests using token bucket algorithm"""
-
-    def __init__(self, max_requests: int, time_window: int):
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.requests = []
-        self._lock = asyncio.Lock()
-
-    async def acquire(self):
-        """Wait for rate limit slot to be available"""
-        async with self._lock:
-            now = time.time()
-
-            # Remove old requests outside the time window
-            self.requests = [
-                req_time
-                for req_time in self.requests
-                if now - req_time < self.time_window
-            ]
-
-            # If we're at the limit, wait
-            if len(self.requests) >= self.max_requests:
-                sleep_time = self.time_window - (now - self.requests[0])
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                    return await self.acquire()
-
-            # Record this request
-            self.requests.append(now)
+# Include response caching if enabled
+include_caching = {{cookiecutter.include_caching == "yes"}}
+if include_caching:
+    from core.cache import create_response_cache
+from core.rate_limit import (
+    RateLimiter,
+    create_rate_limiter,
+    parse_rate_limit_headers,
+)
 
 
 class McpApiClient:
@@ -64,7 +52,13 @@ class McpApiClient:
 
     Features:
     - Automatic authentication header injection
+    - Shared connection pool (keep-alive, per-host limits, DNS cache)
     - Rate limiting (configurable)
+    - Response caching for GET requests (configurable)
+    - Coalescing of identical concurrent GET requests
+    - ETag / Last-Modified revalidation of GET requests
+    - Hedging of slow GET requests (configurable)
+    - Idempotency keys and replay protection for writes
     - Retry logic with exponential backoff
     - Request/response logging
     - Error handling and custom exceptions
@@ -74,12 +68,42 @@ class McpApiClient:
         self.base_url = config.api.full_api_url
         self.timeout = config.api.timeout
 
+        # Pooled sessions, created lazily and keyed by the loop that owns them
+        self._sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+        # Identical idempotent requests currently in flight
+        self._inflight: Dict[tuple, Dict[str, Any]] = {}
+        self.coalesced_requests = 0
+        # resource_type -> successful writes, part of the coalescing key
+        self._write_generations: Dict[str, int] = {}
+
+        # Background refreshes of stale cache entries
+        self._background_tasks: set = set()
+
+        # ETag / Last-Modified validators for conditional GETs
+        self.validators = ValidatorStore(config.api.validator_store_max_bytes)
+
+        # Which failed requests are retried, and the shared retry budget
+        self.retry_policy = create_retry_policy()
+
+        # Fail fast per endpoint prefix while the upstream is down
+        self.circuit_breakers = create_circuit_breakers()
+
+        # Second GET for requests slower than the usual tail latency
+        self.hedging = create_hedge_policy()
+
+        # Idempotency keys and results of recent writes
+        self.idempotency = create_idempotency_table()
+
         # Initialize rate limiter if rate limiting is enabled
         include_rate_limiting = {{cookiecutter.include_rate_limiting == "yes"}}
         if include_rate_limiting:
-            self.rate_limiter = RateLimiter(
-                config.api.rate_limit_requests, config.api.rate_limit_window
-            )
+            self.rate_limiter = create_rate_limiter()
+
+        # Initialize response cache if caching is enabled
+        include_caching = {{cookiecutter.include_caching == "yes"}}
+        if include_caching:
+            self.cache = create_response_cache()
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -87,12 +111,49 @@ class McpApiClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        pass
+        await self.close()
 
     async def _create_session(self) -> aiohttp.ClientSession:
-        """Create a new aiohttp session with the configured timeout"""
+        """Create a new aiohttp session backed by a pooled connector"""
         timeout = aiohttp.ClientTimeout(total=self.timeout)
-        return aiohttp.ClientSession(timeout=timeout)
+        connector = aiohttp.TCPConnector(
+            limit=config.api.pool_max_connections,
+            limit_per_host=config.api.pool_max_per_host,
+            keepalive_timeout=config.api.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=config.api.dns_cache_ttl,
+        )
+        return aiohttp.ClientSession(timeout=timeout, connector=connector)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled session for the running event loop, creating it lazily
+
+        aiohttp sessions are bound to the loop they were created on, so one
+        session is kept per loop and reused by every request made on it.
+        """
+        loop = asyncio.get_running_loop()
+
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = await self._create_session()
+            self._sessions[loop] = session
+
+        return session
+
+    async def close(self) -> None:
+        """Release the connections owned by the running loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+        if hasattr(self, "rate_limiter"):
+            await self.rate_limiter.close()
+
+        if hasattr(self, "cache"):
+            await self.cache.close()
+
+        await auth.close()
 
     async def _make_request(
         self,
@@ -102,25 +163,37 @@ class McpApiClient:
         json_data: Optional[Dict] = None,
         data: Optional[Union[Dict, str, bytes]] = None,
         headers: Optional[Dict] = None,
+        return_headers: bool = False,
         **kwargs,
     ) -> Dict[Any, Any]:
-        """Make HTTP request with authentication, rate limiting, and retry logic"""
-        # Apply rate limiting if enabled
-        include_rate_limiting = {{cookiecutter.include_rate_limiting == "yes"}}
-        if include_rate_limiting and hasattr(self, "rate_limiter"):
-            # Wait for rate limit slot
-            await self.rate_limiter.acquire()
+        """
+        Make HTTP request with authentication, rate limiting, and retry logic
 
+        With `return_headers`, returns (result, response headers) instead.
+        """
         # Prepare URL
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
 
-        # Get authentication headers
-        auth_headers = await auth.get_auth_headers()
-
-        # Merge headers
-        final_headers = {**auth_headers}
-        if headers:
-            final_headers.update(headers)
+        # Revalidate GETs seen before instead of downloading them again,
+        # unless the caller sent its own conditional headers
+        validator_key = None
+        stored = None
+        conditional_headers = {}
+        if (
+            method == "GET"
+            and config.api.conditional_requests
+            and "If-None-Match" not in (headers or {})
+            and "If-Modified-Since" not in (headers or {})
+        ):
+            validator_key = make_cache_key(
+                url, params, await auth.get_identity(), headers
+            )
+            stored = self.validators.get(validator_key)
+            if stored is not None:
+                if stored["etag"]:
+                    conditional_headers["If-None-Match"] = stored["etag"]
+                if stored["last_modified"]:
+                    conditional_headers["If-Modified-Since"] = stored["last_modified"]
 
         # Log request
         if config.mcp.debug:
@@ -130,71 +203,469 @@ class McpApiClient:
             if json_data:
                 print(f"📝 JSON: {json.dumps(json_data, indent=2)}")
 
-        # Retry logic
-        max_retries = 3
-        base_delay = 1.0
+        # Writes carrying an idempotency key are safe to retry
+        keyed = self.idempotency.enabled and self.idempotency.header in (
+            headers or {}
+        )
 
-        for attempt in range(max_retries + 1):
+        # Retry logic
+        policy = self.retry_policy
+        policy.record_request()
+        breaker = self.circuit_breakers.get(endpoint)
+
+        for attempt in range(policy.max_retries + 1):
+            # Raises CircuitOpenError while the endpoint is failing
+            probe = breaker.before_request() if breaker is not None else False
+            recorded = False
+
+            # With a credential pool every attempt picks a credential and
+            # uses that credential's quota
+            credential = auth.pool.acquire() if auth.pool is not None else None
             try:
-                # Create a new session for each request attempt to avoid "Event loop is closed" errors
-                async with await self._create_session() as session:
-                    async with session.request(
-                        method=method,
-                        url=url,
-                        params=params,
-                        json=json_data,
-                        data=data,
-                        headers=final_headers,
-                        **kwargs,
-                    ) as response:
-                        # Handle different response types
-                        content_type = response.headers.get("Content-Type", "")
-
-                        if response.status >= 400:
-                            error_text = await response.text()
+                if credential is not None:
+                    rate_limiter = credential.rate_limiter
+                    auth_headers = credential.headers
+                else:
+                    rate_limiter = getattr(self, "rate_limiter", None)
+                    auth_headers = await auth.get_auth_headers()
+
+                # Wait for rate limit slot
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+
+                # Merge headers
+                final_headers = {**auth_headers}
+                if headers:
+                    final_headers.update(headers)
+                final_headers.update(conditional_headers)
+
+                # Reuse the pooled session so connections stay alive between calls
+                session = await self._get_session()
+                async with session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json_data,
+                    data=data,
+                    headers=final_headers,
+                    **kwargs,
+                ) as response:
+                    # Handle different response types
+                    content_type = response.headers.get("Content-Type", "")
+
+                    # Any answer below 500 means the upstream is up
+                    if breaker is not None:
+                        breaker.record(response.status < 500, probe)
+                    recorded = True
+
+                    # Follow the quota reported by the upstream API
+                    rate_info = parse_rate_limit_headers(response.headers)
+                    if rate_info and rate_limiter is not None:
+                        await rate_limiter.update_from_headers(rate_info)
+
+                    # Switch to another pooled credential instead of waiting
+                    if (
+                        credential is not None
+                        and response.status in (401, 429)
+                        and attempt < policy.max_retries
+                    ):
+                        auth.pool.quarantine(
+                            credential,
+                            f"HTTP {response.status}",
+                            (
+                                self._rate_limit_wait(rate_info)
+                                if response.status == 429
+                                else None
+                            ),
+                        )
+                        if auth.pool.has_available():
+                            continue
+
+                    if response.status >= 400:
+                        error_text = await response.text()
+
+                        # Retry-After wins over backoff; a 429 may also name
+                        # the rate limit reset instead
+                        if response.status == 429:
+                            retry_after = self._rate_limit_wait(rate_info)
+                        else:
+                            retry_after = rate_info["retry_after"] if rate_info else None
+
+                        delay = policy.get_delay(
+                            method,
+                            attempt,
+                            status=response.status,
+                            retry_after=retry_after,
+                            keyed=keyed,
+                        )
+                        if delay is None:
                             raise APIError(
                                 f"API error {response.status}: {error_text}",
                                 status_code=response.status,
                                 response_text=error_text,
                             )
 
-                        if "application/json" in content_type:
-                            result = await response.json()
+                        # Hand the connection back to the pool before waiting
+                        response.release()
+                        if retry_after is not None:
+                            # The upstream asked every caller to back off
+                            print(
+                                f"⏳ Upstream returned {response.status}, resuming in {delay:.1f}s"
+                            )
+                            await self._wait_for_rate_limit_reset(delay, rate_limiter)
                         else:
-                            text_content = await response.text()
-                            result = {"content": text_content, "content_type": content_type}
-
-                        # Log successful response
+                            print(
+                                f"⚠️ Upstream returned {response.status} (attempt {attempt + 1}/{policy.max_retries + 1}), retrying in {delay:.1f}s"
+                            )
+                            await asyncio.sleep(delay)
+                        continue
+
+                    if response.status == 304 and stored is not None:
+                        # Our copy is still current - serve the stored body
+                        self.validators.record_not_modified(stored)
+                        content_type = stored["content_type"]
+                        text_content = stored["body"]
                         if config.mcp.debug:
-                            print(f"✅ Response received ({len(str(result))} chars)")
+                            print(f"♻️ Not modified: {url}")
+                    else:
+                        text_content = await response.text()
+                        etag = response.headers.get("ETag")
+                        last_modified = response.headers.get("Last-Modified")
+                        if validator_key and response.status == 200 and (
+                            etag or last_modified
+                        ):
+                            self.validators.set(
+                                validator_key,
+                                etag,
+                                last_modified,
+                                content_type,
+                                text_content,
+                            )
+
+                    if "application/json" in content_type:
+                        result = (
+                            json.loads(text_content) if text_content.strip() else None
+                        )
+                    else:
+                        result = {"content": text_content, "content_type": content_type}
+
+                    # Log successful response
+                    if config.mcp.debug:
+                        print(f"✅ Response received ({len(str(result))} chars)")
 
-                        return result
+                    if return_headers:
+                        return result, response.headers.copy()
+                    return result
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                if attempt == max_retries:
+                if breaker is not None:
+                    breaker.record(False, probe)
+                recorded = True
+
+                delay = policy.get_delay(method, attempt, error=e, keyed=keyed)
+                if delay is None:
                     raise ConnectionError(
-                        f"Request failed after {max_retries + 1} attempts: {e}"
+                        f"Request failed after {attempt + 1} attempts: {e}"
                     )
 
-                # Exponential backoff
-                delay = base_delay * (2**attempt)
                 print(
-                    f"⚠️ Request failed (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay}s: {e}"
+                    f"⚠️ Request failed (attempt {attempt + 1}/{policy.max_retries + 1}), retrying in {delay:.1f}s: {e}"
                 )
                 await asyncio.sleep(delay)
 
+            finally:
+                # Free the probe slot of a request that never got an answer
+                if breaker is not None and not recorded:
+                    breaker.record(None, probe)
+                if credential is not None:
+                    auth.pool.release(credential)
+
+    async def _hedged_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        **kwargs,
+    ) -> Dict[Any, Any]:
+        """
+        GET that is sent a second time if the first answer is slow
+
+        The hedge goes out once the first request has been pending for the
+        hedge percentile of recent latencies. The first successful answer
+        wins and the other request is cancelled. If one request fails, the
+        other is still awaited.
+        """
+
+        def send():
+            return asyncio.ensure_future(
+                self._make_request(
+                    "GET", endpoint, params=params, headers=headers, **kwargs
+                )
+            )
+
+        if not self.hedging.enabled:
+            return await self._make_request(
+                "GET", endpoint, params=params, headers=headers, **kwargs
+            )
+
+        started = time.monotonic()
+        delay = self.hedging.get_delay(endpoint)
+        primary = send()
+        pending = {primary}
+        try:
+            if delay is not None:
+                await asyncio.wait(pending, timeout=delay)
+                if not primary.done() and self.hedging.try_hedge():
+                    if config.mcp.debug:
+                        print(f"🏁 Hedging GET {endpoint} after {delay:.3f}s")
+                    pending.add(send())
+
+            errors = []
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winners = []
+                for task in done:
+                    if task.exception() is None:
+                        winners.append(task)
+                    else:
+                        errors.append((task is not primary, task.exception()))
+
+                if winners:
+                    winner = primary if primary in winners else winners[0]
+                    if winner is not primary:
+                        self.hedging.hedge_wins += 1
+                    self.hedging.record_latency(endpoint, time.monotonic() - started)
+                    return winner.result()
+
+            # Both failed: report the first request's error
+            raise min(errors, key=lambda error: error[0])[1]
+        finally:
+            # Cancel the loser, or both requests if our caller was cancelled
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _rate_limit_wait(rate_info: Optional[Dict[str, Any]]) -> Optional[float]:
+        """Get how long the upstream asked us to wait, if it said so"""
+        if not rate_info:
+            return None
+        if rate_info["retry_after"] is not None:
+            return rate_info["retry_after"]
+        return rate_info["reset_after"]
+
+    async def _wait_for_rate_limit_reset(
+        self, wait: float, rate_limiter: Optional[RateLimiter]
+    ) -> None:
+        """Hold every caller sharing the limiter until the upstream limit resets"""
+        if rate_limiter is not None:
+            # The next attempt waits for the pause when it acquires a slot
+            await rate_limiter.pause_for(wait)
+        else:
+            await asyncio.sleep(wait)
+
+    async def _coalesce(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        fetch: Callable[[], Awaitable[Dict[Any, Any]]],
+    ) -> Dict[Any, Any]:
+        """
+        Share one upstream call between identical concurrent requests
+
+        Requests are keyed on method, URL, params, extra headers, the
+        auth identity and the write generation of the resource type. The
+        first caller runs `fetch`; callers arriving while it is in flight
+        wait for the same result. A request made after a successful write
+        never joins a call that started before it.
+        """
+        if not config.api.request_coalescing or method not in IDEMPOTENT_METHODS:
+            return await fetch()
+
+        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        identity = await auth.get_identity()
+        key = (
+            id(asyncio.get_running_loop()),
+            method,
+            url,
+            json.dumps(params or {}, sort_keys=True, default=str),
+            json.dumps(headers or {}, sort_keys=True, default=str),
+            identity,
+            self._write_generations.get(resource_type_of(endpoint), 0),
+        )
+
+        entry = self._inflight.get(key)
+        leader = entry is None
+        if leader:
+            task = asyncio.ensure_future(fetch())
+            entry = self._inflight[key] = {
+                "label": f"{method} {endpoint}",
+                "task": task,
+                "waiters": 0,
+            }
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced_requests += 1
+
+        entry["waiters"] += 1
+        try:
+            # Shield so one cancelled caller does not cancel the shared call
+            result = await asyncio.shield(entry["task"])
+        finally:
+            entry["waiters"] -= 1
+
+        # Followers get their own copy so callers never share mutable state
+        return result if leader else copy.deepcopy(result)
+
+    def get_inflight_stats(self) -> Dict[str, Any]:
+        """Get in-flight shared requests and their waiter counts"""
+        return {
+            "enabled": config.api.request_coalescing,
+            "coalesced_total": self.coalesced_requests,
+            "in_flight": [
+                {"request": entry["label"], "waiters": entry["waiters"]}
+                for entry in list(self._inflight.values())
+            ],
+        }
+
     async def get(
         self,
         endpoint: str,
         params: Optional[Dict] = None,
         headers: Optional[Dict] = None,
+        use_cache: bool = True,
+        allow_stale: bool = False,
         **kwargs,
     ) -> Dict[Any, Any]:
-        """Make GET request"""
+        """
+        Make GET request, served from the response cache when possible
+
+        With `allow_stale`, an expired entry still within CACHE_MAX_STALE is
+        returned immediately and refreshed in the background.
+        """
+        use_cache = use_cache and hasattr(self, "cache")
+
+        async def fetch():
+            # Taken first, so a write landing during the fetch voids the set
+            generation = await self.cache.generation(endpoint) if use_cache else None
+            result = await self._hedged_get(endpoint, params, headers, **kwargs)
+            if use_cache:
+                await self.cache.set(endpoint, key, result, generation)
+            return result
+
+        if use_cache:
+            key = make_cache_key(
+                endpoint, params, await auth.get_identity(), headers
+            )
+            cached = await self.cache.get(endpoint, key, allow_stale=allow_stale)
+            if cached is not None:
+                value, stale = cached
+                if stale:
+                    self._revalidate(endpoint, params, headers, fetch)
+                if config.mcp.debug:
+                    print(f"⚡ Cache hit{' (stale)' if stale else ''}: GET {endpoint}")
+                return value
+
+        return await self._coalesce("GET", endpoint, params, headers, fetch)
+
+    async def get_with_headers(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        **kwargs,
+    ) -> Tuple[Any, CIMultiDict]:
+        """
+        Make GET request and also return the response headers
+
+        Used where headers carry data, e.g. `Link` pagination. Not served
+        from the response cache.
+        """
         return await self._make_request(
-            "GET", endpoint, params=params, headers=headers, **kwargs
+            "GET",
+            endpoint,
+            params=params,
+            headers=headers,
+            return_headers=True,
+            **kwargs,
         )
 
+    def _revalidate(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        fetch: Callable[[], Awaitable[Dict[Any, Any]]],
+    ) -> None:
+        """Refresh a stale cache entry without making the caller wait"""
+
+        async def refresh():
+            try:
+                await self._coalesce("GET", endpoint, params, headers, fetch)
+            except Exception as e:
+                print(f"⚠️ Background refresh of GET {endpoint} failed: {e}")
+
+        # Coalescing keeps concurrent stale hits down to one refresh
+        task = asyncio.ensure_future(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _invalidate_cache(self, endpoint: str) -> None:
+        """Drop cached reads for the resource type a write touched"""
+        if hasattr(self, "cache"):
+            await self.cache.invalidate(resource_type_of(endpoint))
+
+    async def _write(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+        data: Optional[Union[Dict, str, bytes]] = None,
+        headers: Optional[Dict] = None,
+        **kwargs,
+    ) -> Dict[Any, Any]:
+        """Send a write once per replay window, with a stable idempotency key"""
+
+        async def send(write_headers: Optional[Dict]) -> Dict[Any, Any]:
+            return await self._make_request(
+                method,
+                endpoint,
+                params=params,
+                json_data=json_data,
+                data=data,
+                headers=write_headers,
+                **kwargs,
+            )
+
+        if self.idempotency.enabled:
+            url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+            fingerprint = self.idempotency.fingerprint(
+                method,
+                url,
+                params,
+                json_data,
+                data,
+                headers,
+                await auth.get_identity(),
+            )
+            result = await self.idempotency.run(
+                fingerprint, resource_type_of(endpoint), headers, send
+            )
+        else:
+            result = await send(headers)
+
+        # Later reads must not join or cache a read from before the write
+        resource_type = resource_type_of(endpoint)
+        self._write_generations[resource_type] = (
+            self._write_generations.get(resource_type, 0) + 1
+        )
+        await self._invalidate_cache(endpoint)
+        return result
+
     async def post(
         self,
         endpoint: str,
@@ -205,7 +676,7 @@ class McpApiClient:
         **kwargs,
     ) -> Dict[Any, Any]:
         """Make POST request"""
-        return await self._make_request(
+        return await self._write(
             "POST",
             endpoint,
             params=params,
@@ -225,7 +696,7 @@ class McpApiClient:
         **kwargs,
     ) -> Dict[Any, Any]:
         """Make PUT request"""
-        return await self._make_request(
+        return await self._write(
             "PUT",
             endpoint,
             params=params,
@@ -245,7 +716,7 @@ class McpApiClient:
         **kwargs,
     ) -> Dict[Any, Any]:
         """Make PATCH request"""
-        return await self._make_request(
+        return await self._write(
             "PATCH",
             endpoint,
             params=params,
@@ -263,7 +734,7 @@ class McpApiClient:
         **kwargs,
     ) -> Dict[Any, Any]:
         """Make DELETE request"""
-        return await self._make_request(
+        return await self._write(
             "DELETE", endpoint, params=params, headers=headers, **kwargs
         )
 
@@ -280,9 +751,13 @@ class McpApiClient:
 
             for endpoint in endpoints_to_try:
                 try:
-                    response = await self.get(endpoint)
+                    # Straight to the API: no cache, coalescing or hedging
+                    await self._make_request("GET", endpoint)
                     print(f"✅ Health check passed: {endpoint}")
                     return True
+                except CircuitOpenError as e:
+                    print(f"❌ Health check failed: {e}")
+                    return False
                 except APIError as e:
                     if e.status_code == 404:
                         continue  # Try next endpoint
@@ -306,17 +781,45 @@ class McpApiClient:
             "timeout": self.timeout,
             "auth_type": "{{cookiecutter.auth_type}}",
             "rate_limiting": {"enabled": include_rate_limiting},
+            "connection_pool": {
+                "max_connections": config.api.pool_max_connections,
+                "max_per_host": config.api.pool_max_per_host,
+                "keepalive_timeout": config.api.keepalive_timeout,
+                "dns_cache_ttl": config.api.dns_cache_ttl,
+                "open_sessions": sum(
+                    1 for session in self._sessions.values() if not session.closed
+                ),
+            },
             "client_info": {
                 "user_agent": f"{{cookiecutter.project_name}}/{{cookiecutter.project_version}}",
             },
         }
 
+        info["coalescing"] = self.get_inflight_stats()
+        info["retry_policy"] = self.retry_policy.get_stats()
+        info["circuit_breakers"] = self.circuit_breakers.get_stats()
+        info["hedging"] = self.hedging.get_stats()
+        info["idempotency"] = self.idempotency.get_stats()
+        info["conditional_requests"] = {
+            "enabled": config.api.conditional_requests,
+            **self.validators.get_stats(),
+        }
+
+        # Add cache statistics if caching is enabled
+        if hasattr(self, "cache"):
+            info["cache"] = self.cache.get_stats()
+
+        # Per-credential load and quarantine state (API_KEYS / BEARER_TOKENS)
+        if auth.pool is not None:
+            info["credential_pool"] = auth.pool.get_stats()
+
         # Add rate limiting details if enabled
         if include_rate_limiting:
             info["rate_limiting"].update(
                 {
                     "max_requests": config.api.rate_limit_requests,
                     "time_window": config.api.rate_limit_window,
+                    **self.rate_limiter.get_stats(),
                 }
             )
 
@@ -374,6 +877,9 @@ async def test_client():
         print(f"❌ Client test failed: {e}")
         return False
 
+    finally:
+        await client.close()
+
 
 if __name__ == "__main__":
     import asyncio
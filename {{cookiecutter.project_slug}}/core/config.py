@@ -23,6 +23,221 @@ class APIConfig(BaseSettings):
         default=30, env="API_TIMEOUT", description="Request timeout in seconds"
     )
 
+    # Connection Pool Settings
+    pool_max_connections: int = Field(
+        default=100,
+        env="POOL_MAX_CONNECTIONS",
+        description="Max open connections in the shared HTTP pool",
+    )
+    pool_max_per_host: int = Field(
+        default=20,
+        env="POOL_MAX_PER_HOST",
+        description="Max open connections per upstream host",
+    )
+    keepalive_timeout: int = Field(
+        default=30,
+        env="KEEPALIVE_TIMEOUT",
+        description="Seconds an idle pooled connection is kept alive",
+    )
+    dns_cache_ttl: int = Field(
+        default=300, env="DNS_CACHE_TTL", description="DNS cache TTL in seconds"
+    )
+    request_coalescing: bool = Field(
+        default=True,
+        env="REQUEST_COALESCING",
+        description="Share one upstream call between identical concurrent GETs",
+    )
+    conditional_requests: bool = Field(
+        default=True,
+        env="CONDITIONAL_REQUESTS",
+        description="Revalidate GETs with If-None-Match / If-Modified-Since",
+    )
+    validator_store_max_bytes: int = Field(
+        default=20 * 1024 * 1024,
+        env="VALIDATOR_STORE_MAX_BYTES",
+        description="Max bytes of response bodies kept for 304 revalidation",
+    )
+
+    # Circuit Breaker
+    circuit_breaker: bool = Field(
+        default=True,
+        env="CIRCUIT_BREAKER",
+        description="Fail fast per endpoint prefix while the upstream is failing",
+    )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        env="CIRCUIT_FAILURE_THRESHOLD",
+        description="Consecutive failures that open a circuit",
+    )
+    circuit_reset_timeout: int = Field(
+        default=30,
+        env="CIRCUIT_RESET_TIMEOUT",
+        description="Seconds a circuit stays open before probing the upstream",
+    )
+    circuit_half_open_requests: int = Field(
+        default=1,
+        env="CIRCUIT_HALF_OPEN_REQUESTS",
+        description="Probes allowed while half-open; as many successes close it",
+    )
+
+    # Retry Policy
+    max_retries: int = Field(
+        default=3, env="MAX_RETRIES", description="Max retries per request"
+    )
+    retry_base_delay: float = Field(
+        default=1.0,
+        env="RETRY_BASE_DELAY",
+        description="Base delay in seconds for full jitter exponential backoff",
+    )
+    retry_max_delay: float = Field(
+        default=30.0,
+        env="RETRY_MAX_DELAY",
+        description="Max backoff in seconds between retries",
+    )
+    retry_methods: str = Field(
+        default="GET,HEAD,OPTIONS,PUT,DELETE",
+        env="RETRY_METHODS",
+        description="Idempotent methods that may be retried after any failure",
+    )
+    retry_statuses: str = Field(
+        default="429,502,503,504",
+        env="RETRY_STATUSES",
+        description="Retryable status codes or classes, e.g. 429,5xx",
+    )
+    retry_budget_ratio: float = Field(
+        default=0.1,
+        env="RETRY_BUDGET_RATIO",
+        description="Max retries as a share of requests (0.1 = 10%)",
+    )
+    retry_budget_burst: int = Field(
+        default=10,
+        env="RETRY_BUDGET_BURST",
+        description="Retries available before the budget has to refill",
+    )
+
+    # Idempotent Writes
+    idempotency_header: str = Field(
+        default="Idempotency-Key",
+        env="IDEMPOTENCY_HEADER",
+        description="Header carrying the idempotency key of writes (empty = off)",
+    )
+    idempotency_ttl: int = Field(
+        default=60,
+        env="IDEMPOTENCY_TTL",
+        description="Seconds a failed write's key is reused by an identical write",
+    )
+    idempotency_replay: bool = Field(
+        default=False,
+        env="IDEMPOTENCY_REPLAY",
+        description="Answer an identical write within the TTL with the last result",
+    )
+
+    # Hedged Requests
+    hedge_requests: bool = Field(
+        default=False,
+        env="HEDGE_REQUESTS",
+        description="Send a second GET when the first is slower than usual",
+    )
+    hedge_percentile: float = Field(
+        default=95.0,
+        env="HEDGE_PERCENTILE",
+        description="Latency percentile after which the hedge is sent",
+    )
+    hedge_min_samples: int = Field(
+        default=20,
+        env="HEDGE_MIN_SAMPLES",
+        description="Latencies observed per endpoint before hedging starts",
+    )
+    hedge_budget_ratio: float = Field(
+        default=0.05,
+        env="HEDGE_BUDGET_RATIO",
+        description="Max hedges as a share of GET requests (0.05 = 5%)",
+    )
+    hedge_budget_burst: int = Field(
+        default=5,
+        env="HEDGE_BUDGET_BURST",
+        description="Hedges available before the budget has to refill",
+    )
+
+    # Pagination (list_all_resources)
+    pagination_strategy: str = Field(
+        default="offset",
+        env="PAGINATION_STRATEGY",
+        description="How collections are paged: offset, cursor or link",
+    )
+    pagination_page_size: int = Field(
+        default=100, env="PAGINATION_PAGE_SIZE", description="Items requested per page"
+    )
+    pagination_max_pages: int = Field(
+        default=100,
+        env="PAGINATION_MAX_PAGES",
+        description="Max pages fetched per tool call",
+    )
+    pagination_prefetch: int = Field(
+        default=4,
+        env="PAGINATION_PREFETCH",
+        description="Offset pages fetched concurrently once the total is known",
+    )
+    pagination_cursor_param: str = Field(
+        default="cursor",
+        env="PAGINATION_CURSOR_PARAM",
+        description="Query parameter carrying the cursor",
+    )
+    pagination_cursor_field: str = Field(
+        default="next_cursor",
+        env="PAGINATION_CURSOR_FIELD",
+        description="Response field with the next cursor (top level, meta or pagination)",
+    )
+
+    # Batch tools (get_resources_by_ids)
+    batch_concurrency: int = Field(
+        default=8,
+        env="BATCH_CONCURRENCY",
+        description="Upstream requests a batch tool runs at the same time",
+    )
+    batch_max_ids: int = Field(
+        default=100,
+        env="BATCH_MAX_IDS",
+        description="Max IDs per get_resources_by_ids call",
+    )
+    bulk_get_endpoint: str = Field(
+        default="",
+        env="BULK_GET_ENDPOINT",
+        description="Endpoint returning many resources by ID, e.g. /{resource_type}/batch (empty: one GET per ID)",
+    )
+    bulk_get_param: str = Field(
+        default="ids",
+        env="BULK_GET_PARAM",
+        description="Query parameter carrying the comma-separated IDs",
+    )
+    bulk_get_max_ids: int = Field(
+        default=50,
+        env="BULK_GET_MAX_IDS",
+        description="Max IDs per bulk endpoint request",
+    )
+    bulk_get_id_field: str = Field(
+        default="id",
+        env="BULK_GET_ID_FIELD",
+        description="Field matching returned items to the requested IDs",
+    )
+
+    # Bulk write tools (bulk_create/update/delete_resources)
+    bulk_chunk_size: int = Field(
+        default=10,
+        env="BULK_CHUNK_SIZE",
+        description="Items written concurrently by the bulk write tools",
+    )
+    bulk_max_items: int = Field(
+        default=1000,
+        env="BULK_MAX_ITEMS",
+        description="Max items per bulk write call",
+    )
+    bulk_stop_on_error: bool = Field(
+        default=True,
+        env="BULK_STOP_ON_ERROR",
+        description="Stop sending bulk write items after the first failure",
+    )
+
     # Authentication Configuration
     # Fields depend on the selected authentication type
     auth_type: str = "{{cookiecutter.auth_type}}"
@@ -34,11 +249,33 @@ class APIConfig(BaseSettings):
     api_key_header: str = Field(
         default="X-API-Key", env="API_KEY_HEADER", description="Header name for API key"
     )
+    api_keys: str = Field(
+        default="",
+        env="API_KEYS",
+        description="Comma-separated API keys used as a pool instead of API_KEY",
+    )
 
     # Bearer Token Authentication
     bearer_token: str = Field(
         default="", env="BEARER_TOKEN", description="Bearer token for authentication"
     )
+    bearer_tokens: str = Field(
+        default="",
+        env="BEARER_TOKENS",
+        description="Comma-separated bearer tokens pooled instead of BEARER_TOKEN",
+    )
+
+    # Credential Pool (API_KEYS / BEARER_TOKENS)
+    credential_selection: str = Field(
+        default="least_loaded",
+        env="CREDENTIAL_SELECTION",
+        description="How pooled credentials are picked: least_loaded or round_robin",
+    )
+    credential_quarantine: int = Field(
+        default=60,
+        env="CREDENTIAL_QUARANTINE",
+        description="Seconds a credential is skipped after a 401 (429: Retry-After)",
+    )
 
     # OAuth2 Authentication
     client_id: str = Field(default="", env="CLIENT_ID", description="OAuth2 client ID")
@@ -53,6 +290,48 @@ class APIConfig(BaseSettings):
         env="OAUTH_REDIRECT_URI",
         description="OAuth2 redirect URI",
     )
+    oauth_token_url: str = Field(
+        default="",
+        env="OAUTH_TOKEN_URL",
+        description="OAuth2 token endpoint (default: API_BASE_URL/oauth/token)",
+    )
+    token_store: str = Field(
+        default="auto",
+        env="TOKEN_STORE",
+        description="Where OAuth2 tokens are persisted: auto, file, redis or none",
+    )
+    token_store_path: str = Field(
+        default=".tokens/oauth2_token",
+        env="TOKEN_STORE_PATH",
+        description="Encrypted token file used by the file token store",
+    )
+    token_store_key: str = Field(
+        default="",
+        env="TOKEN_STORE_KEY",
+        description="Fernet key for stored tokens (default: from CLIENT_SECRET)",
+    )
+
+    # Token Refresh (Bearer Token and OAuth2)
+    token_refresh_fraction: float = Field(
+        default=0.8,
+        env="TOKEN_REFRESH_FRACTION",
+        description="Refresh tokens in background after this fraction of expires_in",
+    )
+    token_refresh_jitter: float = Field(
+        default=0.1,
+        env="TOKEN_REFRESH_JITTER",
+        description="Random fraction of expires_in taken off the refresh time",
+    )
+    token_refresh_retry_delay: int = Field(
+        default=5,
+        env="TOKEN_REFRESH_RETRY_DELAY",
+        description="Initial delay in seconds before retrying a failed refresh",
+    )
+    token_refresh_max_delay: int = Field(
+        default=300,
+        env="TOKEN_REFRESH_MAX_DELAY",
+        description="Max delay in seconds between refresh retries",
+    )
 
     # Basic Auth Authentication
     username: str = Field(
@@ -74,6 +353,31 @@ class APIConfig(BaseSettings):
         env="RATE_LIMIT_WINDOW",
         description="Rate limit time window in seconds",
     )
+    rate_limit_burst: int = Field(
+        default=0,
+        env="RATE_LIMIT_BURST",
+        description="Max requests sent back-to-back (0 = RATE_LIMIT_REQUESTS)",
+    )
+    rate_limit_backend: str = Field(
+        default="local",
+        env="RATE_LIMIT_BACKEND",
+        description="Rate limiter backend: local (per process) or redis (global)",
+    )
+    rate_limit_key: str = Field(
+        default="{{cookiecutter.project_slug}}:rate_limit",
+        env="RATE_LIMIT_KEY",
+        description="Redis key holding the shared rate limit state",
+    )
+    rate_limit_adaptive: bool = Field(
+        default=True,
+        env="RATE_LIMIT_ADAPTIVE",
+        description="Follow upstream X-RateLimit/RateLimit headers",
+    )
+    rate_limit_max_wait: int = Field(
+        default=60,
+        env="RATE_LIMIT_MAX_WAIT",
+        description="Max seconds to honor Retry-After or a rate limit reset",
+    )
 
     @property
     def full_api_url(self) -> str:
@@ -104,6 +408,79 @@ class MCPConfig(BaseSettings):
     debug: bool = Field(default=False, env="DEBUG")
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     environment: str = Field(default="development", env="ENVIRONMENT")
+    tool_timeout: int = Field(
+        default=60, env="TOOL_TIMEOUT", description="Tool execution timeout in seconds"
+    )
+    tool_queue_size: int = Field(
+        default=100,
+        env="TOOL_QUEUE_SIZE",
+        description="Max pending calls queued on the sync tool runner",
+    )
+    data_queue_size: int = Field(
+        default=1000,
+        env="DATA_QUEUE_SIZE",
+        description="Max tool results waiting to be saved; more are dropped",
+    )
+    data_batch_size: int = Field(
+        default=100,
+        env="DATA_BATCH_SIZE",
+        description="Max tool results written per batch",
+    )
+    data_flush_interval: float = Field(
+        default=1.0,
+        env="DATA_FLUSH_INTERVAL",
+        description="Seconds the data writer waits for records before checking again",
+    )
+    data_segment_max_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        env="DATA_SEGMENT_MAX_BYTES",
+        description="Size at which the active data segment is rotated",
+    )
+    data_segment_max_age: int = Field(
+        default=3600,
+        env="DATA_SEGMENT_MAX_AGE",
+        description="Seconds after which the active data segment is rotated",
+    )
+    data_compression: str = Field(
+        default="gzip",
+        env="DATA_COMPRESSION",
+        description="Compression of closed data segments: gzip, zstd or none",
+    )
+    data_retention_bytes: int = Field(
+        default=200 * 1024 * 1024,
+        env="DATA_RETENTION_BYTES",
+        description="Max bytes of closed data segments kept (0 = no limit)",
+    )
+    data_retention_days: float = Field(
+        default=7,
+        env="DATA_RETENTION_DAYS",
+        description="Days closed data segments are kept (0 = no limit)",
+    )
+    capture_sample_rate: float = Field(
+        default=1.0,
+        env="CAPTURE_SAMPLE_RATE",
+        description="Share of tool results saved (1.0 = all, 0 = none)",
+    )
+    capture_sample_rates: str = Field(
+        default="",
+        env="CAPTURE_SAMPLE_RATES",
+        description="Per-tool sample rates, e.g. list_resources=0.1,get_api_status=0",
+    )
+    capture_errors: bool = Field(
+        default=True,
+        env="CAPTURE_ERRORS",
+        description="Always save error results, regardless of sampling and budget",
+    )
+    capture_max_bytes: int = Field(
+        default=64 * 1024,
+        env="CAPTURE_MAX_BYTES",
+        description="Max bytes per saved result; larger fields are truncated",
+    )
+    capture_bytes_per_minute: int = Field(
+        default=5 * 1024 * 1024,
+        env="CAPTURE_BYTES_PER_MINUTE",
+        description="Max bytes of results saved per minute (0 = no limit)",
+    )
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
 
@@ -114,6 +491,21 @@ class CacheConfig(BaseSettings):
 
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
     cache_ttl: int = Field(default=300, env="CACHE_TTL")
+    cache_backend: str = Field(
+        default="memory",
+        env="CACHE_BACKEND",
+        description="memory (per process) or redis (memory in front of Redis)",
+    )
+    cache_max_bytes: int = Field(
+        default=50 * 1024 * 1024,
+        env="CACHE_MAX_BYTES",
+        description="Max size of the in-process cache in bytes",
+    )
+    cache_max_stale: int = Field(
+        default=60,
+        env="CACHE_MAX_STALE",
+        description="Seconds an expired entry may be served while it refreshes",
+    )
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
@@ -125,9 +517,14 @@ class AppConfig:
         self.api = APIConfig()
         self.mcp = MCPConfig()
 
-        # Initialize cache if enabled
+        # Initialize cache if enabled (REDIS_URL is also used by the
+        # Redis rate limiter backend and token store)
         include_caching = {{cookiecutter.include_caching == "yes"}}
-        if include_caching:
+        if (
+            include_caching
+            or self.api.rate_limit_backend.lower() == "redis"
+            or self.api.token_store.lower() == "redis"
+        ):
             self.cache = CacheConfig()
 
     def validate(self) -> bool:
@@ -138,10 +535,10 @@ class AppConfig:
         auth_type = "{{cookiecutter.auth_type}}"
 
         if auth_type == "API Key":
-            if not self.api.api_key:
+            if not self.api.api_key and not self.api.api_keys:
                 missing_settings.append("API_KEY")
         elif auth_type == "Bearer Token":
-            if not self.api.bearer_token:
+            if not self.api.bearer_token and not self.api.bearer_tokens:
                 missing_settings.append("BEARER_TOKEN")
         elif auth_type == "OAuth2":
             if not self.api.client_id:
@@ -182,6 +579,7 @@ class AppConfig:
             info["rate_limit"] = (
                 f"{self.api.rate_limit_requests} requests per {self.api.rate_limit_window}s"
             )
+            info["rate_limit_backend"] = self.api.rate_limit_backend
 
         return info
 
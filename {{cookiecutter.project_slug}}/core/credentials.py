@@ -0,0 +1,196 @@
+"""
+Credential pool for {{cookiecutter.project_name}}
+Spreads requests over several API keys or tokens, each with its own quota
+Auto-generated from mcp-server-template
+"""
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+from core.rate_limit import create_rate_limiter
+
+
+class Credential:
+    """One pooled API key or token with its own rate limiter and load"""
+
+    def __init__(
+        self, credential_id: str, headers: Mapping[str, str], rate_limiter=None
+    ):
+        self.id = credential_id
+        self.headers = MappingProxyType(dict(headers))
+        self.rate_limiter = rate_limiter
+
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.quarantined_until = 0.0
+        self.last_error: Optional[str] = None
+
+
+class CredentialPool:
+    """
+    Pool of credentials used in rotation
+
+    Features:
+    - least_loaded selection picks the credential with the fewest requests
+      in flight, including requests waiting on its rate limiter
+    - round_robin selection cycles through the credentials in order
+    - Credentials answering 401 or 429 are quarantined for a while and
+      skipped; if every credential is quarantined, the one released first
+      is used
+    """
+
+    def __init__(
+        self,
+        credentials: List[Credential],
+        strategy: str = "least_loaded",
+        quarantine: float = 60,
+    ):
+        if not credentials:
+            raise ValueError("Credential pool needs at least one credential")
+        if strategy not in ("least_loaded", "round_robin"):
+            print(f"⚠️ Unknown CREDENTIAL_SELECTION '{strategy}', using least_loaded")
+            strategy = "least_loaded"
+
+        self.credentials = credentials
+        self.strategy = strategy
+        self.quarantine_seconds = quarantine
+        self._next = 0
+        self._lock = threading.Lock()
+
+        # Shared fingerprint so cached responses are reused across credentials
+        raw = json.dumps(sorted(sorted(c.headers.items()) for c in credentials))
+        self.identity = hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+    def _pick(self, now: float) -> Credential:
+        """Choose a credential (lock must be held)"""
+        available = [c for c in self.credentials if c.quarantined_until <= now]
+        if not available:
+            return min(self.credentials, key=lambda c: c.quarantined_until)
+
+        if self.strategy == "round_robin":
+            for offset in range(len(self.credentials)):
+                credential = self.credentials[
+                    (self._next + offset) % len(self.credentials)
+                ]
+                if credential.quarantined_until <= now:
+                    self._next = (self._next + offset + 1) % len(self.credentials)
+                    return credential
+
+        return min(available, key=lambda c: (c.in_flight, c.requests))
+
+    def peek(self) -> Credential:
+        """Get the credential the next request would use, without reserving it"""
+        with self._lock:
+            return self._pick(time.monotonic())
+
+    def acquire(self) -> Credential:
+        """Reserve a credential for one request; pair with release()"""
+        with self._lock:
+            credential = self._pick(time.monotonic())
+            credential.in_flight += 1
+            credential.requests += 1
+            return credential
+
+    def release(self, credential: Credential) -> None:
+        with self._lock:
+            credential.in_flight -= 1
+
+    def quarantine(
+        self, credential: Credential, reason: str, seconds: Optional[float] = None
+    ) -> None:
+        """Skip a credential for `seconds` (default: CREDENTIAL_QUARANTINE)"""
+        if seconds is None:
+            seconds = self.quarantine_seconds
+        now = time.monotonic()
+        with self._lock:
+            already_quarantined = credential.quarantined_until > now
+            credential.failures += 1
+            credential.last_error = reason
+            credential.quarantined_until = max(
+                credential.quarantined_until, now + seconds
+            )
+
+        if not already_quarantined:
+            print(f"🚧 Credential {credential.id} quarantined for {seconds:.0f}s: {reason}")
+
+    def has_available(self) -> bool:
+        """Check if any credential is currently out of quarantine"""
+        now = time.monotonic()
+        with self._lock:
+            return any(c.quarantined_until <= now for c in self.credentials)
+
+    async def close(self) -> None:
+        for credential in self.credentials:
+            if credential.rate_limiter is not None:
+                await credential.rate_limiter.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get load, failures and quarantine state per credential"""
+        now = time.monotonic()
+        with self._lock:
+            stats = [
+                {
+                    "id": c.id,
+                    "in_flight": c.in_flight,
+                    "requests": c.requests,
+                    "failures": c.failures,
+                    "quarantined_for": round(max(0.0, c.quarantined_until - now), 2),
+                    "last_error": c.last_error,
+                }
+                for c in self.credentials
+            ]
+
+        for entry, credential in zip(stats, self.credentials):
+            if credential.rate_limiter is not None:
+                entry["rate_limiter"] = credential.rate_limiter.get_stats()
+
+        return {
+            "strategy": self.strategy,
+            "size": len(self.credentials),
+            "credentials": stats,
+        }
+
+
+def create_credential_pool(
+    secrets: List[str], headers_for: Callable[[str], Mapping[str, str]]
+) -> Optional[CredentialPool]:
+    """
+    Create a pool from a list of keys or tokens
+
+    Args:
+        secrets: API keys or tokens, duplicates are ignored
+        headers_for: Builds the request headers for one secret
+    """
+    include_rate_limiting = {{cookiecutter.include_rate_limiting == "yes"}}
+
+    credentials = []
+    for secret in dict.fromkeys(secrets):
+        # Never expose the secret itself in stats or logs
+        credential_id = hashlib.sha256(secret.encode()).hexdigest()[:8]
+        rate_limiter = (
+            create_rate_limiter(key_suffix=credential_id)
+            if include_rate_limiting
+            else None
+        )
+        credentials.append(
+            Credential(credential_id, headers_for(secret), rate_limiter)
+        )
+
+    if not credentials:
+        return None
+
+    return CredentialPool(
+        credentials,
+        strategy=config.api.credential_selection.lower(),
+        quarantine=config.api.credential_quarantine,
+    )
@@ -0,0 +1,244 @@
+"""
+Background data writer for {{cookiecutter.project_name}}
+Saves tool results for debugging and monitoring off the request path,
+as an append-only segment log (read it back with core/segment_log.py)
+Auto-generated from mcp-server-template
+"""
+
+import queue
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.capture import CapturePolicy, create_capture_policy
+from core.config import config
+from core.segment_log import DATA_DIR, SegmentLog
+
+# Queued after the last record to stop the writer thread
+_STOP = object()
+
+
+class DataWriter:
+    """
+    Bounded queue of records appended to a segment log by a background thread
+
+    Tools only enqueue a record and never wait for the disk. The thread
+    appends records in batches of up to `batch_size` and checks every
+    `flush_interval` seconds whether the active segment is due for
+    rotation. When the queue is full, new records are dropped and counted
+    instead of slowing down tool calls. close() writes everything still
+    queued and closes the active segment.
+
+    The capture policy samples results before they are queued; size caps
+    and the byte budget are applied by the writer thread, so tool calls
+    never pay for serialization.
+
+    Features:
+    - Lazy start on first record
+    - Drop and write error counters
+    """
+
+    def __init__(
+        self,
+        log: SegmentLog,
+        policy: CapturePolicy,
+        max_queue: int,
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.log = log
+        self.policy = policy
+        self.max_queue = max_queue
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # Metrics
+        self._stats_lock = threading.Lock()
+        self.queued = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.batches = 0
+        self._dropping = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread if it is not running yet"""
+        if self.is_running:
+            return
+        with self._start_lock:
+            if not self.is_running:
+                self._thread = threading.Thread(
+                    target=self._run, name="data-writer", daemon=True
+                )
+                self._thread.start()
+
+    def write(
+        self, data_type: str, data: Dict[str, Any], tool: Optional[str] = None
+    ) -> bool:
+        """
+        Queue a record without blocking
+
+        Args:
+            data_type: Record type, e.g. "list_users"
+            data: Tool result; not modified, the saved record is a copy
+                with metadata added
+            tool: Tool name the sampling rate is looked up by
+                (default: data_type)
+
+        Returns:
+            False if the record was sampled out or dropped
+        """
+        if not self.policy.should_capture(tool or data_type, data):
+            return False
+
+        record = {
+            "data_type": data_type,
+            **data,
+            "saved_at": datetime.now().isoformat(),
+            "server_name": config.mcp.server_name,
+            "server_version": config.mcp.server_version,
+        }
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+                first_drop = not self._dropping
+                self._dropping = True
+            if first_drop:
+                print(f"⚠️ Data writer queue full ({self.max_queue}), dropping records")
+            return False
+
+        with self._stats_lock:
+            self.queued += 1
+            self._dropping = False
+        return True
+
+    def _run(self) -> None:
+        """Take records from the queue and write them in batches"""
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._rotate()
+                continue
+
+            batch = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                self._write_batch(batch)
+            if stop:
+                self._close_log()
+                return
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        lines = []
+        for record in batch:
+            line = self.policy.serialize(record)
+            if self.policy.admit(
+                len(line.encode("utf-8")), self.policy.is_error(record)
+            ):
+                lines.append(line)
+
+        try:
+            self.log.append_lines(lines)
+        except Exception as e:
+            print(f"❌ Error saving data: {str(e)}")
+            with self._stats_lock:
+                self.errors += len(batch)
+            return
+
+        if config.mcp.debug:
+            print(f"💾 {len(lines)} records saved to: {self.log.directory}")
+        with self._stats_lock:
+            self.written += len(lines)
+            self.batches += 1
+
+    def _rotate(self) -> None:
+        """Close the active segment once it is old enough"""
+        try:
+            self.log.maybe_rotate()
+        except Exception as e:
+            print(f"❌ Error rotating data segment: {str(e)}")
+
+    def _close_log(self) -> None:
+        try:
+            self.log.close()
+        except Exception as e:
+            print(f"❌ Error closing data segment: {str(e)}")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write the records still queued and stop the thread"""
+        with self._start_lock:
+            thread = self._thread
+            self._thread = None
+
+        if thread is None or not thread.is_alive():
+            return
+
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            print("⚠️ Data writer did not drain in time, unsaved records are lost")
+            return
+        thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and write counters"""
+        with self._stats_lock:
+            stats = {
+                "running": self.is_running,
+                "queue_depth": self._queue.qsize(),
+                "queue_size": self.max_queue,
+                "queued": self.queued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "batches": self.batches,
+            }
+        stats["capture"] = self.policy.get_stats()
+        stats["log"] = self.log.get_stats()
+        return stats
+
+
+# Global writer instance
+data_writer = DataWriter(
+    SegmentLog(
+        DATA_DIR,
+        max_bytes=config.mcp.data_segment_max_bytes,
+        max_age=config.mcp.data_segment_max_age,
+        compression=config.mcp.data_compression,
+        retention_bytes=config.mcp.data_retention_bytes,
+        retention_days=config.mcp.data_retention_days,
+    ),
+    create_capture_policy(),
+    config.mcp.data_queue_size,
+    config.mcp.data_batch_size,
+    config.mcp.data_flush_interval,
+)
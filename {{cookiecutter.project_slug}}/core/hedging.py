@@ -0,0 +1,127 @@
+"""
+Hedged requests for {{cookiecutter.project_name}}
+Cuts tail latency by racing a second GET against a slow first one
+Auto-generated from mcp-server-template
+"""
+
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.circuit_breaker import endpoint_prefix
+from core.config import config
+from core.retry import RetryBudget
+
+# Latencies kept per endpoint prefix
+LATENCY_WINDOW = 200
+
+
+class HedgePolicy:
+    """
+    Decides when a GET gets a hedge request
+
+    Latencies are tracked per endpoint prefix over the last LATENCY_WINDOW
+    requests. Once `min_samples` are known, a request still unanswered
+    after the `percentile` latency gets a second copy, and whichever answer
+    arrives first wins. Hedges spend from a budget so they add at most
+    `ratio` of the GET traffic.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        percentile: float,
+        min_samples: int,
+        budget: RetryBudget,
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_samples = max(1, min_samples)
+        self.budget = budget
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def get_delay(self, endpoint: str) -> Optional[float]:
+        """
+        Get how long to wait for the first request before hedging it
+
+        Returns:
+            Seconds to wait, or None if the request is not hedged
+        """
+        if not self.enabled:
+            return None
+
+        self.budget.deposit()
+        with self._lock:
+            latencies = self._latencies.get(endpoint_prefix(endpoint))
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+
+        return self._percentile_of(ordered)
+
+    def _percentile_of(self, ordered: list) -> float:
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return ordered[index]
+
+    def try_hedge(self) -> bool:
+        """Spend one hedge from the budget"""
+        if not self.budget.try_spend():
+            return False
+        self.hedged += 1
+        return True
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        """Record how long a caller waited for a successful answer"""
+        if not self.enabled:
+            return
+        prefix = endpoint_prefix(endpoint)
+        with self._lock:
+            latencies = self._latencies.get(prefix)
+            if latencies is None:
+                latencies = self._latencies[prefix] = deque(maxlen=LATENCY_WINDOW)
+            latencies.append(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hedge counters and the current hedge delay per endpoint"""
+        with self._lock:
+            samples = {
+                prefix: sorted(values) for prefix, values in self._latencies.items()
+            }
+
+        delays = {
+            prefix: round(self._percentile_of(ordered), 3)
+            for prefix, ordered in samples.items()
+            if len(ordered) >= self.min_samples
+        }
+
+        return {
+            "enabled": self.enabled,
+            "percentile": self.percentile,
+            "min_samples": self.min_samples,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_delays": delays,
+            "budget": self.budget.get_stats(),
+        }
+
+
+def create_hedge_policy() -> HedgePolicy:
+    """Create the hedge policy from the HEDGE_* settings"""
+    return HedgePolicy(
+        enabled=config.api.hedge_requests,
+        percentile=config.api.hedge_percentile,
+        min_samples=config.api.hedge_min_samples,
+        budget=RetryBudget(
+            config.api.hedge_budget_ratio, config.api.hedge_budget_burst
+        ),
+    )
@@ -0,0 +1,197 @@
+"""
+Idempotent writes for {{cookiecutter.project_name}}
+Idempotency keys for write requests and a short-lived table of recent writes
+Auto-generated from mcp-server-template
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+# Recent writes remembered at most
+MAX_ENTRIES = 1000
+
+
+class IdempotencyTable:
+    """
+    Recent write requests with their idempotency keys and results
+
+    Every logical write gets an idempotency key that is sent with each of
+    its retries, so the upstream can discard duplicates. An identical write
+    repeated within `ttl` seconds, e.g. a tool call replayed by the MCP
+    client:
+    - while the first one is in flight, waits for the same result
+    - after the first one failed, is sent again with the same key
+    - after the first one succeeded, is sent as a new write, or gets a
+      copy of its result if `replay_completed` is on
+
+    A successful write to a resource type forgets the other completed
+    writes to that type, so e.g. create, delete, create sends both creates.
+    """
+
+    def __init__(
+        self,
+        header: str,
+        ttl: float,
+        replay_completed: bool = False,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        self.header = header
+        self.ttl = ttl
+        self.replay_completed = replay_completed
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+        # Metrics
+        self.writes = 0
+        self.replayed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.header)
+
+    @staticmethod
+    def fingerprint(
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json_data: Any,
+        data: Any,
+        headers: Optional[Dict],
+        identity: str,
+    ) -> str:
+        """Hash everything that makes two writes the same write"""
+        raw = json.dumps(
+            [
+                id(asyncio.get_running_loop()),
+                method,
+                url,
+                params or {},
+                json_data,
+                data if isinstance(data, (dict, str)) else repr(data),
+                headers or {},
+                identity,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @staticmethod
+    def _failed(task: asyncio.Future) -> bool:
+        return task.cancelled() or task.exception() is not None
+
+    def _prune(self, now: float) -> None:
+        """Drop expired entries, then the oldest ones over max_entries"""
+        for fingerprint, entry in list(self._entries.items()):
+            if entry["expires_at"] <= now and entry["task"].done():
+                del self._entries[fingerprint]
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def _on_done(self, fingerprint: str, scope: str, task: asyncio.Future) -> None:
+        """Keep a failed write's key; forget what a successful write made stale"""
+        entry = self._entries.get(fingerprint)
+        own = entry is not None and entry["task"] is task
+
+        if self._failed(task):
+            if own:
+                entry["expires_at"] = time.monotonic() + self.ttl
+            return
+
+        # The write changed `scope`: earlier results and keys are stale
+        for other, other_entry in list(self._entries.items()):
+            if (
+                other != fingerprint
+                and other_entry["scope"] == scope
+                and other_entry["task"].done()
+            ):
+                del self._entries[other]
+
+        if own and self.replay_completed:
+            entry["expires_at"] = time.monotonic() + self.ttl
+        elif own:
+            del self._entries[fingerprint]
+
+    async def run(
+        self,
+        fingerprint: str,
+        scope: str,
+        headers: Optional[Dict],
+        send: Callable[[Dict], Awaitable[Dict[Any, Any]]],
+    ) -> Dict[Any, Any]:
+        """
+        Send a write once, with its idempotency key added to `headers`
+
+        Args:
+            fingerprint: Result of fingerprint() for the write
+            scope: Resource type the write changes
+            headers: Extra request headers of the caller
+            send: Sends the write with the given headers
+        """
+        now = time.monotonic()
+        self._prune(now)
+
+        entry = self._entries.get(fingerprint)
+        if entry is not None and entry["expires_at"] <= now and entry["task"].done():
+            entry = None
+
+        task = entry["task"] if entry is not None else None
+        failed = task is not None and task.done() and self._failed(task)
+        if task is not None and not failed:
+            self.replayed += 1
+            if config.mcp.debug:
+                print("♻️ Replayed write served from idempotency table")
+            result = await asyncio.shield(task)
+            return copy.deepcopy(result)
+
+        # A failed write is sent again under its original key
+        key = entry["key"] if entry is not None else None
+        if key is None:
+            key = (headers or {}).get(self.header) or uuid.uuid4().hex
+
+        task = asyncio.ensure_future(send({**(headers or {}), self.header: key}))
+        self._entries[fingerprint] = {
+            "key": key,
+            "task": task,
+            "scope": scope,
+            "expires_at": now + self.ttl,
+        }
+        self.writes += 1
+        task.add_done_callback(
+            lambda done: self._on_done(fingerprint, scope, done)
+        )
+
+        # Shield so a cancelled caller does not abort a write mid-flight
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "header": self.header,
+            "ttl": self.ttl,
+            "replay_completed": self.replay_completed,
+            "writes": self.writes,
+            "replayed": self.replayed,
+            "entries": len(self._entries),
+        }
+
+
+def create_idempotency_table() -> IdempotencyTable:
+    """Create the idempotency table from the IDEMPOTENCY_* settings"""
+    return IdempotencyTable(
+        header=config.api.idempotency_header,
+        ttl=config.api.idempotency_ttl,
+        replay_completed=config.api.idempotency_replay,
+    )
@@ -0,0 +1,332 @@
+"""
+Pagination for {{cookiecutter.project_name}}
+Walks the pages of a collection endpoint inside the server
+Auto-generated from mcp-server-template
+"""
+
+import asyncio
+import base64
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urljoin, urlsplit
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+STRATEGIES = ("offset", "cursor", "link")
+
+# <https://api.example.com/items?page=2>; rel="next"
+LINK_PATTERN = re.compile(r'<([^>]*)>\s*;[^,]*?rel="?([^",;]+)"?')
+
+
+def extract_items(response: Any, resource_type: str) -> List[Any]:
+    """Get the items of a list response (adjust to your API's structure)"""
+    if isinstance(response, list):
+        return response
+    if not isinstance(response, dict):
+        return []
+    items = response.get(
+        "data", response.get("items", response.get(resource_type, []))
+    )
+    return items if isinstance(items, list) else []
+
+
+def parse_link_header(value: Optional[str]) -> Dict[str, str]:
+    """Parse an RFC 8288 Link header into {rel: url}"""
+    links = {}
+    for url, rels in LINK_PATTERN.findall(value or ""):
+        for rel in rels.split():
+            links.setdefault(rel.lower(), url)
+    return links
+
+
+def encode_continuation(state: Dict[str, Any]) -> str:
+    """Pack a pagination position into an opaque token"""
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_continuation(token: str) -> Dict[str, Any]:
+    """
+    Unpack a token made by encode_continuation
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        state = json.loads(raw)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid continuation token: {e}")
+    if not isinstance(state, dict) or state.get("strategy") not in STRATEGIES:
+        raise ValueError("Invalid continuation token")
+    return state
+
+
+class Paginator:
+    """
+    Streams the items of a collection across pages
+
+    Strategies:
+    - offset: `limit` / `offset` query parameters, until the reported
+      `total` (or an empty page), or without a total until a short page
+    - cursor: `limit` plus the cursor parameter, taking the next cursor
+      from the response body, until no cursor is returned
+    - link: follows the `rel="next"` URL of the `Link` response header,
+      as long as it stays on the API base URL
+
+    Iteration stops at `max_items`, `max_bytes` of serialized items or
+    `max_pages`. `continuation` is then a token that resumes at the first
+    item not returned, even in the middle of a page.
+
+    Once an offset response reports `total`, the following pages are
+    independent: up to `prefetch` of them are requested concurrently, as
+    far apart as the last page was long, and yielded in order. Each
+    request still goes through the client's rate limiter. The latency of
+    every page is kept to tune the fan-out.
+    """
+
+    def __init__(
+        self,
+        client,
+        resource_type: str,
+        strategy: str,
+        page_size: int,
+        max_items: int,
+        max_bytes: int = 0,
+        max_pages: int = 100,
+        continuation: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: int = 1,
+    ):
+        if continuation:
+            state = decode_continuation(continuation)
+            if state.get("resource_type") != resource_type:
+                raise ValueError(
+                    "Continuation token belongs to another resource type"
+                )
+            strategy = state["strategy"]
+        else:
+            strategy = strategy.lower()
+            if strategy not in STRATEGIES:
+                raise ValueError(
+                    f"Unknown pagination strategy '{strategy}', use one of {STRATEGIES}"
+                )
+            state = {"strategy": strategy, "resource_type": resource_type}
+
+        self.client = client
+        self.resource_type = resource_type
+        self.endpoint = f"/{resource_type}"
+        self.strategy = strategy
+        self.page_size = max(1, page_size)
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.params = params or {}
+        self.prefetch = max(1, prefetch)
+        self._state = state
+        self._prefetched: Dict[int, asyncio.Task] = {}
+
+        # Progress, readable during and after iteration
+        self.pages = 0
+        self.count = 0
+        self.bytes = 0
+        self.total: Optional[int] = None
+        self.complete = False
+        self.stop_reason: Optional[str] = None
+        self.continuation: Optional[str] = None
+        self.page_latencies: List[float] = []
+        self.elapsed = 0.0
+
+    def _stop(self, reason: str, state: Dict[str, Any]) -> None:
+        self.stop_reason = reason
+        self.continuation = encode_continuation(state)
+
+    @staticmethod
+    async def _timed(request: Awaitable[Any]) -> Tuple[Any, float]:
+        """Await a request; return its result and latency in ms"""
+        start = time.monotonic()
+        result = await request
+        return result, (time.monotonic() - start) * 1000
+
+    def _get_offset_page(self, offset: int) -> Awaitable[Tuple[Any, float]]:
+        params = {**self.params, "limit": self.page_size, "offset": offset}
+        return self._timed(self.client.get(self.endpoint, params=params))
+
+    def _schedule_prefetch(
+        self, next_offset: int, step: int, wanted_items: int
+    ) -> None:
+        """Request the pages from `next_offset` on, `step` items apart"""
+        if next_offset not in self._prefetched:
+            # A page shorter than the last one moved the offsets
+            self._cancel_prefetch()
+
+        # The page being fetched now counts against max_pages
+        pages_left = self.max_pages - self.pages - 1
+        for index in range(min(self.prefetch, pages_left)):
+            offset = next_offset + index * step
+            if offset >= self.total or index * step >= wanted_items:
+                break
+            if offset not in self._prefetched:
+                self._prefetched[offset] = asyncio.create_task(
+                    self._get_offset_page(offset)
+                )
+
+    def _cancel_prefetch(self) -> None:
+        for task in self._prefetched.values():
+            if task.done():
+                if not task.cancelled():
+                    task.exception()  # Mark a failed page as handled
+            else:
+                task.cancel()
+        self._prefetched.clear()
+
+    async def _fetch(
+        self, state: Dict[str, Any]
+    ) -> Tuple[List[Any], Optional[Dict[str, Any]]]:
+        """Fetch the page at `state`; return its items and the next state"""
+        params = {**self.params, "limit": self.page_size}
+
+        if self.strategy == "offset":
+            offset = state.get("offset", 0)
+            task = self._prefetched.pop(offset, None)
+            response, latency = await (task or self._get_offset_page(offset))
+            self.page_latencies.append(latency)
+            items = extract_items(response, self.resource_type)
+            if isinstance(response, dict) and isinstance(response.get("total"), int):
+                self.total = response["total"]
+            next_offset = offset + len(items)
+            # APIs may cap pages below `limit`: with a total, only an empty
+            # page or reaching the total ends the collection
+            if self.total is not None:
+                if not items or next_offset >= self.total:
+                    return items, None
+            elif len(items) < self.page_size:
+                return items, None
+            if self.total is not None and self.prefetch > 1:
+                returned = len(items) - state.get("skip", 0)
+                self._schedule_prefetch(
+                    next_offset, len(items), self.max_items - self.count - returned
+                )
+            return items, {**state, "offset": next_offset, "skip": 0}
+
+        if self.strategy == "cursor":
+            if state.get("cursor"):
+                params[config.api.pagination_cursor_param] = state["cursor"]
+            response, latency = await self._timed(
+                self.client.get(self.endpoint, params=params)
+            )
+            self.page_latencies.append(latency)
+            items = extract_items(response, self.resource_type)
+            next_cursor = self._next_cursor(response)
+            if not next_cursor or not items:
+                return items, None
+            return items, {**state, "cursor": next_cursor, "skip": 0}
+
+        # link
+        endpoint = self.endpoint
+        if state.get("url"):
+            endpoint, params = self._split_url(state["url"])
+        (response, headers), latency = await self._timed(
+            self.client.get_with_headers(endpoint, params=params)
+        )
+        self.page_latencies.append(latency)
+        items = extract_items(response, self.resource_type)
+        links = parse_link_header(", ".join(headers.getall("Link", [])))
+        next_url = self._on_base_url(links["next"]) if "next" in links else None
+        if not next_url or not items:
+            return items, None
+        return items, {**state, "url": next_url, "skip": 0}
+
+    @staticmethod
+    def _next_cursor(response: Any) -> Optional[str]:
+        """Find the next cursor in the body, at the top level or under meta"""
+        if not isinstance(response, dict):
+            return None
+        field = config.api.pagination_cursor_field
+        containers = (response, response.get("pagination"), response.get("meta"))
+        for container in containers:
+            if isinstance(container, dict) and container.get(field):
+                return str(container[field])
+        return None
+
+    def _on_base_url(self, url: str) -> Optional[str]:
+        """Resolve a next link; refuse links leaving the API base URL"""
+        base = self.client.base_url.rstrip("/") + "/"
+        absolute = urljoin(base, url)
+        if not absolute.startswith(base):
+            print(f"⚠️ Not following next link outside the API: {absolute}")
+            return None
+        return absolute
+
+    def _split_url(self, url: str) -> Tuple[str, Dict[str, str]]:
+        """Turn an absolute next link into an endpoint and query parameters"""
+        parts = urlsplit(url)
+        base_path = urlsplit(self.client.base_url).path.rstrip("/")
+        endpoint = parts.path[len(base_path) :] or "/"
+        return endpoint, dict(parse_qsl(parts.query, keep_blank_values=True))
+
+    async def items(self) -> AsyncIterator[Any]:
+        """Yield items page by page until the collection or a cap ends"""
+        start = time.monotonic()
+        try:
+            async for item in self._iterate():
+                yield item
+        finally:
+            self._cancel_prefetch()
+            self.elapsed += time.monotonic() - start
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        state = self._state
+        while True:
+            if self.pages >= self.max_pages:
+                self._stop("max_pages", state)
+                return
+
+            page_items, next_state = await self._fetch(state)
+            self.pages += 1
+
+            skip = state.get("skip", 0)
+            for index, item in enumerate(page_items[skip:], start=skip):
+                size = len(json.dumps(item, separators=(",", ":"), default=str))
+                if self.count >= self.max_items:
+                    self._stop("max_items", {**state, "skip": index})
+                    return
+                # Always return at least one item so a token makes progress
+                over_bytes = self.max_bytes and self.bytes + size > self.max_bytes
+                if over_bytes and self.count:
+                    self._stop("max_bytes", {**state, "skip": index})
+                    return
+                self.count += 1
+                self.bytes += size
+                yield item
+
+            if next_state is None:
+                self.complete = True
+                return
+            if self.count >= self.max_items:
+                self._stop("max_items", next_state)
+                return
+            state = next_state
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Describe how far iteration got"""
+        return {
+            "strategy": self.strategy,
+            "page_size": self.page_size,
+            "pages_fetched": self.pages,
+            "items": self.count,
+            "bytes": self.bytes,
+            "total": self.total,
+            "prefetch": self.prefetch,
+            "elapsed_ms": round(self.elapsed * 1000, 1),
+            "page_latencies_ms": [round(ms, 1) for ms in self.page_latencies],
+            "complete": self.complete,
+            "stop_reason": self.stop_reason,
+            "continuation": self.continuation,
+        }
@@ -0,0 +1,464 @@
+"""
+Rate limiting for {{cookiecutter.project_name}}
+In-process token bucket and Redis-backed global GCRA limiters
+Auto-generated from mcp-server-template
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+
+# Upstream rate limit headers
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    """Parse the leading number of a header value like '100' or '100;w=60'"""
+    if value is None:
+        return None
+    head = value.split(",")[0].split(";")[0].strip()
+    try:
+        return float(head)
+    except ValueError:
+        return None
+
+
+def _seconds_until(value: Optional[float]) -> Optional[float]:
+    """Normalize a reset value that may be delta seconds or a Unix timestamp"""
+    if value is None:
+        return None
+    if value > 1_000_000_000:
+        return max(0.0, value - time.time())
+    return max(0.0, value)
+
+
+def parse_rate_limit_headers(headers) -> Optional[Dict[str, Any]]:
+    """
+    Parse upstream rate limit headers
+
+    Understands X-RateLimit-*, RateLimit-* and the structured RateLimit
+    header, plus Retry-After (seconds or HTTP date).
+
+    Returns:
+        Dict with limit, remaining, reset_after and retry_after (seconds),
+        or None if the response carries no rate limit information
+    """
+    limit = _parse_number(
+        headers.get("RateLimit-Limit") or headers.get("X-RateLimit-Limit")
+    )
+    remaining = _parse_number(
+        headers.get("RateLimit-Remaining") or headers.get("X-RateLimit-Remaining")
+    )
+    reset = _parse_number(
+        headers.get("RateLimit-Reset") or headers.get("X-RateLimit-Reset")
+    )
+
+    # Structured form: RateLimit: limit=100, remaining=50, reset=30
+    structured = headers.get("RateLimit")
+    if structured:
+        for part in structured.replace(";", ",").split(","):
+            name, _, value = part.strip().partition("=")
+            number = _parse_number(value)
+            if name == "limit" and limit is None:
+                limit = number
+            elif name in ("remaining", "r") and remaining is None:
+                remaining = number
+            elif name in ("reset", "t") and reset is None:
+                reset = number
+
+    retry_after = None
+    retry_header = headers.get("Retry-After")
+    if retry_header:
+        retry_after = _parse_number(retry_header)
+        if retry_after is None:
+            try:
+                retry_at = parsedate_to_datetime(retry_header)
+                retry_after = max(0.0, retry_at.timestamp() - time.time())
+            except (TypeError, ValueError):
+                retry_after = None
+
+    if limit is None and remaining is None and reset is None and retry_after is None:
+        return None
+
+    return {
+        "limit": int(limit) if limit is not None else None,
+        "remaining": int(remaining) if remaining is not None else None,
+        "reset_after": _seconds_until(reset),
+        "retry_after": retry_after,
+    }
+
+
+# In-process rate limiter
+class RateLimiter:
+    """
+    Rate limiter for API requests using token bucket algorithm
+
+    The bucket holds up to `burst` tokens and refills at
+    max_requests / time_window tokens per second. Each acquire reserves
+    one token under a short lock; when the bucket is empty the reservation
+    is taken on credit and the caller sleeps until its token is due, after
+    the lock is released. Reservations are handed out in arrival order,
+    so waiters are served FIFO and each acquire is O(1).
+
+    When `adaptive` is set, upstream rate limit headers clamp the bucket to
+    the quota the API reports and pace requests until its window resets.
+    Headers only ever slow the limiter down: the paced rate is capped at
+    the configured one, which is restored once the window has reset.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        time_window: int,
+        burst: int = 0,
+        adaptive: bool = False,
+    ):
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.base_rate = max_requests / time_window  # tokens per second
+        self.rate = self.base_rate
+        self.rate_reset_at = 0.0
+        self.capacity = burst if burst > 0 else max_requests
+        self.adaptive = adaptive
+
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.waiting = 0
+        self.upstream_remaining: Optional[int] = None
+
+        # Plain lock: held only for arithmetic, never across an await, and
+        # safe when tools run on more than one event loop
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update, ignoring paused time"""
+        if self.rate_reset_at and now >= self.rate_reset_at:
+            # The upstream window is over: back to the configured rate
+            self._accrue(self.rate_reset_at)
+            self.rate = self.base_rate
+            self.rate_reset_at = 0.0
+        self._accrue(now)
+
+    def _accrue(self, now: float) -> None:
+        start = max(self.updated_at, self.paused_until)
+        if now > start:
+            self.tokens = min(self.capacity, self.tokens + (now - start) * self.rate)
+            self.updated_at = now
+
+    def _reserve(self) -> float:
+        """Reserve one token and return how long to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            pause = max(0.0, self.paused_until - now)
+            if self.tokens >= 0:
+                return pause
+            return pause + -self.tokens / self.rate
+
+    def _pause(self, now: float, seconds: float) -> None:
+        """Hold back new tokens for `seconds` (lock must be held)"""
+        self._refill(now)
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = min(self.tokens, 1.0)
+
+    async def pause_for(self, seconds: float) -> None:
+        """Stop handing out tokens until the upstream limit resets"""
+        with self._lock:
+            self._pause(time.monotonic(), seconds)
+
+    async def update_from_headers(self, info: Dict[str, Any]) -> None:
+        """Follow the quota reported by upstream rate limit headers"""
+        remaining = info.get("remaining")
+        if not self.adaptive or remaining is None:
+            return
+
+        reset_after = info.get("reset_after")
+        with self._lock:
+            now = time.monotonic()
+            self.upstream_remaining = remaining
+
+            if remaining <= 0:
+                if reset_after:
+                    self._pause(now, reset_after)
+                return
+
+            self._refill(now)
+            # Never hold more tokens than the upstream still grants, and
+            # spread what is left evenly until its window resets
+            self.tokens = min(self.tokens, float(remaining))
+            if reset_after and reset_after > 0:
+                self.rate = min(self.base_rate, remaining / reset_after)
+                self.rate_reset_at = now + reset_after
+
+    def _release(self) -> None:
+        """Give back a reserved token that was never used"""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+    async def acquire(self):
+        """Wait for rate limit slot to be available"""
+        delay = self._reserve()
+        if delay <= 0:
+            return
+
+        self.waiting += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._release()
+            raise
+        finally:
+            self.waiting -= 1
+
+    async def close(self) -> None:
+        """Nothing to release for the in-process limiter"""
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get current bucket state"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "backend": "local",
+                "tokens_available": max(0, int(self.tokens)),
+                "burst_capacity": self.capacity,
+                "refill_rate": round(self.rate, 4),
+                "configured_rate": round(self.base_rate, 4),
+                "waiting": self.waiting,
+                "adaptive": self.adaptive,
+                "upstream_remaining": self.upstream_remaining,
+                "paused_for": round(max(0.0, self.paused_until - time.monotonic()), 2),
+            }
+
+
+# Reserving GCRA: every call books the next emission slot and returns how
+# many milliseconds the caller must wait for it. Redis server time is used
+# so replicas with skewed clocks still share one schedule.
+GCRA_SCRIPT = """
+if redis.replicate_commands then
+    redis.replicate_commands()
+end
+local interval = tonumber(ARGV[1])
+local burst_offset = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local wait = tat - burst_offset - now
+if wait < 0 then
+    wait = 0
+end
+local new_tat = tat + interval
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now + interval))
+return wait
+"""
+
+# Push the shared schedule back so the next slot on any replica opens
+# only after ARGV[3] milliseconds (an upstream rate limit reset).
+PAUSE_SCRIPT = """
+if redis.replicate_commands then
+    redis.replicate_commands()
+end
+local interval = tonumber(ARGV[1])
+local burst_offset = tonumber(ARGV[2])
+local pause = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+local paused_tat = now + pause + burst_offset
+if paused_tat > tat then
+    redis.call('SET', KEYS[1], paused_tat, 'PX', math.ceil(paused_tat - now + interval))
+end
+return 1
+"""
+
+
+class RedisRateLimiter:
+    """
+    Distributed rate limiter sharing one budget across all replicas
+
+    Uses a GCRA script executed atomically in Redis. If Redis cannot be
+    reached, requests fall back to an in-process RateLimiter until
+    `retry_after` seconds have passed, then Redis is tried again.
+
+    Upstream rate limit resets pause the shared schedule, so every replica
+    waits for them; the sustained rate itself stays as configured.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        time_window: int,
+        burst: int = 0,
+        redis_url: str = "",
+        key: str = "rate_limit",
+        redis_client: Any = None,
+        retry_after: float = 30.0,
+        adaptive: bool = False,
+    ):
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.capacity = burst if burst > 0 else max_requests
+        self.interval_ms = time_window * 1000 / max_requests
+        self.redis_url = redis_url
+        self.key = key
+        self.retry_after = retry_after
+        self.adaptive = adaptive
+
+        # Used while Redis is unreachable
+        self.fallback = RateLimiter(
+            max_requests, time_window, burst=burst, adaptive=adaptive
+        )
+
+        # An injected client (e.g. fakeredis) is used as-is; otherwise one
+        # client is created per event loop, like the HTTP sessions
+        self._redis_client = redis_client
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._scripts: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._unavailable_until = 0.0
+
+        # Metrics
+        self.redis_acquires = 0
+        self.fallback_acquires = 0
+        self.redis_errors = 0
+        self.last_error: Optional[str] = None
+
+    def _get_script(self, source: str = GCRA_SCRIPT):
+        """Get a registered Lua script for the running loop"""
+        if self._redis_client is not None:
+            redis_client = self._redis_client
+        else:
+            loop = asyncio.get_running_loop()
+            redis_client = self._clients.get(loop)
+            if redis_client is None:
+                import redis.asyncio as redis_asyncio
+
+                redis_client = redis_asyncio.from_url(
+                    self.redis_url, socket_timeout=2, socket_connect_timeout=2
+                )
+                self._clients[loop] = redis_client
+
+        scripts = self._scripts.setdefault(redis_client, {})
+        if source not in scripts:
+            scripts[source] = redis_client.register_script(source)
+        return scripts[source]
+
+    def _redis_failed(self, error: Exception) -> None:
+        """Switch to the local limiter for a while after a Redis error"""
+        self.redis_errors += 1
+        self.last_error = str(error)
+        self._unavailable_until = time.monotonic() + self.retry_after
+        print(
+            f"⚠️ Redis rate limiter unavailable, using local limiter for {self.retry_after}s: {error}"
+        )
+
+    async def pause_for(self, seconds: float) -> None:
+        """Pause the shared schedule on every replica"""
+        await self.fallback.pause_for(seconds)
+        if time.monotonic() < self._unavailable_until:
+            return
+
+        try:
+            await self._get_script(PAUSE_SCRIPT)(
+                keys=[self.key],
+                args=[
+                    self.interval_ms,
+                    self.interval_ms * (self.capacity - 1),
+                    int(seconds * 1000),
+                ],
+            )
+        except Exception as e:
+            self._redis_failed(e)
+
+    async def acquire(self):
+        """Wait for a slot in the global budget"""
+        if time.monotonic() >= self._unavailable_until:
+            try:
+                wait_ms = await self._get_script()(
+                    keys=[self.key],
+                    args=[self.interval_ms, self.interval_ms * (self.capacity - 1)],
+                )
+            except Exception as e:
+                # Redis down or misconfigured - degrade to local limiting
+                self._redis_failed(e)
+            else:
+                self.redis_acquires += 1
+                if wait_ms > 0:
+                    await asyncio.sleep(wait_ms / 1000)
+                return
+
+        self.fallback_acquires += 1
+        await self.fallback.acquire()
+
+    async def update_from_headers(self, info: Dict[str, Any]) -> None:
+        """Pause every replica when the upstream reports an exhausted quota"""
+        remaining = info.get("remaining")
+        reset_after = info.get("reset_after")
+        if self.adaptive and remaining is not None and remaining <= 0 and reset_after:
+            await self.pause_for(reset_after)
+
+    async def close(self) -> None:
+        """Close the Redis client owned by the running loop"""
+        redis_client = self._clients.pop(asyncio.get_running_loop(), None)
+        if redis_client is not None:
+            await redis_client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter state and Redis health"""
+        return {
+            "backend": "redis",
+            "key": self.key,
+            "adaptive": self.adaptive,
+            "burst_capacity": self.capacity,
+            "redis_available": time.monotonic() >= self._unavailable_until,
+            "redis_acquires": self.redis_acquires,
+            "fallback_acquires": self.fallback_acquires,
+            "redis_errors": self.redis_errors,
+            "last_error": self.last_error,
+            "fallback": self.fallback.get_stats(),
+        }
+
+
+def create_rate_limiter(key_suffix: str = ""):
+    """
+    Create the rate limiter selected by RATE_LIMIT_BACKEND
+
+    Args:
+        key_suffix: Separates the Redis state of limiters that track
+            different quotas, e.g. one per pooled credential
+    """
+    backend = config.api.rate_limit_backend.lower()
+
+    if backend == "redis":
+        key = config.api.rate_limit_key
+        if key_suffix:
+            key = f"{key}:{key_suffix}"
+        return RedisRateLimiter(
+            config.api.rate_limit_requests,
+            config.api.rate_limit_window,
+            burst=config.api.rate_limit_burst,
+            redis_url=config.cache.redis_url,
+            key=key,
+            adaptive=config.api.rate_limit_adaptive,
+        )
+
+    if backend != "local":
+        print(f"⚠️ Unknown RATE_LIMIT_BACKEND '{backend}', using local limiter")
+
+    return RateLimiter(
+        config.api.rate_limit_requests,
+        config.api.rate_limit_window,
+        burst=config.api.rate_limit_burst,
+        adaptive=config.api.rate_limit_adaptive,
+    )
@@ -0,0 +1,197 @@
+"""
+Retry policy for {{cookiecutter.project_name}}
+Decides which failed requests are retried and how long to wait
+Auto-generated from mcp-server-template
+"""
+
+import random
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import aiohttp
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+# The upstream rejected the request without processing it, so any method
+# can be sent again
+REJECTED_STATUSES = {429}
+
+
+class RetryBudget:
+    """
+    Token bucket capping retries to a share of traffic
+
+    Every request deposits `ratio` tokens and every retry spends one, so
+    retries stay below `ratio` of requests over time. `burst` tokens are
+    available up front so a quiet client can still retry. During an
+    upstream brownout the budget runs dry and requests fail fast instead
+    of multiplying the load.
+    """
+
+    def __init__(self, ratio: float, burst: int):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = float(burst)
+        self.exhausted = 0
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.tokens = min(float(self.burst), self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ratio": self.ratio,
+                "burst": self.burst,
+                "tokens_available": round(self.tokens, 2),
+                "exhausted": self.exhausted,
+            }
+
+
+class RetryPolicy:
+    """
+    Retry rules for upstream requests
+
+    Features:
+    - Only idempotent methods are retried; other methods are retried only
+      when the request never reached the upstream or was rejected (429),
+      unless they carry an idempotency key
+    - Retryable status codes, given as codes ("503") or classes ("5xx")
+    - Full jitter exponential backoff
+    - Retry-After overrides the backoff, up to `max_retry_after` seconds
+    - Shared retry budget
+    """
+
+    def __init__(
+        self,
+        max_retries: int,
+        base_delay: float,
+        max_delay: float,
+        methods: Iterable[str],
+        statuses: Iterable[str],
+        max_retry_after: float,
+        budget: RetryBudget,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.methods = {method.strip().upper() for method in methods if method.strip()}
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+
+        self.statuses = set()
+        self.status_classes = set()
+        for status in statuses:
+            status = status.strip().lower()
+            if status.endswith("xx"):
+                self.status_classes.add(status[0])
+            elif status:
+                self.statuses.add(int(status))
+
+        # Metrics
+        self.retries = 0
+        self.gave_up = 0
+
+    def is_retryable_status(self, status: int) -> bool:
+        return status in self.statuses or str(status // 100) in self.status_classes
+
+    def record_request(self) -> None:
+        """Count one request towards the retry budget"""
+        self.budget.deposit()
+
+    def get_delay(
+        self,
+        method: str,
+        attempt: int,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        retry_after: Optional[float] = None,
+        keyed: bool = False,
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried
+
+        Args:
+            method: HTTP method of the request
+            attempt: Zero-based number of the attempt that failed
+            status: Response status, if a response was received
+            error: Transport error, if no response was received
+            retry_after: Seconds the upstream asked us to wait
+            keyed: Whether the request carries an idempotency key, which
+                makes it safe to retry whatever the method
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        idempotent = keyed or method in self.methods
+        if status is not None:
+            if not self.is_retryable_status(status):
+                return None
+            if status not in REJECTED_STATUSES and not idempotent:
+                return None
+        elif not idempotent and not isinstance(
+            error, aiohttp.ClientConnectorError
+        ):
+            # The upstream may have processed a non-idempotent request
+            return None
+
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                self.gave_up += 1
+                return None
+            delay = retry_after
+        else:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+        if not self.budget.try_spend():
+            self.gave_up += 1
+            return None
+
+        self.retries += 1
+        return delay
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get policy settings and retry counters"""
+        return {
+            "max_retries": self.max_retries,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "methods": sorted(self.methods),
+            "statuses": sorted(self.statuses)
+            + sorted(f"{c}xx" for c in self.status_classes),
+            "max_retry_after": self.max_retry_after,
+            "retries": self.retries,
+            "gave_up": self.gave_up,
+            "budget": self.budget.get_stats(),
+        }
+
+
+def create_retry_policy() -> RetryPolicy:
+    """Create the retry policy from the RETRY_* settings"""
+    return RetryPolicy(
+        max_retries=config.api.max_retries,
+        base_delay=config.api.retry_base_delay,
+        max_delay=config.api.retry_max_delay,
+        methods=config.api.retry_methods.split(","),
+        statuses=config.api.retry_statuses.split(","),
+        max_retry_after=config.api.rate_limit_max_wait,
+        budget=RetryBudget(
+            config.api.retry_budget_ratio, config.api.retry_budget_burst
+        ),
+    )
@@ -0,0 +1,207 @@
+"""
+Background event loop runner for {{cookiecutter.project_name}}
+Runs coroutines for synchronous tools on one long-lived event loop
+Auto-generated from mcp-server-template
+"""
+
+import asyncio
+import concurrent.futures
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+
+class RunnerBusyError(Exception):
+    """Raised when the runner queue is full"""
+
+    pass
+
+
+class BackgroundLoopRunner:
+    """
+    Long-lived event loop running in a background thread
+
+    Synchronous tools submit coroutines here instead of creating a new
+    thread and event loop per call. Because every call runs on the same
+    loop, pooled connections and asyncio locks are shared between calls.
+
+    Features:
+    - Lazy start on first submission
+    - Bounded queue of pending coroutines
+    - Configurable per-call timeout
+    - Queue depth metrics
+    """
+
+    def __init__(self, max_pending: int, timeout: float):
+        self.max_pending = max_pending
+        self.timeout = timeout
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+        # Metrics
+        self._stats_lock = threading.Lock()
+        self.pending = 0
+        self.max_pending_seen = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background loop is running"""
+        return self._loop is not None and self._loop.is_running()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop thread if it is not running yet"""
+        with self._start_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(
+                    target=run_loop, name="tool-runner-loop", daemon=True
+                )
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+
+                if config.mcp.debug:
+                    print("🔁 Background tool runner started")
+
+            return self._loop
+
+    def submit(
+        self, async_func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> concurrent.futures.Future:
+        """
+        Submit a coroutine function to the background loop
+
+        Waits up to the runner timeout for a free queue slot.
+
+        Returns:
+            concurrent.futures.Future with the coroutine result
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._stats_lock:
+                self.rejected += 1
+            raise RunnerBusyError(
+                f"Tool runner queue is full ({self.max_pending} pending calls)"
+            )
+
+        try:
+            loop = self._ensure_started()
+            future = asyncio.run_coroutine_threadsafe(
+                async_func(*args, **kwargs), loop
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._stats_lock:
+            self.submitted += 1
+            self.pending += 1
+            self.max_pending_seen = max(self.max_pending_seen, self.pending)
+
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: concurrent.futures.Future) -> None:
+        """Release the queue slot and record the outcome"""
+        self._slots.release()
+        with self._stats_lock:
+            self.pending -= 1
+            if future.cancelled():
+                self.timed_out += 1
+            elif future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def run(self, async_func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Run a coroutine function on the background loop and wait for its result
+
+        Raises:
+            RunnerBusyError: If the queue stays full for the whole timeout
+            concurrent.futures.TimeoutError: If the call exceeds the timeout
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is not None and running_loop is self._loop:
+            raise RuntimeError("Cannot block on the runner from its own event loop")
+
+        future = self.submit(async_func, *args, **kwargs)
+        try:
+            return future.result(timeout=self.timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Cancel pending work, stop the loop and join the thread"""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or loop.is_closed():
+            return
+
+        async def cancel_pending():
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result(timeout)
+        except Exception as e:
+            print(f"⚠️ Tool runner shutdown did not finish cleanly: {e}")
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get runner metrics including current queue depth"""
+        with self._stats_lock:
+            return {
+                "running": self.is_running,
+                "queue_depth": self.pending,
+                "max_queue_depth": self.max_pending_seen,
+                "queue_size": self.max_pending,
+                "timeout": self.timeout,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "timed_out": self.timed_out,
+                "rejected": self.rejected,
+            }
+
+
+# Global runner instance
+runner = BackgroundLoopRunner(config.mcp.tool_queue_size, config.mcp.tool_timeout)
@@ -0,0 +1,308 @@
+"""
+Segment log for {{cookiecutter.project_name}}
+Append-only JSONL segments with rotation, compression and retention
+Auto-generated from mcp-server-template
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Data directory for storing API responses
+DATA_DIR = "{{cookiecutter.project_slug}}_data"
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _load_zstd():
+    """Import zstandard, which is only needed for DATA_COMPRESSION=zstd"""
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        return None
+
+
+class SegmentLog:
+    """
+    Append-only log of JSON records split into segment files
+
+    Records are written as compact JSON lines to the active segment. The
+    segment is closed once it reaches `max_bytes` or is `max_age` seconds
+    old, compressed with gzip or zstd, and a new one is started. Closed
+    segments older than `retention_days` are deleted, then the oldest
+    ones until all segments fit in `retention_bytes`.
+
+    Not thread-safe: a single writer (the data writer thread) appends.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int,
+        max_age: float,
+        compression: str = "gzip",
+        retention_bytes: int = 0,
+        retention_days: float = 0,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.retention_bytes = retention_bytes
+        self.retention_days = retention_days
+
+        compression = compression.lower()
+        if compression == "zstd" and _load_zstd() is None:
+            print("⚠️ DATA_COMPRESSION=zstd needs 'pip install zstandard', using gzip")
+            compression = "gzip"
+        elif compression not in ("gzip", "zstd", "none"):
+            print(f"⚠️ Unknown DATA_COMPRESSION '{compression}', using gzip")
+            compression = "gzip"
+        self.compression = compression
+
+        self._file: Optional[TextIO] = None
+        self._path: Optional[Path] = None
+        self._opened_at = 0.0
+        self._size = 0
+        self._recovered = False
+
+        # Metrics
+        self.records = 0
+        self.rotations = 0
+        self.deleted_segments = 0
+
+    def _open_segment(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not self._recovered:
+            self._recovered = True
+            self._compress_leftovers()
+
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        # The pid keeps segments of several server processes apart
+        self._path = self.directory / (
+            f"{SEGMENT_PREFIX}{timestamp}-{os.getpid()}{SEGMENT_SUFFIX}"
+        )
+        self._file = open(self._path, "a", encoding="utf-8")
+        self._opened_at = time.monotonic()
+        self._size = 0
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records and flush them to disk in one write"""
+        self.append_lines(
+            json.dumps(record, separators=(",", ":"), ensure_ascii=False, default=str)
+            for record in records
+        )
+
+    def append_lines(self, lines: Iterable[str]) -> None:
+        """Append records already serialized as single-line JSON"""
+        data = "".join(line + "\n" for line in lines)
+        if not data:
+            return
+        if self._file is None:
+            self._open_segment()
+
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data.encode("utf-8"))
+        self.records += data.count("\n")
+
+        self.maybe_rotate()
+
+    def maybe_rotate(self) -> None:
+        """Close the active segment if it is too large or too old"""
+        if self._file is None:
+            return
+        if (
+            self._size >= self.max_bytes
+            or time.monotonic() - self._opened_at >= self.max_age
+        ):
+            self._close_segment()
+            self.rotations += 1
+            self.apply_retention()
+
+    def _close_segment(self) -> None:
+        path = self._path
+        self._file.close()
+        self._file = None
+        self._path = None
+        self._size = 0
+        if path is not None and path.exists():
+            self._compress(path)
+
+    def _compress(self, path: Path) -> None:
+        """Replace a closed segment by its compressed copy"""
+        if path.stat().st_size == 0:
+            path.unlink()
+            return
+        if self.compression == "none":
+            return
+
+        target = path.with_name(path.name + COMPRESSED_SUFFIXES[self.compression])
+        tmp = target.with_name(f".{target.name}.tmp")
+        try:
+            with open(path, "rb") as src:
+                if self.compression == "zstd":
+                    zstd = _load_zstd()
+                    with open(tmp, "wb") as dst:
+                        zstd.ZstdCompressor().copy_stream(src, dst)
+                else:
+                    with gzip.open(tmp, "wb") as dst:
+                        while chunk := src.read(1024 * 1024):
+                            dst.write(chunk)
+            os.replace(tmp, target)
+            path.unlink()
+        except OSError as e:
+            print(f"⚠️ Could not compress segment {path.name}: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def _leftover_cutoff(self) -> float:
+        """Uncompressed segments untouched since then are no longer written"""
+        # Segments of running processes are rotated well before max_age
+        return time.time() - self.max_age - 60
+
+    def _compress_leftovers(self) -> None:
+        """Compress segments left open by a previous run that stopped abruptly"""
+        cutoff = self._leftover_cutoff()
+        for path in list_segments(self.directory):
+            if not path.name.endswith(SEGMENT_SUFFIX):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    self._compress(path)
+            except FileNotFoundError:
+                continue
+
+    def closed_segments(self) -> List[Path]:
+        """Get the segments not being written to, oldest first"""
+        return [path for path in list_segments(self.directory) if path != self._path]
+
+    def apply_retention(self) -> None:
+        """Delete closed segments beyond the age and size limits"""
+        # Other processes append to their own uncompressed segments: only
+        # compressed ones and abandoned uncompressed ones may be deleted
+        leftover_cutoff = self._leftover_cutoff()
+        segments = []
+        for path in self.closed_segments():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.name.endswith(SEGMENT_SUFFIX) and stat.st_mtime >= leftover_cutoff:
+                continue
+            segments.append((path, stat.st_mtime, stat.st_size))
+
+        cutoff = time.time() - self.retention_days * 86400
+        total = sum(size for _, _, size in segments)
+        for path, mtime, size in segments:
+            too_old = self.retention_days > 0 and mtime < cutoff
+            too_big = self.retention_bytes > 0 and total > self.retention_bytes
+            if not (too_old or too_big):
+                continue
+            try:
+                path.unlink()
+                self.deleted_segments += 1
+                total -= size
+            except OSError as e:
+                print(f"⚠️ Could not delete segment {path.name}: {e}")
+
+    def close(self) -> None:
+        """Close and compress the active segment"""
+        if self._file is not None:
+            self._close_segment()
+            self.apply_retention()
+
+    def get_stats(self) -> Dict[str, Any]:
+        segments = self.closed_segments()
+        return {
+            "directory": str(self.directory),
+            "compression": self.compression,
+            "active_segment": self._path.name if self._path else None,
+            "active_bytes": self._size,
+            "closed_segments": len(segments),
+            "closed_bytes": sum(_size_of(path) for path in segments),
+            "records": self.records,
+            "rotations": self.rotations,
+            "deleted_segments": self.deleted_segments,
+        }
+
+
+def _size_of(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def list_segments(directory) -> List[Path]:
+    """Get all segment files in a directory, oldest first"""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    return sorted(
+        path
+        for path in directory.iterdir()
+        if path.name.startswith(SEGMENT_PREFIX) and SEGMENT_SUFFIX in path.name
+        and not path.name.endswith(".tmp")
+    )
+
+
+def _open_segment_for_reading(path: Path):
+    if path.name.endswith(COMPRESSED_SUFFIXES["gzip"]):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.name.endswith(COMPRESSED_SUFFIXES["zstd"]):
+        zstd = _load_zstd()
+        if zstd is None:
+            raise RuntimeError(f"Reading {path.name} needs 'pip install zstandard'")
+        return zstd.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def read_records(directory, data_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from all segments, oldest first
+
+    Args:
+        directory: Segment directory
+        data_type: Only yield records saved under this data type
+
+    A line cut short by a crash at the end of a segment is skipped.
+    """
+    for path in list_segments(directory):
+        try:
+            with _open_segment_for_reading(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if data_type is None or record.get("data_type") == data_type:
+                        yield record
+        except FileNotFoundError:
+            # Deleted by retention or replaced by its compressed copy
+            continue
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Print saved tool results as JSONL")
+    parser.add_argument("directory", nargs="?", default=DATA_DIR)
+    parser.add_argument("--type", dest="data_type", help="Only this data type")
+    args = parser.parse_args()
+
+    try:
+        for record in read_records(args.directory, args.data_type):
+            print(json.dumps(record, ensure_ascii=False))
+    except BrokenPipeError:
+        pass
@@ -0,0 +1,260 @@
+"""
+Token store for {{cookiecutter.project_name}}
+Persists OAuth2 tokens encrypted, in a local file or in Redis, so that
+restarts and replicas reuse valid tokens
+Auto-generated from mcp-server-template
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import sys
+import time
+import uuid
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+# Fix import path for direct execution
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.config import config
+
+# Delete the lock only if it is still ours
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def make_fernet(key: str, secret: str) -> Fernet:
+    """Use the configured key, or derive one from the client secret"""
+    if key:
+        return Fernet(key.encode())
+    digest = hashlib.sha256(f"token-store:{secret}".encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+class NullTokenStore:
+    """Token store that keeps nothing (TOKEN_STORE=none)"""
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        return None
+
+    async def save(self, token: Dict[str, Any]) -> None:
+        pass
+
+    async def acquire_lock(self, ttl: int) -> bool:
+        return True
+
+    async def release_lock(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "none"}
+
+
+class FileTokenStore(NullTokenStore):
+    """
+    Encrypted token file on local disk
+
+    Written atomically with owner-only permissions. Unreadable files, for
+    example after the key changed, are ignored.
+    """
+
+    def __init__(self, path: str, fernet: Fernet):
+        self.path = Path(path)
+        self._fernet = fernet
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        """Read and decrypt the stored token"""
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"⚠️ Could not read token store {self.path}: {e}")
+            return None
+
+        try:
+            return json.loads(self._fernet.decrypt(raw))
+        except (InvalidToken, ValueError):
+            print(f"⚠️ Ignoring unreadable token store {self.path}")
+            return None
+
+    async def save(self, token: Dict[str, Any]) -> None:
+        """Encrypt and write the token"""
+        data = self._fernet.encrypt(json.dumps(token).encode())
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not write token store {self.path}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "file", "path": str(self.path)}
+
+
+class RedisTokenStore(NullTokenStore):
+    """
+    Encrypted token shared by all replicas through Redis
+
+    A short lock lets one replica fetch a new token while the others wait
+    for it to be stored. Tokens are also written to the file store, which
+    is used while Redis is unavailable.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        key: str,
+        fernet: Fernet,
+        fallback: FileTokenStore,
+        redis_client: Any = None,
+        retry_after: float = 30.0,
+    ):
+        self.redis_url = redis_url
+        self.key = key
+        self.lock_key = f"{key}:lock"
+        self.fallback = fallback
+        self.retry_after = retry_after
+        self._fernet = fernet
+        self._lock_id = uuid.uuid4().hex
+
+        # One client per event loop unless one is injected
+        self._redis_client = redis_client
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._unavailable_until = 0.0
+        self.redis_errors = 0
+
+    def _get_redis(self):
+        if self._redis_client is not None:
+            return self._redis_client
+
+        loop = asyncio.get_running_loop()
+        redis_client = self._clients.get(loop)
+        if redis_client is None:
+            import redis.asyncio as redis_asyncio
+
+            redis_client = redis_asyncio.from_url(
+                self.redis_url, socket_timeout=2, socket_connect_timeout=2
+            )
+            self._clients[loop] = redis_client
+        return redis_client
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._unavailable_until
+
+    def _redis_failed(self, error: Exception) -> None:
+        self.redis_errors += 1
+        self._unavailable_until = time.monotonic() + self.retry_after
+        print(f"⚠️ Redis token store unavailable for {self.retry_after}s: {error}")
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        """Read the shared token, or the local file while Redis is down"""
+        if self._redis_available():
+            try:
+                raw = await self._get_redis().get(self.key)
+                if raw is None:
+                    return None
+                return json.loads(self._fernet.decrypt(raw))
+            except (InvalidToken, ValueError):
+                print("⚠️ Ignoring unreadable token in Redis")
+                return None
+            except Exception as e:
+                self._redis_failed(e)
+
+        return await self.fallback.load()
+
+    async def save(self, token: Dict[str, Any]) -> None:
+        """Share the token until it expires and keep a local copy"""
+        await self.fallback.save(token)
+
+        if self._redis_available():
+            ttl = int(token["expires_at"] - time.time())
+            if ttl <= 0:
+                return
+            try:
+                data = self._fernet.encrypt(json.dumps(token).encode())
+                await self._get_redis().set(self.key, data, ex=ttl)
+            except Exception as e:
+                self._redis_failed(e)
+
+    async def acquire_lock(self, ttl: int) -> bool:
+        """Try to become the replica that fetches the next token"""
+        if not self._redis_available():
+            return True
+        try:
+            return bool(
+                await self._get_redis().set(
+                    self.lock_key, self._lock_id, nx=True, ex=ttl
+                )
+            )
+        except Exception as e:
+            self._redis_failed(e)
+            return True
+
+    async def release_lock(self) -> None:
+        if not self._redis_available():
+            return
+        try:
+            await self._get_redis().eval(
+                RELEASE_SCRIPT, 1, self.lock_key, self._lock_id
+            )
+        except Exception as e:
+            self._redis_failed(e)
+
+    async def close(self) -> None:
+        """Close the Redis client owned by the running loop"""
+        redis_client = self._clients.pop(asyncio.get_running_loop(), None)
+        if redis_client is not None:
+            await redis_client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "redis_available": self._redis_available(),
+            "redis_errors": self.redis_errors,
+            "fallback_path": str(self.fallback.path),
+        }
+
+
+def create_token_store() -> NullTokenStore:
+    """Create the token store selected by TOKEN_STORE"""
+    backend = config.api.token_store.lower()
+    include_caching = {{cookiecutter.include_caching == "yes"}}
+    if backend == "auto":
+        backend = "redis" if include_caching else "file"
+
+    if backend == "none":
+        return NullTokenStore()
+    if backend not in ("file", "redis"):
+        print(f"⚠️ Unknown TOKEN_STORE '{backend}', using file token store")
+
+    fernet = make_fernet(config.api.token_store_key, config.api.client_secret)
+    file_store = FileTokenStore(config.api.token_store_path, fernet)
+    if backend != "redis":
+        return file_store
+
+    # Tokens of different clients or scopes never share a key
+    owner = hashlib.sha256(
+        f"{config.api.client_id}:{config.api.oauth_scope}".encode()
+    ).hexdigest()[:16]
+    return RedisTokenStore(
+        config.cache.redis_url,
+        f"{config.mcp.server_name}:oauth2_token:{owner}",
+        fernet,
+        file_store,
+    )
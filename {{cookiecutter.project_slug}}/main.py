@@ -7,6 +7,8 @@ Generated from mcp-server-template
 Author: {{cookiecutter.author_name}} <{{cookiecutter.author_email}}>
 Version: {{cookiecutter.project_version}}
 """
+import asyncio
+import concurrent.futures
 import os
 import sys
 from pathlib import Path
@@ -17,10 +19,14 @@ sys.path.insert(0, str(project_root))
 
 import json
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from core.auth import auth
+from core.batch import bulk_write, dedupe_ids, get_many, parse_records
 from core.client import client
+from core.data_writer import DATA_DIR, data_writer
+from core.pagination import Paginator
+from core.runner import RunnerBusyError, runner
 
 # Import our modules
 from core.config import config
@@ -28,9 +34,6 @@ from core.config import config
 # FastMCP import
 from mcp.server.fastmcp import FastMCP
 
-# Data directory for storing API responses
-DATA_DIR = "{{cookiecutter.project_slug}}_data"
-
 # Get port from environment (Render sets this automatically)
 PORT = int(os.environ.get("PORT", 8000))
 
@@ -38,74 +41,62 @@ PORT = int(os.environ.get("PORT", 8000))
 mcp = FastMCP(name=config.mcp.server_name, host="0.0.0.0", port=PORT)
 
 
-def save_api_data(data_type: str, data: Dict[str, Any]) -> None:
+def save_api_data(
+    data_type: str, data: Dict[str, Any], tool: Optional[str] = None
+) -> None:
     """Save API data to file for debugging and monitoring"""
-    try:
-        os.makedirs(DATA_DIR, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{data_type}_{timestamp}.json"
-        filepath = os.path.join(DATA_DIR, filename)
+    # Sampled and queued for the background writer; never blocks the tool
+    # response (see CAPTURE_* settings)
+    data_writer.write(data_type, data, tool=tool)
 
-        # Add metadata
-        data["saved_at"] = datetime.now().isoformat()
-        data["server_name"] = config.mcp.server_name
-        data["server_version"] = config.mcp.server_version
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+async def run_tool(async_func, *args, **kwargs) -> Dict[str, Any]:
+    """
+    Run an async tool implementation directly on the server's event loop
 
-        if config.mcp.debug:
-            print(f"💾 Data saved to: {filepath}")
+    Tools are registered as coroutines, so every call shares the same
+    connection pool, authentication state and rate limiter.
+    """
+    try:
+        return await asyncio.wait_for(
+            async_func(*args, **kwargs), timeout=config.mcp.tool_timeout
+        )
 
+    except asyncio.TimeoutError:
+        return {
+            "status": "error",
+            "message": f"Tool execution timed out after {config.mcp.tool_timeout} seconds",
+            "timestamp": datetime.now().isoformat(),
+        }
     except Exception as e:
-        print(f"❌ Error saving data: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Tool execution failed: {str(e)}",
+            "timestamp": datetime.now().isoformat(),
+        }
 
 
 def run_async_tool(async_func, *args, **kwargs):
     """
-    Synchronous wrapper for async tools - Required for FastMCP compatibility
+    Synchronous wrapper for async tools - Compatibility shim for sync tools
 
-    FastMCP tools must be synchronous, but our API calls are async.
-    This wrapper handles the async/sync conversion properly.
+    Built-in tools are async and use run_tool(). Keep using this wrapper
+    only for tools that have to stay synchronous: the coroutine is
+    submitted to the shared background loop instead of a fresh one.
     """
     try:
-        import asyncio
-        import concurrent.futures
-
-        try:
-            # Try to get the existing event loop
-            loop = asyncio.get_running_loop()
-
-            # If we have a running loop, we need to run in a thread
-            # to avoid "Event loop is closed" errors
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                # Use a custom runner function to ensure event loop is properly closed
-                def run_and_close_loop():
-                    # Create a new event loop for this thread
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        # Run the async function
-                        return loop.run_until_complete(async_func(*args, **kwargs))
-                    finally:
-                        # Ensure the loop is closed properly
-                        loop.close()
-                
-                future = executor.submit(run_and_close_loop)
-                result = future.result(timeout=60)  # 60 second timeout
-                return result
-
-        except RuntimeError:
-            # No running loop, safe to create new one
-            # asyncio.run handles loop creation and cleanup automatically
-            result = asyncio.run(async_func(*args, **kwargs))
-            return result
+        return runner.run(async_func, *args, **kwargs)
 
     except concurrent.futures.TimeoutError:
         return {
             "status": "error",
-            "message": "Tool execution timed out after 60 seconds",
+            "message": f"Tool execution timed out after {runner.timeout} seconds",
+            "timestamp": datetime.now().isoformat(),
+        }
+    except RunnerBusyError as e:
+        return {
+            "status": "error",
+            "message": str(e),
             "timestamp": datetime.now().isoformat(),
         }
     except Exception as e:
@@ -132,7 +123,12 @@ async def get_api_status_async() -> Dict[str, Any]:
         # Get client information
         client_info = await client.get_api_info()
 
+        # Endpoints currently failing fast
+        open_circuits = client.circuit_breakers.open_circuits()
+
         status = "healthy" if is_auth_valid and is_api_healthy else "degraded"
+        if open_circuits:
+            status = "degraded"
 
         return {
             "status": "success",
@@ -148,11 +144,18 @@ async def get_api_status_async() -> Dict[str, Any]:
                 "base_url": client_info["base_url"],
                 "timeout": client_info["timeout"],
             },
+            "circuit_breakers": {
+                "open": open_circuits,
+                **client_info["circuit_breakers"],
+            },
             "configuration": {
                 "environment": config.mcp.environment,
                 "debug_mode": config.mcp.debug,
                 "server_version": config.mcp.server_version,
             },
+            "client": client_info,
+            "tool_runner": runner.get_stats(),
+            "data_writer": data_writer.get_stats(),
         }
 
     except Exception as e:
@@ -175,7 +178,8 @@ async def list_resources_async(
 
         # Make API request - adjust endpoint based on your API
         endpoint = f"/{resource_type}"
-        response = await client.get(endpoint, params=params)
+        # Latency matters more than second-level freshness for reads
+        response = await client.get(endpoint, params=params, allow_stale=True)
 
         # Extract data (adjust based on your API response structure)
         items = response.get(
@@ -204,6 +208,47 @@ async def list_resources_async(
         }
 
 
+async def list_all_resources_async(
+    resource_type: str = "items",
+    max_items: int = 1000,
+    max_bytes: int = 1_000_000,
+    strategy: str = "",
+    page_size: int = 0,
+    continuation: str = "",
+) -> Dict[str, Any]:
+    """List a whole collection by walking its pages in the server"""
+    try:
+        paginator = Paginator(
+            client,
+            resource_type,
+            strategy=strategy or config.api.pagination_strategy,
+            page_size=page_size or config.api.pagination_page_size,
+            max_items=max_items,
+            max_bytes=max_bytes,
+            max_pages=config.api.pagination_max_pages,
+            continuation=continuation or None,
+            prefetch=config.api.pagination_prefetch,
+        )
+        print(f"📋 Listing all {resource_type} ({paginator.strategy} pagination)...")
+
+        items = [item async for item in paginator.items()]
+
+        return {
+            "status": "success",
+            "resource_type": resource_type,
+            "items": items,
+            "pagination": paginator.get_summary(),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to list all {resource_type}: {str(e)}",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
 async def get_resource_by_id_async(
     resource_type: str, resource_id: str
 ) -> Dict[str, Any]:
@@ -213,7 +258,7 @@ async def get_resource_by_id_async(
 
         # Make API request
         endpoint = f"/{resource_type}/{resource_id}"
-        response = await client.get(endpoint)
+        response = await client.get(endpoint, allow_stale=True)
 
         # Extract data (adjust based on your API response structure)
         item = response.get("data", response.get("item", response))
@@ -234,6 +279,45 @@ async def get_resource_by_id_async(
         }
 
 
+async def get_resources_by_ids_async(
+    resource_type: str, ids: List[str]
+) -> Dict[str, Any]:
+    """Get many resources by ID in one call"""
+    try:
+        unique_ids = dedupe_ids(ids)
+        if len(unique_ids) > config.api.batch_max_ids:
+            raise ValueError(
+                f"{len(unique_ids)} IDs requested, at most "
+                f"{config.api.batch_max_ids} are allowed per call"
+            )
+        print(f"🔍 Getting {len(unique_ids)} {resource_type}...")
+
+        results = await get_many(client, resource_type, unique_ids)
+        failed = sum(1 for r in results.values() if r["status"] == "error")
+
+        result = {
+            "status": "success",
+            "resource_type": resource_type,
+            "requested": len(ids),
+            "unique": len(unique_ids),
+            "succeeded": len(unique_ids) - failed,
+            "failed": failed,
+            "results": results,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if unique_ids and failed == len(unique_ids):
+            result["status"] = "error"
+            result["message"] = f"Failed to get any of the {failed} {resource_type}"
+        return result
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to get {resource_type} by IDs: {str(e)}",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
 async def create_resource_async(
     resource_type: str, data: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -321,9 +405,76 @@ async def delete_resource_async(resource_type: str, resource_id: str) -> Dict[st
         }
 
 
+async def bulk_write_async(
+    operation: str,
+    resource_type: str,
+    data: str,
+    id_field: str = "id",
+    on_error: str = "",
+) -> Dict[str, Any]:
+    """Create, update or delete many resources from a JSON array or JSON Lines"""
+    try:
+        records = parse_records(data)
+        if not records:
+            raise ValueError("No items given")
+        if len(records) > config.api.bulk_max_items:
+            raise ValueError(
+                f"{len(records)} items given, at most "
+                f"{config.api.bulk_max_items} are allowed per call"
+            )
+        on_error = (
+            on_error or ("stop" if config.api.bulk_stop_on_error else "continue")
+        ).lower()
+        if on_error not in ("stop", "continue"):
+            raise ValueError("on_error must be 'stop' or 'continue'")
+        print(f"📦 Bulk {operation} of {len(records)} {resource_type}...")
+
+        results = [
+            item_result
+            async for item_result in bulk_write(
+                client,
+                operation,
+                resource_type,
+                records,
+                id_field=id_field,
+                concurrency=config.api.bulk_chunk_size,
+                stop_on_error=on_error == "stop",
+            )
+        ]
+        failed = sum(1 for r in results if r["status"] == "error")
+        skipped = len(records) - len(results)
+
+        result = {
+            "status": "success",
+            "operation": operation,
+            "resource_type": resource_type,
+            "on_error": on_error,
+            "total": len(records),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "skipped": skipped,
+            "results": results,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if failed:
+            result["message"] = f"{failed} of {len(records)} {resource_type} failed"
+            if skipped:
+                result["message"] += f", {skipped} skipped"
+            if failed == len(results):
+                result["status"] = "error"
+        return result
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to bulk {operation} {resource_type}: {str(e)}",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
 # MCP Tool Registration
 @mcp.tool()
-def get_api_status() -> str:
+async def get_api_status() -> str:
     """
     Get {{cookiecutter.api_service_type}} API status and connectivity information.
 
@@ -336,13 +487,13 @@ def get_api_status() -> str:
     Returns:
         JSON string with complete API status information
     """
-    result = run_async_tool(get_api_status_async)
-    save_api_data("api_status", result)
+    result = await run_tool(get_api_status_async)
+    save_api_data("api_status", result, tool="get_api_status")
     return json.dumps(result, indent=2)
 
 
 @mcp.tool()
-def list_resources(
+async def list_resources(
     resource_type: str = "items", limit: int = 10, offset: int = 0
 ) -> str:
     """
@@ -362,13 +513,54 @@ def list_resources(
     Returns:
         JSON string with list of resources and pagination information
     """
-    result = run_async_tool(list_resources_async, resource_type, limit, offset)
-    save_api_data(f"list_{resource_type}", result)
+    result = await run_tool(list_resources_async, resource_type, limit, offset)
+    save_api_data(f"list_{resource_type}", result, tool="list_resources")
+    return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def list_all_resources(
+    resource_type: str = "items",
+    max_items: int = 1000,
+    max_bytes: int = 1_000_000,
+    strategy: str = "",
+    page_size: int = 0,
+    continuation: str = "",
+) -> str:
+    """
+    List a whole collection of the {{cookiecutter.api_service_type}} API in one call.
+
+    Pages are fetched inside the server until the collection ends or a
+    cap is reached. If it stops early, pass the returned
+    pagination.continuation back to read the next part.
+
+    Args:
+        resource_type: Type of resource to list (default: "items")
+        max_items: Maximum number of items to return (default: 1000)
+        max_bytes: Maximum size of the returned items in bytes (default: 1000000)
+        strategy: Pagination style of the API: "offset", "cursor" or "link"
+            (default: server setting)
+        page_size: Items per upstream page (default: server setting)
+        continuation: Token from a previous call to resume from (default: "")
+
+    Returns:
+        JSON string with the items, pages fetched and continuation token
+    """
+    result = await run_tool(
+        list_all_resources_async,
+        resource_type,
+        max_items,
+        max_bytes,
+        strategy,
+        page_size,
+        continuation,
+    )
+    save_api_data(f"list_all_{resource_type}", result, tool="list_all_resources")
     return json.dumps(result, indent=2)
 
 
 @mcp.tool()
-def get_resource_by_id(resource_type: str, resource_id: str) -> str:
+async def get_resource_by_id(resource_type: str, resource_id: str) -> str:
     """
     Get detailed information about a specific resource by ID.
 
@@ -386,13 +578,42 @@ def get_resource_by_id(resource_type: str, resource_id: str) -> str:
         }
         return json.dumps(error_result, indent=2)
 
-    result = run_async_tool(get_resource_by_id_async, resource_type, resource_id)
-    save_api_data(f"get_{resource_type}_{resource_id}", result)
+    result = await run_tool(get_resource_by_id_async, resource_type, resource_id)
+    save_api_data(
+        f"get_{resource_type}_{resource_id}", result, tool="get_resource_by_id"
+    )
+    return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def get_resources_by_ids(resource_type: str, ids: List[str]) -> str:
+    """
+    Get many resources by ID in one call.
+
+    Duplicate IDs are fetched once. Use this instead of calling
+    get_resource_by_id in a loop.
+
+    Args:
+        resource_type: Type of resource to retrieve (e.g., "users", "products")
+        ids: Unique identifiers of the resources
+
+    Returns:
+        JSON string with a success or error result per ID
+    """
+    if not resource_type or not ids:
+        error_result = {
+            "status": "error",
+            "message": "Both resource_type and ids are required",
+        }
+        return json.dumps(error_result, indent=2)
+
+    result = await run_tool(get_resources_by_ids_async, resource_type, ids)
+    save_api_data(f"get_many_{resource_type}", result, tool="get_resources_by_ids")
     return json.dumps(result, indent=2)
 
 
 @mcp.tool()
-def create_resource(resource_type: str, data: str) -> str:
+async def create_resource(resource_type: str, data: str) -> str:
     """
     Create a new resource in the {{cookiecutter.api_service_type}} API.
 
@@ -413,13 +634,13 @@ def create_resource(resource_type: str, data: str) -> str:
         error_result = {"status": "error", "message": "Invalid JSON data"}
         return json.dumps(error_result, indent=2)
 
-    result = run_async_tool(create_resource_async, resource_type, data_dict)
-    save_api_data(f"create_{resource_type}", result)
+    result = await run_tool(create_resource_async, resource_type, data_dict)
+    save_api_data(f"create_{resource_type}", result, tool="create_resource")
     return json.dumps(result, indent=2)
 
 
 @mcp.tool()
-def update_resource(resource_type: str, resource_id: str, data: str) -> str:
+async def update_resource(resource_type: str, resource_id: str, data: str) -> str:
     """
     Update an existing resource in the {{cookiecutter.api_service_type}} API.
 
@@ -444,15 +665,17 @@ def update_resource(resource_type: str, resource_id: str, data: str) -> str:
         error_result = {"status": "error", "message": "Invalid JSON data"}
         return json.dumps(error_result, indent=2)
 
-    result = run_async_tool(
+    result = await run_tool(
         update_resource_async, resource_type, resource_id, data_dict
     )
-    save_api_data(f"update_{resource_type}_{resource_id}", result)
+    save_api_data(
+        f"update_{resource_type}_{resource_id}", result, tool="update_resource"
+    )
     return json.dumps(result, indent=2)
 
 
 @mcp.tool()
-def delete_resource(resource_type: str, resource_id: str) -> str:
+async def delete_resource(resource_type: str, resource_id: str) -> str:
     """
     Delete a resource from the {{cookiecutter.api_service_type}} API.
 
@@ -470,8 +693,90 @@ def delete_resource(resource_type: str, resource_id: str) -> str:
         }
         return json.dumps(error_result, indent=2)
 
-    result = run_async_tool(delete_resource_async, resource_type, resource_id)
-    save_api_data(f"delete_{resource_type}_{resource_id}", result)
+    result = await run_tool(delete_resource_async, resource_type, resource_id)
+    save_api_data(
+        f"delete_{resource_type}_{resource_id}", result, tool="delete_resource"
+    )
+    return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def bulk_create_resources(
+    resource_type: str, data: str, on_error: str = ""
+) -> str:
+    """
+    Create many resources in the {{cookiecutter.api_service_type}} API in one call.
+
+    Several items are sent at a time. Use this instead of calling
+    create_resource in a loop.
+
+    Args:
+        resource_type: Type of resource to create (e.g., "users", "products")
+        data: JSON array of objects, or one JSON object per line (JSON Lines)
+        on_error: "stop" to stop sending items after a failure or "continue"
+            to try every item (default: server setting)
+
+    Returns:
+        JSON string with counts and the status and ID of every item
+    """
+    result = await run_tool(
+        bulk_write_async, "create", resource_type, data, "id", on_error
+    )
+    save_api_data(
+        f"bulk_create_{resource_type}", result, tool="bulk_create_resources"
+    )
+    return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def bulk_update_resources(
+    resource_type: str, data: str, id_field: str = "id", on_error: str = ""
+) -> str:
+    """
+    Update many resources in the {{cookiecutter.api_service_type}} API in one call.
+
+    Args:
+        resource_type: Type of resource to update (e.g., "users", "products")
+        data: JSON array or JSON Lines of objects, each with its ID in id_field
+        id_field: Field holding the resource ID (default: "id")
+        on_error: "stop" to stop sending items after a failure or "continue"
+            to try every item (default: server setting)
+
+    Returns:
+        JSON string with counts and the status of every item
+    """
+    result = await run_tool(
+        bulk_write_async, "update", resource_type, data, id_field, on_error
+    )
+    save_api_data(
+        f"bulk_update_{resource_type}", result, tool="bulk_update_resources"
+    )
+    return json.dumps(result, indent=2)
+
+
+@mcp.tool()
+async def bulk_delete_resources(
+    resource_type: str, data: str, id_field: str = "id", on_error: str = ""
+) -> str:
+    """
+    Delete many resources from the {{cookiecutter.api_service_type}} API in one call.
+
+    Args:
+        resource_type: Type of resource to delete (e.g., "users", "products")
+        data: JSON array or JSON Lines of IDs, or of objects with id_field
+        id_field: Field holding the resource ID in objects (default: "id")
+        on_error: "stop" to stop sending items after a failure or "continue"
+            to try every item (default: server setting)
+
+    Returns:
+        JSON string with counts and the status of every item
+    """
+    result = await run_tool(
+        bulk_write_async, "delete", resource_type, data, id_field, on_error
+    )
+    save_api_data(
+        f"bulk_delete_{resource_type}", result, tool="bulk_delete_resources"
+    )
     return json.dumps(result, indent=2)
 
 
@@ -490,10 +795,15 @@ def get_server_status() -> str:
             "available_tools": [
                 "get_api_status",
                 "list_resources",
+                "list_all_resources",
                 "get_resource_by_id",
+                "get_resources_by_ids",
                 "create_resource",
                 "update_resource",
                 "delete_resource",
+                "bulk_create_resources",
+                "bulk_update_resources",
+                "bulk_delete_resources",
             ],
             "last_updated": datetime.now().isoformat(),
         }
@@ -517,6 +827,19 @@ def get_server_status() -> str:
         content += f"- Base URL: {status_info['api_base_url']}\n"
         content += f"- Auth Type: {status_info['auth_type']}\n"
 
+        content += f"\n## Circuit Breakers\n"
+        circuits = client.circuit_breakers.get_stats()["circuits"]
+        if not client.circuit_breakers.enabled:
+            content += "- Disabled\n"
+        elif not circuits:
+            content += "- No upstream calls yet\n"
+        for prefix, circuit in sorted(circuits.items()):
+            icon = {"closed": "✅", "half_open": "🟡"}.get(circuit["state"], "🔴")
+            content += f"- {icon} `{prefix}`: {circuit['state']}"
+            if "retry_in" in circuit:
+                content += f" (probing in {circuit['retry_in']:.0f}s)"
+            content += "\n"
+
         content += f"\n---\n"
         content += f"Last updated: {status_info['last_updated']}\n"
 
@@ -549,6 +872,12 @@ users = list_resources("users", 10, 0)
 
 # List products with pagination
 products = list_resources("products", 20, 40)  # Get products 41-60
+
+# Read a whole collection in one call (pages are fetched by the server)
+all_users = list_all_resources("users", max_items=5000)
+
+# Continue where a capped call stopped
+more_users = list_all_resources("users", continuation="<pagination.continuation>")
 ```
 
 ## 3. Get Resource by ID
@@ -559,6 +888,9 @@ user = get_resource_by_id("users", "123456")
 
 # Get product by ID
 product = get_resource_by_id("products", "ABC-123")
+
+# Get many users in one call (results per ID)
+users = get_resources_by_ids("users", ["123456", "123457", "123458"])
 ```
 
 ## 4. Create Resource
@@ -595,6 +927,20 @@ updated_user = update_resource("users", "123456", update_data)
 result = delete_resource("users", "123456")
 ```
 
+## 7. Bulk Create, Update and Delete
+
+```python
+# Create many users from a JSON Lines export (or a JSON array)
+result = bulk_create_resources("users", open("users.jsonl").read())
+
+# Update many users, trying every item even if some fail
+# (each object carries its "id")
+result = bulk_update_resources("users", updated_users_json, on_error="continue")
+
+# Delete many users by ID
+result = bulk_delete_resources("users", '["123456", "123457"]')
+```
+
 ## API Response Format
 
 All API responses follow this general format:
@@ -677,6 +1023,20 @@ def get_auth_docs() -> str:
     return content
 
 
+async def serve():
+    """Run the SSE server and release shared resources on shutdown"""
+    try:
+        await mcp.run_sse_async()
+    finally:
+        await client.close()
+        if runner.is_running:
+            # Close the session owned by the sync tool runner's loop too
+            await asyncio.wrap_future(runner.submit(client.close))
+        runner.shutdown()
+        # Write the tool results still queued
+        data_writer.close()
+
+
 def main():
     """Main server entry point"""
 
@@ -713,13 +1073,13 @@ def main():
     print(f"🎯 Transport: SSE (Server-Sent Events)")
 
     print(
-        f"🔧 6 tools registered: get_api_status, list_resources, get_resource_by_id, create_resource, update_resource, delete_resource"
+        f"🔧 11 tools registered: get_api_status, list_resources, list_all_resources, get_resource_by_id, get_resources_by_ids, create_resource, update_resource, delete_resource, bulk_create_resources, bulk_update_resources, bulk_delete_resources"
     )
     print(f"✅ {{cookiecutter.project_name}} is ready!")
     print(f"💡 Use with Claude Desktop or MCP-compatible clients")
 
     # Start the MCP server
-    mcp.run(transport="sse")
+    asyncio.run(serve())
 
 
 if __name__ == "__main__":
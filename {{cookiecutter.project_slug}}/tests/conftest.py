@@ -0,0 +1,23 @@
+"""
+Test configuration for {{cookiecutter.project_name}}
+Makes the server packages importable and sets the settings they require
+Auto-generated from mcp-server-template
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Settings are read when core.config is imported, so set them first
+os.environ.setdefault("BASE_URL", "http://localhost:9")
+os.environ.setdefault("API_KEY", "test-key")
+os.environ.setdefault("BEARER_TOKEN", "test-token")
+os.environ.setdefault("CLIENT_ID", "test-client")
+os.environ.setdefault("CLIENT_SECRET", "test-secret")
+os.environ.setdefault("USERNAME", "test-user")
+os.environ.setdefault("PASSWORD", "test-password")
+os.environ.setdefault("RATE_LIMIT_REQUESTS", "100000")
+os.environ.setdefault("CACHE_BACKEND", "memory")
+os.environ.setdefault("DEBUG", "false")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,152 @@
+"""
+Tests for bulk writes and batched gets, against a fake API client
+"""
+
+import asyncio
+
+import pytest
+
+from core.batch import bulk_write, get_many, parse_records
+
+
+class FakeClient:
+    """Records concurrency; writes to IDs in `failing` raise"""
+
+    def __init__(self, failing=(), delay: float = 0.01):
+        self.failing = {str(resource_id) for resource_id in failing}
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    async def _call(self, endpoint: str):
+        self.calls.append(endpoint)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if endpoint.rsplit("/", 1)[-1] in self.failing:
+            raise RuntimeError(f"{endpoint} failed")
+
+    async def get(self, endpoint: str, **kwargs):
+        await self._call(endpoint)
+        return {"data": {"id": endpoint.rsplit("/", 1)[-1]}}
+
+    async def post(self, endpoint: str, json_data=None, headers=None):
+        await self._call(endpoint)
+        return {"data": {**json_data, "id": f"new-{json_data['n']}"}}
+
+    async def put(self, endpoint: str, json_data=None):
+        await self._call(endpoint)
+
+    async def delete(self, endpoint: str):
+        await self._call(endpoint)
+
+
+async def collect(generator):
+    return [result async for result in generator]
+
+
+def test_parse_records_accepts_arrays_and_json_lines():
+    assert parse_records('[{"id": 1}, {"id": 2}]') == [{"id": 1}, {"id": 2}]
+    assert parse_records('{"id": 1}\n\n{"id": 2}\n') == [{"id": 1}, {"id": 2}]
+    with pytest.raises(ValueError):
+        parse_records('{"id": 1}\nnot json')
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_bounds_concurrency_and_keeps_order():
+    client = FakeClient()
+    records = [{"id": number} for number in range(25)]
+
+    results = await collect(
+        bulk_write(client, "update", "users", records, concurrency=4)
+    )
+
+    assert client.peak == 4
+    assert [result["index"] for result in results] == list(range(25))
+    assert all(result["status"] == "success" for result in results)
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_does_not_wait_for_slow_items():
+    class SlowFirstClient(FakeClient):
+        async def delete(self, endpoint: str):
+            self.delay = 0.3 if endpoint.endswith("/0") else 0.01
+            await self._call(endpoint)
+
+    client = SlowFirstClient()
+    start = asyncio.get_running_loop().time()
+    await collect(bulk_write(client, "delete", "users", list(range(40)), concurrency=4))
+
+    # Chunks of 4 would each wait for their slowest item
+    assert asyncio.get_running_loop().time() - start < 0.45
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_stops_sending_after_a_failure():
+    client = FakeClient(failing={3})
+    records = [{"id": number} for number in range(50)]
+
+    results = await collect(
+        bulk_write(client, "update", "users", records, concurrency=4)
+    )
+
+    assert len(client.calls) < 50
+    assert len(results) == len(client.calls)
+    assert [result["status"] for result in results].count("error") == 1
+    assert results[3] == {
+        "index": 3,
+        "id": 3,
+        "status": "error",
+        "message": "/users/3 failed",
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_continue_tries_every_item():
+    client = FakeClient(failing={3, 7})
+    records = [{"id": number} for number in range(10)]
+
+    results = await collect(
+        bulk_write(client, "update", "users", records, stop_on_error=False)
+    )
+
+    assert len(client.calls) == 10
+    assert [result["index"] for result in results if result["status"] == "error"] == [
+        3,
+        7,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returns_new_ids():
+    client = FakeClient()
+    records = [{"n": number} for number in range(3)]
+
+    results = await collect(bulk_write(client, "create", "users", records))
+
+    assert [result["id"] for result in results] == ["new-0", "new-1", "new-2"]
+
+
+@pytest.mark.asyncio
+async def test_failed_create_has_no_id():
+    client = FakeClient(failing={"users"})
+
+    results = await collect(bulk_write(client, "create", "users", [{"id": 1, "n": 1}]))
+
+    assert results[0]["status"] == "error"
+    assert results[0]["id"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_many_reports_each_id():
+    client = FakeClient(failing={"b"})
+
+    results = await get_many(client, "users", ["a", "b", "c"])
+
+    assert list(results) == ["a", "b", "c"]
+    assert results["a"] == {"status": "success", "item": {"id": "a"}}
+    assert results["b"]["status"] == "error"
@@ -0,0 +1,81 @@
+"""
+Tests for the response cache, with fakeredis as the shared tier
+"""
+
+import fakeredis
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from core.cache import ResponseCache, make_cache_key
+
+
+def make_cache(**kwargs) -> ResponseCache:
+    return ResponseCache(ttl=60, max_bytes=1024 * 1024, **kwargs)
+
+
+def test_cache_key_ignores_header_case():
+    assert make_cache_key("/users", None, "me", {"Accept": "a"}) == make_cache_key(
+        "/users", None, "me", {"accept": "a"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_hit_returns_a_copy():
+    cache = make_cache()
+    await cache.set("/users/1", "k", {"name": "Ada"})
+
+    value, stale = await cache.get("/users/1", "k")
+    value["name"] = "changed"
+
+    assert not stale
+    assert (await cache.get("/users/1", "k"))[0] == {"name": "Ada"}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_the_resource_type_only():
+    cache = make_cache()
+    await cache.set("/users/1", "user", {"id": 1})
+    await cache.set("/orders/1", "order", {"id": 1})
+
+    await cache.invalidate("users")
+
+    assert await cache.get("/users/1", "user") is None
+    assert await cache.get("/orders/1", "order") is not None
+
+
+@pytest.mark.asyncio
+async def test_response_fetched_before_a_write_is_not_cached():
+    cache = make_cache()
+    generation = await cache.generation("/users/1")
+
+    # A write lands while the GET is in flight
+    await cache.invalidate("users")
+    await cache.set("/users/1", "k", {"name": "old"}, generation)
+
+    assert await cache.get("/users/1", "k") is None
+    assert cache.get_stats()["discarded_sets"] == 1
+
+
+@pytest.mark.asyncio
+async def test_replicas_share_the_redis_tier():
+    server = fakeredis.FakeServer()
+    first = make_cache(redis_client=FakeRedis(server=server))
+    second = make_cache(redis_client=FakeRedis(server=server))
+
+    await first.set("/users/1", "k", {"name": "Ada"})
+
+    assert (await second.get("/users/1", "k"))[0] == {"name": "Ada"}
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_replicas_in_process_tier():
+    server = fakeredis.FakeServer()
+    first = make_cache(redis_client=FakeRedis(server=server))
+    second = make_cache(redis_client=FakeRedis(server=server))
+    await first.set("/users/1", "k", {"name": "old"})
+    # Now also held in the second replica's in-process tier
+    assert await second.get("/users/1", "k") is not None
+
+    await first.invalidate("users")
+
+    assert await second.get("/users/1", "k") is None
@@ -0,0 +1,150 @@
+"""
+Tests for the API client: coalescing, retries and the circuit breaker
+
+Requests go to a local aiohttp server; authentication is stubbed out so
+the tests do not depend on the configured auth type.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.auth import auth
+from core.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from core.client import APIError, McpApiClient
+
+
+@pytest.fixture(autouse=True)
+def stub_auth(monkeypatch):
+    async def get_auth_headers():
+        return {"Content-Type": "application/json"}
+
+    async def get_identity():
+        return "test"
+
+    monkeypatch.setattr(auth, "pool", None)
+    monkeypatch.setattr(auth, "get_auth_headers", get_auth_headers)
+    monkeypatch.setattr(auth, "get_identity", get_identity)
+
+
+@asynccontextmanager
+async def serve(handler):
+    """Run `handler` for every request and yield a client pointed at it"""
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+
+    client = McpApiClient()
+    client.base_url = str(server.make_url("")).rstrip("/")
+    client.retry_policy.base_delay = 0.01
+    client.retry_policy.max_delay = 0.01
+    try:
+        yield client
+    finally:
+        await client.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_share_one_call():
+    hits = []
+
+    async def handler(request):
+        hits.append(request.path)
+        await asyncio.sleep(0.1)
+        return web.json_response({"id": 1})
+
+    async with serve(handler) as client:
+        first, second = await asyncio.gather(
+            client.get("/users/1", use_cache=False),
+            client.get("/users/1", use_cache=False),
+        )
+
+    assert first == second == {"id": 1}
+    assert first is not second
+    assert hits == ["/users/1"]
+    assert client.coalesced_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_get_after_a_write_does_not_join_an_earlier_get():
+    version = {"name": "old"}
+
+    async def handler(request):
+        if request.method == "PUT":
+            version["name"] = "new"
+            return web.json_response({})
+        body = dict(version)
+        await asyncio.sleep(0.2)
+        return web.json_response(body)
+
+    async with serve(handler) as client:
+        before = asyncio.ensure_future(client.get("/users/1", use_cache=False))
+        await asyncio.sleep(0.05)
+        await client.put("/users/1", json_data={"name": "new"})
+        after = await client.get("/users/1", use_cache=False)
+
+    assert (await before)["name"] == "old"
+    assert after["name"] == "new"
+
+
+@pytest.mark.asyncio
+async def test_retryable_status_is_retried():
+    attempts = []
+
+    async def handler(request):
+        attempts.append(request.path)
+        if len(attempts) < 3:
+            return web.Response(status=503, text="busy")
+        return web.json_response({"ok": True})
+
+    async with serve(handler) as client:
+        result = await client.get("/users", use_cache=False)
+
+    assert result == {"ok": True}
+    assert len(attempts) == 3
+
+
+@pytest.mark.asyncio
+async def test_post_is_retried_with_the_same_idempotency_key():
+    keys = []
+
+    async def handler(request):
+        keys.append(request.headers.get("Idempotency-Key"))
+        if len(keys) < 2:
+            return web.Response(status=503, text="busy")
+        return web.json_response({"id": 1})
+
+    async with serve(handler) as client:
+        result = await client.post("/users", json_data={"name": "Ada"})
+
+    assert result == {"id": 1}
+    assert len(keys) == 2
+    assert keys[0] and keys[0] == keys[1]
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_repeated_failures():
+    attempts = []
+
+    async def handler(request):
+        attempts.append(request.path)
+        return web.Response(status=500, text="down")
+
+    async with serve(handler) as client:
+        client.circuit_breakers = CircuitBreakerRegistry(True, 2, 60, 1)
+        for _ in range(2):
+            with pytest.raises(APIError):
+                await client.get("/orders/1", use_cache=False)
+
+        with pytest.raises(CircuitOpenError):
+            await client.get("/orders/2", use_cache=False)
+        # Other endpoint prefixes are not affected
+        with pytest.raises(APIError):
+            await client.get("/users/1", use_cache=False)
+
+    assert attempts == ["/orders/1", "/orders/1", "/users/1"]
@@ -0,0 +1,94 @@
+"""
+Tests for the paginator, against a fake offset-paginated collection
+"""
+
+import asyncio
+
+import pytest
+
+from core.pagination import Paginator
+
+
+class FakeCollection:
+    """Serves `total` users, at most `cap` per page"""
+
+    def __init__(self, total: int, cap: int = 1000, report_total: bool = True):
+        self.total = total
+        self.cap = cap
+        self.report_total = report_total
+        self.base_url = "http://api.test"
+        self.offsets = []
+        self.active = 0
+        self.peak = 0
+
+    async def get(self, endpoint: str, params=None, **kwargs):
+        self.offsets.append(params["offset"])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        start = params["offset"]
+        end = min(self.total, start + min(params["limit"], self.cap))
+        response = {"data": [{"id": number} for number in range(start, end)]}
+        if self.report_total:
+            response["total"] = self.total
+        return response
+
+
+async def collect(paginator: Paginator):
+    return [item["id"] async for item in paginator.items()]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_yields_every_item_in_order():
+    client = FakeCollection(total=95)
+    paginator = Paginator(
+        client, "users", "offset", page_size=10, max_items=1000, prefetch=4
+    )
+
+    assert await collect(paginator) == list(range(95))
+    assert paginator.complete
+    assert client.peak > 1
+    assert sorted(client.offsets) == list(range(0, 95, 10))
+
+
+@pytest.mark.asyncio
+async def test_pages_capped_below_the_limit_are_followed():
+    client = FakeCollection(total=45, cap=10)
+    paginator = Paginator(
+        client, "users", "offset", page_size=25, max_items=1000, prefetch=3
+    )
+
+    assert await collect(paginator) == list(range(45))
+    assert paginator.complete
+
+
+@pytest.mark.asyncio
+async def test_without_a_total_a_short_page_ends_the_collection():
+    client = FakeCollection(total=25, report_total=False)
+    paginator = Paginator(client, "users", "offset", page_size=10, max_items=1000)
+
+    assert await collect(paginator) == list(range(25))
+    assert client.offsets == [0, 10, 20]
+
+
+@pytest.mark.asyncio
+async def test_continuation_resumes_after_max_items():
+    client = FakeCollection(total=30)
+    first = Paginator(
+        client, "users", "offset", page_size=10, max_items=15, prefetch=2
+    )
+    assert await collect(first) == list(range(15))
+    assert first.stop_reason == "max_items"
+
+    second = Paginator(
+        client,
+        "users",
+        "offset",
+        page_size=10,
+        max_items=1000,
+        continuation=first.continuation,
+    )
+    assert await collect(second) == list(range(15, 30))
@@ -0,0 +1,103 @@
+"""
+Tests for the distributed rate limiter, run against fakeredis
+"""
+
+import time
+
+import fakeredis
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from core.rate_limit import RedisRateLimiter
+
+
+def make_limiter(redis_client, **kwargs) -> RedisRateLimiter:
+    # 10 requests per second: one slot every 100 ms
+    return RedisRateLimiter(10, 1, redis_client=redis_client, **kwargs)
+
+
+async def timed_acquires(limiter: RedisRateLimiter, count: int) -> float:
+    start = time.monotonic()
+    for _ in range(count):
+        await limiter.acquire()
+    return time.monotonic() - start
+
+
+@pytest.mark.asyncio
+async def test_burst_is_served_without_waiting():
+    limiter = make_limiter(FakeRedis(), burst=5)
+
+    assert await timed_acquires(limiter, 5) < 0.05
+    assert limiter.redis_acquires == 5
+    assert limiter.fallback_acquires == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_the_burst_are_paced():
+    limiter = make_limiter(FakeRedis(), burst=2)
+
+    await timed_acquires(limiter, 2)
+    # Three more slots, 100 ms apart
+    assert 0.25 <= await timed_acquires(limiter, 3) < 0.6
+
+
+@pytest.mark.asyncio
+async def test_replicas_share_one_budget():
+    server = fakeredis.FakeServer()
+    first = make_limiter(FakeRedis(server=server), burst=2)
+    second = make_limiter(FakeRedis(server=server), burst=2)
+
+    await timed_acquires(first, 2)
+    # The burst was used up by the other replica
+    assert await timed_acquires(second, 1) >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_pause_holds_every_replica():
+    server = fakeredis.FakeServer()
+    first = make_limiter(FakeRedis(server=server), burst=5)
+    second = make_limiter(FakeRedis(server=server), burst=5)
+
+    await first.pause_for(0.3)
+
+    assert await timed_acquires(second, 1) >= 0.25
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_pauses_on_exhausted_quota():
+    limiter = make_limiter(FakeRedis(), burst=5, adaptive=True)
+
+    await limiter.update_from_headers({"remaining": 0, "reset_after": 0.3})
+
+    assert await timed_acquires(limiter, 1) >= 0.25
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_limiter_when_redis_is_down():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    limiter = make_limiter(FakeRedis(server=server), burst=3, retry_after=60)
+
+    await timed_acquires(limiter, 3)
+
+    stats = limiter.get_stats()
+    assert limiter.redis_errors == 1
+    assert limiter.fallback_acquires == 3
+    assert limiter.redis_acquires == 0
+    assert not stats["redis_available"]
+    assert stats["last_error"]
+
+
+@pytest.mark.asyncio
+async def test_redis_is_tried_again_after_retry_after():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    limiter = make_limiter(FakeRedis(server=server), burst=3, retry_after=0.1)
+
+    await limiter.acquire()
+    server.connected = True
+    time.sleep(0.15)
+    await limiter.acquire()
+
+    assert limiter.fallback_acquires == 1
+    assert limiter.redis_acquires == 1
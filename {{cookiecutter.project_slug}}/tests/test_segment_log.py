@@ -0,0 +1,59 @@
+"""
+Tests for the segment log: rotation, compression, retention and reading
+"""
+
+import os
+import time
+
+from core.segment_log import SegmentLog, list_segments, read_records
+
+
+def test_rotated_segments_are_compressed_and_read_back(tmp_path):
+    log = SegmentLog(str(tmp_path), max_bytes=200, max_age=3600)
+    for number in range(20):
+        log.append([{"data_type": "users", "number": number}])
+    log.close()
+
+    names = [path.name for path in list_segments(tmp_path)]
+    assert len(names) > 1
+    assert all(name.endswith(".jsonl.gz") for name in names)
+    assert [record["number"] for record in read_records(tmp_path)] == list(range(20))
+
+
+def test_read_records_filters_by_data_type(tmp_path):
+    log = SegmentLog(str(tmp_path), max_bytes=1024, max_age=3600)
+    log.append([{"data_type": "users", "id": 1}, {"data_type": "orders", "id": 2}])
+    log.close()
+
+    assert [record["id"] for record in read_records(tmp_path, "orders")] == [2]
+
+
+def test_retention_deletes_oldest_segments_first(tmp_path):
+    log = SegmentLog(
+        str(tmp_path), max_bytes=100, max_age=3600, compression="none"
+    )
+    for number in range(10):
+        log.append([{"data_type": "users", "payload": "x" * 100, "n": number}])
+    # Closed uncompressed segments of this process, long untouched
+    for age, path in enumerate(reversed(list_segments(tmp_path)), start=1):
+        os.utime(path, (time.time() - 10000 - age, time.time() - 10000 - age))
+
+    log.retention_bytes = 300
+    log.apply_retention()
+
+    numbers = [record["n"] for record in read_records(tmp_path)]
+    assert numbers == list(range(10 - len(numbers), 10))
+    assert log.deleted_segments > 0
+
+
+def test_retention_keeps_another_process_live_segment(tmp_path):
+    live = tmp_path / "segment-20200101-000000-000000-99999.jsonl"
+    live.write_text('{"data_type":"users"}\n' * 100)
+
+    log = SegmentLog(
+        str(tmp_path), max_bytes=100, max_age=3600, retention_bytes=10
+    )
+    log.append([{"data_type": "users", "payload": "x" * 200}])
+    log.apply_retention()
+
+    assert live.exists()
@@ -35,8 +35,13 @@ def get_available_tools():
     return [
         "get_api_status",
         "list_resources",
+        "list_all_resources",
         "get_resource_by_id",
+        "get_resources_by_ids",
         "create_resource",
         "update_resource",
         "delete_resource",
+        "bulk_create_resources",
+        "bulk_update_resources",
+        "bulk_delete_resources",
     ]
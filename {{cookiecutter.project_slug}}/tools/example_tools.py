@@ -5,18 +5,23 @@ Auto-generated from mcp-server-template
 """
 
 import asyncio
+import concurrent.futures
 import json
 import os
 
 # Import our core modules
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.auth import auth
+from core.batch import bulk_write, dedupe_ids, get_many, parse_records
 from core.client import client
+from core.data_writer import data_writer
+from core.pagination import Paginator
+from core.runner import RunnerBusyError, runner
 from core.config import config
 
 # ===================================
@@ -24,50 +29,53 @@ from core.config import config
 # ===================================
 
 
-def run_async_tool(async_func, *args, **kwargs):
+async def run_tool(async_func, *args, **kwargs) -> Dict[str, Any]:
     """
-    Synchronous wrapper for async tools - Required for FastMCP compatibility
+    Run an async tool implementation directly on the server's event loop
 
-    FastMCP tools must be synchronous, but our API calls are async.
-    This wrapper handles the async/sync conversion properly.
+    Tools are registered as coroutines, so every call shares the same
+    connection pool, authentication state and rate limiter.
     """
     try:
-        import concurrent.futures
-        from datetime import datetime
+        return await asyncio.wait_for(
+            async_func(*args, **kwargs), timeout=config.mcp.tool_timeout
+        )
 
-        try:
-            # Try to get the existing event loop
-            loop = asyncio.get_running_loop()
-
-            # If we have a running loop, we need to run in a thread
-            # to avoid "Event loop is closed" errors
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                # Use a custom runner function to ensure event loop is properly closed
-                def run_and_close_loop():
-                    # Create a new event loop for this thread
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        # Run the async function
-                        return loop.run_until_complete(async_func(*args, **kwargs))
-                    finally:
-                        # Ensure the loop is closed properly
-                        loop.close()
-                
-                future = executor.submit(run_and_close_loop)
-                result = future.result(timeout=60)  # 60 second timeout
-                return result
-
-        except RuntimeError:
-            # No running loop, safe to create new one
-            # asyncio.run handles loop creation and cleanup automatically
-            result = asyncio.run(async_func(*args, **kwargs))
-            return result
+    except asyncio.TimeoutError:
+        return {
+            "status": "error",
+            "message": f"Tool execution timed out after {config.mcp.tool_timeout} seconds",
+            "timestamp": datetime.now().isoformat(),
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Tool execution failed: {str(e)}",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+def run_async_tool(async_func, *args, **kwargs):
+    """
+    Synchronous wrapper for async tools - Compatibility shim for sync tools
+
+    Built-in tools are async and use run_tool(). Keep using this wrapper
+    only for tools that have to stay synchronous: the coroutine is
+    submitted to the shared background loop instead of a fresh one.
+    """
+    try:
+        return runner.run(async_func, *args, **kwargs)
 
     except concurrent.futures.TimeoutError:
         return {
             "status": "error",
-            "message": "Tool execution timed out after 60 seconds",
+            "message": f"Tool execution timed out after {runner.timeout} seconds",
+            "timestamp": datetime.now().isoformat(),
+        }
+    except RunnerBusyError as e:
+        return {
+            "status": "error",
+            "message": str(e),
             "timestamp": datetime.now().isoformat(),
         }
     except Exception as e:
@@ -116,7 +124,12 @@ async def get_api_status_async() -> Dict[str, Any]:
         # Get client information
         client_info = await client.get_api_info()
 
+        # Endpoints currently failing fast
+        open_circuits = client.circuit_breakers.open_circuits()
+
         status = "healthy" if is_auth_valid and is_api_healthy else "degraded"
+        if open_circuits:
+            status = "degraded"
 
         return {
             "status": "success",
@@ -132,11 +145,18 @@ async def get_api_status_async() -> Dict[str, Any]:
                 "base_url": client_info["base_url"],
                 "timeout": client_info["timeout"],
             },
+            "circuit_breakers": {
+                "open": open_circuits,
+                **client_info["circuit_breakers"],
+            },
             "configuration": {
                 "environment": config.mcp.environment,
                 "debug_mode": config.mcp.debug,
                 "server_version": config.mcp.server_version,
             },
+            "client": client_info,
+            "tool_runner": runner.get_stats(),
+            "data_writer": data_writer.get_stats(),
         }
 
     except Exception as e:
@@ -169,7 +189,8 @@ async def list_resources_async(
 
         # Make API request - adjust endpoint based on your API
         endpoint = f"/{resource_type}"
-        response = await client.get(endpoint, params=params)
+        # Latency matters more than second-level freshness for reads
+        response = await client.get(endpoint, params=params, allow_stale=True)
 
         # Extract data (adjust based on your API response structure)
         items = response.get(
@@ -198,6 +219,61 @@ async def list_resources_async(
         }
 
 
+async def list_all_resources_async(
+    resource_type: str = "items",
+    max_items: int = 1000,
+    max_bytes: int = 1_000_000,
+    strategy: str = "",
+    page_size: int = 0,
+    continuation: str = "",
+) -> Dict[str, Any]:
+    """
+    List a whole collection by walking its pages in the server
+
+    Args:
+        resource_type: Type of resource to list (e.g., 'users', 'orders', 'products')
+        max_items: Stop after this many items
+        max_bytes: Stop before the serialized items exceed this size
+        strategy: offset, cursor or link (default: PAGINATION_STRATEGY)
+        page_size: Items per page (default: PAGINATION_PAGE_SIZE)
+        continuation: Token returned by a previous call, to resume there
+
+    Returns:
+        Dict containing the items and a pagination summary with a
+        continuation token if the collection was not read to the end
+    """
+    try:
+        paginator = Paginator(
+            client,
+            resource_type,
+            strategy=strategy or config.api.pagination_strategy,
+            page_size=page_size or config.api.pagination_page_size,
+            max_items=max_items,
+            max_bytes=max_bytes,
+            max_pages=config.api.pagination_max_pages,
+            continuation=continuation or None,
+            prefetch=config.api.pagination_prefetch,
+        )
+        print(f"📋 Listing all {resource_type} ({paginator.strategy} pagination)...")
+
+        items = [item async for item in paginator.items()]
+
+        return {
+            "status": "success",
+            "resource_type": resource_type,
+            "items": items,
+            "pagination": paginator.get_summary(),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to list all {resource_type}: {str(e)}",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
 async def get_resource_by_id_async(
     resource_type: str, resource_id: str
 ) -> Dict[str, Any]:
@@ -216,7 +292,7 @@ async def get_resource_by_id_async(
 
         # Make API request
         endpoint = f"/{resource_type}/{resource_id}"
-        response = await client.get(endpoint)
+        response = await client.get(endpoint, allow_stale=True)
 
         return {
             "status": "success",
@@ -234,6 +310,54 @@ async def get_resource_by_id_async(
         }
 
 
+async def get_resources_by_ids_async(
+    resource_type: str, ids: List[str]
+) -> Dict[str, Any]:
+    """
+    Get many resources by ID in one call
+
+    Args:
+        resource_type: Type of resource (e.g., 'users', 'orders', 'products')
+        ids: Resource IDs; duplicates are fetched once
+
+    Returns:
+        Dict containing a success or error result per unique ID
+    """
+    try:
+        unique_ids = dedupe_ids(ids)
+        if len(unique_ids) > config.api.batch_max_ids:
+            raise ValueError(
+                f"{len(unique_ids)} IDs requested, at most "
+                f"{config.api.batch_max_ids} are allowed per call"
+            )
+        print(f"🔍 Getting {len(unique_ids)} {resource_type}...")
+
+        results = await get_many(client, resource_type, unique_ids)
+        failed = sum(1 for r in results.values() if r["status"] == "error")
+
+        result = {
+            "status": "success",
+            "resource_type": resource_type,
+            "requested": len(ids),
+            "unique": len(unique_ids),
+            "succeeded": len(unique_ids) - failed,
+            "failed": failed,
+            "results": results,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if unique_ids and failed == len(unique_ids):
+            result["status"] = "error"
+            result["message"] = f"Failed to get any of the {failed} {resource_type}"
+        return result
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to get {resource_type} by IDs: {str(e)}",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
 async def create_resource_async(
     resource_type: str, data: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -342,6 +466,85 @@ async def delete_resource_async(resource_type: str, resource_id: str) -> Dict[st
         }
 
 
+async def bulk_write_async(
+    operation: str,
+    resource_type: str,
+    data: str,
+    id_field: str = "id",
+    on_error: str = "",
+) -> Dict[str, Any]:
+    """
+    Create, update or delete many resources
+
+    Args:
+        operation: "create", "update" or "delete"
+        resource_type: Type of resource (e.g., 'users', 'orders', 'products')
+        data: JSON array or JSON Lines of items; for delete, IDs or objects
+        id_field: Field holding the resource ID (update and delete)
+        on_error: "stop" or "continue" (default: BULK_STOP_ON_ERROR)
+
+    Returns:
+        Dict containing counts and a compact result per item
+    """
+    try:
+        records = parse_records(data)
+        if not records:
+            raise ValueError("No items given")
+        if len(records) > config.api.bulk_max_items:
+            raise ValueError(
+                f"{len(records)} items given, at most "
+                f"{config.api.bulk_max_items} are allowed per call"
+            )
+        on_error = (
+            on_error or ("stop" if config.api.bulk_stop_on_error else "continue")
+        ).lower()
+        if on_error not in ("stop", "continue"):
+            raise ValueError("on_error must be 'stop' or 'continue'")
+        print(f"📦 Bulk {operation} of {len(records)} {resource_type}...")
+
+        results = [
+            item_result
+            async for item_result in bulk_write(
+                client,
+                operation,
+                resource_type,
+                records,
+                id_field=id_field,
+                concurrency=config.api.bulk_chunk_size,
+                stop_on_error=on_error == "stop",
+            )
+        ]
+        failed = sum(1 for r in results if r["status"] == "error")
+        skipped = len(records) - len(results)
+
+        result = {
+            "status": "success",
+            "operation": operation,
+            "resource_type": resource_type,
+            "on_error": on_error,
+            "total": len(records),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "skipped": skipped,
+            "results": results,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if failed:
+            result["message"] = f"{failed} of {len(records)} {resource_type} failed"
+            if skipped:
+                result["message"] += f", {skipped} skipped"
+            if failed == len(results):
+                result["status"] = "error"
+        return result
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to bulk {operation} {resource_type}: {str(e)}",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
 # ===================================
 # 🔧 MCP TOOL REGISTRATION
 # ===================================
@@ -356,7 +559,7 @@ def register_tools(mcp):
     """
 
     @mcp.tool()
-    def get_api_status() -> str:
+    async def get_api_status() -> str:
         """
         Get {{cookiecutter.api_service_type}} API status and connectivity information.
 
@@ -369,11 +572,11 @@ def register_tools(mcp):
         Returns:
             JSON string with complete API status information
         """
-        result = run_async_tool(get_api_status_async)
+        result = await run_tool(get_api_status_async)
         return format_response(result)
 
     @mcp.tool()
-    def list_resources(
+    async def list_resources(
         resource_type: str = "items", limit: int = 10, offset: int = 0
     ) -> str:
         """
@@ -393,11 +596,50 @@ def register_tools(mcp):
         Returns:
             JSON string with list of resources and pagination information
         """
-        result = run_async_tool(list_resources_async, resource_type, limit, offset)
+        result = await run_tool(list_resources_async, resource_type, limit, offset)
         return format_response(result)
 
     @mcp.tool()
-    def get_resource_by_id(resource_type: str, resource_id: str) -> str:
+    async def list_all_resources(
+        resource_type: str = "items",
+        max_items: int = 1000,
+        max_bytes: int = 1_000_000,
+        strategy: str = "",
+        page_size: int = 0,
+        continuation: str = "",
+    ) -> str:
+        """
+        List a whole collection of the {{cookiecutter.api_service_type}} API in one call.
+
+        Pages are fetched inside the server until the collection ends or a
+        cap is reached. If it stops early, pass the returned
+        pagination.continuation back to read the next part.
+
+        Args:
+            resource_type: Type of resource to list (default: "items")
+            max_items: Maximum number of items to return (default: 1000)
+            max_bytes: Maximum size of the returned items in bytes (default: 1000000)
+            strategy: Pagination style of the API: "offset", "cursor" or "link"
+                (default: server setting)
+            page_size: Items per upstream page (default: server setting)
+            continuation: Token from a previous call to resume from (default: "")
+
+        Returns:
+            JSON string with the items, pages fetched and continuation token
+        """
+        result = await run_tool(
+            list_all_resources_async,
+            resource_type,
+            max_items,
+            max_bytes,
+            strategy,
+            page_size,
+            continuation,
+        )
+        return format_response(result)
+
+    @mcp.tool()
+    async def get_resource_by_id(resource_type: str, resource_id: str) -> str:
         """
         Get detailed information about a specific resource by ID.
 
@@ -415,11 +657,36 @@ def register_tools(mcp):
             }
             return format_response(error_result)
 
-        result = run_async_tool(get_resource_by_id_async, resource_type, resource_id)
+        result = await run_tool(get_resource_by_id_async, resource_type, resource_id)
+        return format_response(result)
+
+    @mcp.tool()
+    async def get_resources_by_ids(resource_type: str, ids: List[str]) -> str:
+        """
+        Get many resources by ID in one call.
+
+        Duplicate IDs are fetched once. Use this instead of calling
+        get_resource_by_id in a loop.
+
+        Args:
+            resource_type: Type of resource (e.g., "users", "orders", "products")
+            ids: Unique identifiers of the resources
+
+        Returns:
+            JSON string with a success or error result per ID
+        """
+        if not resource_type or not ids:
+            error_result = {
+                "status": "error",
+                "message": "Both resource_type and ids are required",
+            }
+            return format_response(error_result)
+
+        result = await run_tool(get_resources_by_ids_async, resource_type, ids)
         return format_response(result)
 
     @mcp.tool()
-    def create_resource(resource_type: str, data: str) -> str:
+    async def create_resource(resource_type: str, data: str) -> str:
         """
         Create a new resource in the {{cookiecutter.api_service_type}} API.
 
@@ -454,11 +721,11 @@ def register_tools(mcp):
             }
             return format_response(error_result)
 
-        result = run_async_tool(create_resource_async, resource_type, parsed_data)
+        result = await run_tool(create_resource_async, resource_type, parsed_data)
         return format_response(result)
 
     @mcp.tool()
-    def update_resource(resource_type: str, resource_id: str, data: str) -> str:
+    async def update_resource(resource_type: str, resource_id: str, data: str) -> str:
         """
         Update an existing resource in the {{cookiecutter.api_service_type}} API.
 
@@ -487,13 +754,13 @@ def register_tools(mcp):
             }
             return format_response(error_result)
 
-        result = run_async_tool(
+        result = await run_tool(
             update_resource_async, resource_type, resource_id, parsed_data
         )
         return format_response(result)
 
     @mcp.tool()
-    def delete_resource(resource_type: str, resource_id: str) -> str:
+    async def delete_resource(resource_type: str, resource_id: str) -> str:
         """
         Delete a resource from the {{cookiecutter.api_service_type}} API.
 
@@ -511,7 +778,75 @@ def register_tools(mcp):
             }
             return format_response(error_result)
 
-        result = run_async_tool(delete_resource_async, resource_type, resource_id)
+        result = await run_tool(delete_resource_async, resource_type, resource_id)
+        return format_response(result)
+
+    @mcp.tool()
+    async def bulk_create_resources(
+        resource_type: str, data: str, on_error: str = ""
+    ) -> str:
+        """
+        Create many resources in the {{cookiecutter.api_service_type}} API in one call.
+
+        Several items are sent at a time. Use this instead of calling
+        create_resource in a loop.
+
+        Args:
+            resource_type: Type of resource to create (e.g., "users", "products")
+            data: JSON array of objects, or one JSON object per line (JSON Lines)
+            on_error: "stop" to stop sending items after a failure or "continue"
+                to try every item (default: server setting)
+
+        Returns:
+            JSON string with counts and the status and ID of every item
+        """
+        result = await run_tool(
+            bulk_write_async, "create", resource_type, data, "id", on_error
+        )
+        return format_response(result)
+
+    @mcp.tool()
+    async def bulk_update_resources(
+        resource_type: str, data: str, id_field: str = "id", on_error: str = ""
+    ) -> str:
+        """
+        Update many resources in the {{cookiecutter.api_service_type}} API in one call.
+
+        Args:
+            resource_type: Type of resource to update (e.g., "users", "products")
+            data: JSON array or JSON Lines of objects, each with its ID in id_field
+            id_field: Field holding the resource ID (default: "id")
+            on_error: "stop" to stop sending items after a failure or "continue"
+                to try every item (default: server setting)
+
+        Returns:
+            JSON string with counts and the status of every item
+        """
+        result = await run_tool(
+            bulk_write_async, "update", resource_type, data, id_field, on_error
+        )
+        return format_response(result)
+
+    @mcp.tool()
+    async def bulk_delete_resources(
+        resource_type: str, data: str, id_field: str = "id", on_error: str = ""
+    ) -> str:
+        """
+        Delete many resources from the {{cookiecutter.api_service_type}} API in one call.
+
+        Args:
+            resource_type: Type of resource to delete (e.g., "users", "products")
+            data: JSON array or JSON Lines of IDs, or of objects with id_field
+            id_field: Field holding the resource ID in objects (default: "id")
+            on_error: "stop" to stop sending items after a failure or "continue"
+                to try every item (default: server setting)
+
+        Returns:
+            JSON string with counts and the status of every item
+        """
+        result = await run_tool(
+            bulk_write_async, "delete", resource_type, data, id_field, on_error
+        )
         return format_response(result)
 
-    print(f"🔧 Registered 6 {{cookiecutter.project_name}} tools")
+    print(f"🔧 Registered 11 {{cookiecutter.project_name}} tools")